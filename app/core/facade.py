@@ -1,19 +1,52 @@
+import asyncio
+import contextvars
+from concurrent.futures import Executor
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Protocol
+from enum import Enum
+from itertools import islice
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Protocol,
+    Sequence,
+    TypeVar,
+)
 
 from app.core.api_key.interactor import APIKeyInteractor, IAPIKeysRepository
+from app.core.money import (
+    MAX_SATOSHIS,
+    SATOSHIS_PER_BTC,
+    InvalidAmountError,
+    apply_basis_points,
+    satoshis_to_btc,
+)
 from app.core.transactions.interactor import (
+    Direction,
     ITransactionsRepository,
     Transaction,
     TransactionsInteractor,
+    TransactionsPage,
+    TransactionsStatistics,
 )
 from app.core.users.interactor import IUsersRepository, User, UsersInteractor
 from app.core.wallets.interactor import IWalletsRepository, Wallet, WalletsInteractor
 
 MAX_NUM_OF_WALLET: int = 3
 ADMIN_API_KEY: str = "admin_api_key"
-WALLET_STARTING_BALANCE: float = 1
+WALLET_STARTING_BALANCE: int = SATOSHIS_PER_BTC
 EXTERNAL_TRANSACTION_ID: int = -10
+DEFAULT_PAGE_SIZE: int = 100
+MAX_PAGE_SIZE: int = 1000
+STREAM_BATCH_SIZE: int = 1000
+MAX_TRANSFERS_PER_BATCH: int = 1000
+MAX_ADDRESSES_PER_LOOKUP: int = 100
+
+T = TypeVar("T")
 
 
 class IHasher(Protocol):
@@ -24,14 +57,35 @@ class IHasher(Protocol):
         return self.use_my_hash(args)
 
 
+class ExchangeRateUnavailableError(Exception):
+    pass
+
+
+class BalanceChangedError(Exception):
+    pass
+
+
 class ICurrencyConverter(Protocol):
-    def convert_to_usd(self, amount_in_btc: float) -> float:
+    def convert_to_usd(self, amount_in_satoshis: int) -> float:
+        pass
+
+    def convert_all_to_usd(self, amounts_in_satoshis: Sequence[int]) -> List[float]:
+        pass
+
+    def convert_to_satoshis(self, amount_in_usd: float) -> int:
         pass
 
-    def convert_to_btc(self, amount_in_usd: float) -> float:
+
+class IUnitOfWork(Protocol):
+    def run(self, operation: Callable[[], T]) -> T:
         pass
 
 
+class NoUnitOfWork:
+    def run(self, operation: Callable[[], T]) -> T:
+        return operation()
+
+
 @dataclass
 class UserResponse:
     status: int
@@ -43,6 +97,13 @@ class WalletResponse:
     status: int
     wallet_info: Dict[str, Any] = field(default_factory=lambda: {})
     transactions: List[Dict[str, Any]] = field(default_factory=lambda: [])
+    next_cursor: Optional[int] = None
+
+
+@dataclass
+class WalletsResponse:
+    status: int
+    wallets: List[Dict[str, Any]] = field(default_factory=lambda: [])
 
 
 @dataclass
@@ -50,25 +111,62 @@ class TransactionResponse:
     status: int
 
 
+@dataclass
+class TransactionsStreamResponse:
+    status: int
+    transactions: Iterator[Dict[str, Any]] = field(default_factory=lambda: iter([]))
+
+
+async def _no_batches() -> AsyncIterator[List[Dict[str, Any]]]:
+    batches: List[List[Dict[str, Any]]] = []
+    for batch in batches:
+        yield batch
+
+
+@dataclass
+class AsyncTransactionsStreamResponse:
+    status: int
+    batches: AsyncIterator[List[Dict[str, Any]]] = field(default_factory=_no_batches)
+
+
 @dataclass
 class StatisticsResponse:
     status: int
+    platform_profit_in_satoshis: int = 0
     platform_profit_in_btc: float = 0
     platform_profit_in_usd: float = 0
     total_number_of_transactions: int = 0
 
 
-class IFeeRateStrategy(Protocol):
-    def get_fee_rate_for_different_owners(self) -> float:
+class BatchMode(str, Enum):
+    ALL_OR_NOTHING = "all_or_nothing"
+    BEST_EFFORT = "best_effort"
+
+
+@dataclass(frozen=True)
+class Transfer:
+    from_address: str
+    to_address: str
+    amount_in_satoshis: int
+
+
+@dataclass
+class TransfersBatchResponse:
+    status: int
+    statuses: List[int] = field(default_factory=lambda: [])
+
+
+class IFeeRateStrategy(Protocol):  # rates are in basis points
+    def get_fee_rate_for_different_owners(self) -> int:
         pass
 
-    def get_fee_rate_for_same_owner(self) -> float:
+    def get_fee_rate_for_same_owner(self) -> int:
         pass
 
-    def get_fee_rate_for_deposit(self) -> float:
+    def get_fee_rate_for_deposit(self) -> int:
         pass
 
-    def get_fee_rate_for_withdraw(self) -> float:
+    def get_fee_rate_for_withdraw(self) -> int:
         pass
 
 
@@ -91,6 +189,7 @@ class BitcoinWalletCore:
     _currency_converter: ICurrencyConverter
     _fee_strategy: IFeeRateStrategy
     _unique_value_generator: IUniqueValueGenerators
+    _unit_of_work: IUnitOfWork = field(default_factory=NoUnitOfWork)
 
     @classmethod
     def create(
@@ -103,6 +202,7 @@ class BitcoinWalletCore:
         currency_converter: ICurrencyConverter,
         fee_strategy: IFeeRateStrategy,
         unique_value_generator: IUniqueValueGenerators,
+        unit_of_work: Optional[IUnitOfWork] = None,
     ) -> "BitcoinWalletCore":
         return cls(
             _users_interactor=UsersInteractor(_users_repository=users_repository),
@@ -119,6 +219,7 @@ class BitcoinWalletCore:
             _currency_converter=currency_converter,
             _fee_strategy=fee_strategy,
             _unique_value_generator=unique_value_generator,
+            _unit_of_work=unit_of_work or NoUnitOfWork(),
         )
 
     # USER RESPONSE
@@ -131,8 +232,17 @@ class BitcoinWalletCore:
 
     def register_user(self, username: str, password: str) -> UserResponse:
         api_key: str = self._unique_value_generator.generate_api_key()
+        hashed_password: str = self._hash(password)
+        return self._unit_of_work.run(
+            lambda: self._register_user(username, hashed_password, api_key)
+        )
+
+    def _register_user(
+        self, username: str, hashed_password: str, api_key: str
+    ) -> UserResponse:
+        # the next user id is read and taken in the same unit of work
         user: Optional[User] = self._users_interactor.register_user(
-            username=username, password=self._hash(password)
+            username=username, password=hashed_password
         )
         if user is None:
             return UserResponse(status=400)
@@ -158,23 +268,29 @@ class BitcoinWalletCore:
         if user_id == -1:
             return WalletResponse(status=403)
 
+        balance_in_usd: float = self._currency_converter.convert_to_usd(
+            amount_in_satoshis=WALLET_STARTING_BALANCE
+        )
+        response: WalletResponse = self._unit_of_work.run(
+            lambda: self._create_wallet(user_id, address)
+        )
+        if response.status == 201:
+            response.wallet_info["balance_in_usd"] = balance_in_usd
+        return response
+
+    def _create_wallet(self, user_id: int, address: str) -> WalletResponse:
         if self._check_if_user_has_max_num_of_wallets(user_id=user_id):
             return WalletResponse(status=400)
 
         wallet: Wallet = self._wallets_interactor.create_wallet(
             user_id=user_id,
             address=address,
-            balance_in_btc=WALLET_STARTING_BALANCE,
-        )
-
-        to_dict: Dict[str, Any] = wallet.to_dict()
-        to_dict["balance_in_usd"] = self._currency_converter.convert_to_usd(
-            amount_in_btc=wallet.get_balance_in_btc()
+            balance_in_satoshis=WALLET_STARTING_BALANCE,
         )
 
         return WalletResponse(
             status=201,
-            wallet_info=to_dict,
+            wallet_info=wallet.to_dict(),
         )
 
     def get_wallet(self, api_key: str, address: str) -> WalletResponse:
@@ -191,23 +307,67 @@ class BitcoinWalletCore:
 
         to_dict: Dict[str, Any] = wallet.to_dict()
         to_dict["balance_in_usd"] = self._currency_converter.convert_to_usd(
-            amount_in_btc=wallet.get_balance_in_btc()
+            amount_in_satoshis=wallet.get_balance_in_satoshis()
         )
 
         return WalletResponse(status=200, wallet_info=to_dict)
 
-    def get_transactions_of_wallet(self, api_key: str, address: str) -> WalletResponse:
+    def get_wallets_of_user(self, api_key: str) -> WalletsResponse:
         user_id: int = self.get_user_id_by_api_key(api_key)
         if user_id == -1:
-            return WalletResponse(status=403)  # TODO non-existent api_Key
+            return WalletsResponse(status=403)
+
+        return self._wallets_response(
+            self._wallets_interactor.get_all_wallets_of_user(user_id)
+        )
+
+    def get_wallets(self, api_key: str, addresses: Sequence[str]) -> WalletsResponse:
+        unique: List[str] = list(dict.fromkeys(addresses))
+        if not unique or len(unique) > MAX_ADDRESSES_PER_LOOKUP:
+            return WalletsResponse(status=400)
+        user_id: int = self.get_user_id_by_api_key(api_key)
+        if user_id == -1:
+            return WalletsResponse(status=403)
+
+        wallets: Dict[str, Wallet] = self._wallets_interactor.get_wallets(unique)
+        if len(wallets) != len(unique):
+            return WalletsResponse(status=404)
+        elif any(wallet.get_owner_id() != user_id for wallet in wallets.values()):
+            return WalletsResponse(status=403)
+
+        return self._wallets_response([wallets[address] for address in unique])
+
+    def _wallets_response(self, wallets: List[Wallet]) -> WalletsResponse:
+        if not wallets:  # nothing to convert, so no exchange rate is needed
+            return WalletsResponse(status=200)
+        balances_in_usd: List[float] = self._currency_converter.convert_all_to_usd(
+            [wallet.get_balance_in_satoshis() for wallet in wallets]
+        )
+        wallets_info: List[Dict[str, Any]] = []
+        for wallet, balance_in_usd in zip(wallets, balances_in_usd):
+            wallet_info: Dict[str, Any] = wallet.to_dict()
+            wallet_info["balance_in_usd"] = balance_in_usd
+            wallets_info.append(wallet_info)
+        return WalletsResponse(status=200, wallets=wallets_info)
+
+    def _check_wallet_access(self, api_key: str, address: str) -> int:
+        user_id: int = self.get_user_id_by_api_key(api_key)
+        if user_id == -1:
+            return 403  # TODO non-existent api_Key
 
         wallet: Optional[Wallet] = self._wallets_interactor.get_wallet(address=address)
         if wallet is None:
-            return WalletResponse(status=404)  # TODO RIGHT API KEY, WRONG ADDRESS
+            return 404  # TODO RIGHT API KEY, WRONG ADDRESS
         elif (
             wallet.get_owner_id() != user_id
         ):  # TODO Existing api key, existing wallet but api key is of other user
-            return WalletResponse(status=403)
+            return 403
+        return 200
+
+    def get_transactions_of_wallet(self, api_key: str, address: str) -> WalletResponse:
+        access_status: int = self._check_wallet_access(api_key, address)
+        if access_status != 200:
+            return WalletResponse(status=access_status)
 
         transactions: List[
             Transaction
@@ -221,26 +381,91 @@ class BitcoinWalletCore:
             transactions=transactions_to_send_back,
         )
 
+    def get_transactions_page_of_wallet(
+        self,
+        api_key: str,
+        address: str,
+        limit: int = DEFAULT_PAGE_SIZE,
+        after_id: Optional[int] = None,
+        direction: Direction = Direction.ASCENDING,
+    ) -> WalletResponse:
+        access_status: int = self._check_wallet_access(api_key, address)
+        if access_status != 200:
+            return WalletResponse(status=access_status)
+
+        page: TransactionsPage = (
+            self._transactions_interactor.get_transactions_page_of_wallet(
+                address=address,
+                limit=min(max(limit, 1), MAX_PAGE_SIZE),
+                after_id=after_id,
+                direction=direction,
+            )
+        )
+
+        return WalletResponse(
+            status=200,
+            transactions=[transaction.to_dict() for transaction in page.transactions],
+            next_cursor=page.next_cursor,
+        )
+
     # Transaction RESPONSE
-    def _get_fee(self, sender_id: int, receiver_id: int, amount: float) -> float:
+    def stream_transactions(self, api_key: str) -> TransactionsStreamResponse:
+        transactions: Iterator[Transaction]
+        if self.is_admin(api_key):  # the whole ledger is only exported for admins
+            transactions = self._transactions_interactor.iterate_all_transactions(
+                STREAM_BATCH_SIZE
+            )
+        else:
+            user_id: int = self.get_user_id_by_api_key(api_key)
+            if user_id == -1:
+                return TransactionsStreamResponse(status=403)
+            addresses: List[str] = [
+                wallet.get_address()
+                for wallet in self._wallets_interactor.get_all_wallets_of_user(user_id)
+            ]
+            transactions = (
+                self._transactions_interactor.iterate_transactions_of_wallets(
+                    addresses, STREAM_BATCH_SIZE
+                )
+            )
+        return TransactionsStreamResponse(
+            status=200,
+            transactions=(transaction.to_dict() for transaction in transactions),
+        )
+
+    def _get_fee_rate(self, sender_id: int, receiver_id: int) -> int:
         if sender_id == receiver_id:
-            return amount * self._fee_strategy.get_fee_rate_for_same_owner()
+            return self._fee_strategy.get_fee_rate_for_same_owner()
         elif sender_id == EXTERNAL_TRANSACTION_ID:
-            return amount * self._fee_strategy.get_fee_rate_for_deposit()
+            return self._fee_strategy.get_fee_rate_for_deposit()
         elif receiver_id == EXTERNAL_TRANSACTION_ID:
-            return amount * self._fee_strategy.get_fee_rate_for_withdraw()
-        return amount * self._fee_strategy.get_fee_rate_for_different_owners()
+            return self._fee_strategy.get_fee_rate_for_withdraw()
+        return self._fee_strategy.get_fee_rate_for_different_owners()
+
+    def _get_fee(self, sender_id: int, receiver_id: int, amount: int) -> int:
+        return apply_basis_points(amount, self._get_fee_rate(sender_id, receiver_id))
 
     def deposit(
         self, api_key: str, address: str, amount_in_usd: float
+    ) -> TransactionResponse:
+        try:
+            amount_in_satoshis: int = self._currency_converter.convert_to_satoshis(
+                amount_in_usd=amount_in_usd
+            )
+        except InvalidAmountError:
+            return TransactionResponse(status=400)
+        return self._unit_of_work.run(
+            lambda: self._deposit(api_key, address, amount_in_satoshis)
+        )
+
+    def _deposit(
+        self, api_key: str, address: str, amount_in_satoshis: int
     ) -> TransactionResponse:
         user_id: int = self.get_user_id_by_api_key(api_key)
         if user_id == -1:
             return TransactionResponse(status=403)
-
-        amount_in_btc: float = self._currency_converter.convert_to_btc(
-            amount_in_usd=amount_in_usd
-        )
+        elif not 0 < amount_in_satoshis <= MAX_SATOSHIS:
+            return TransactionResponse(status=400)
 
         wallet: Optional[Wallet] = self._wallets_interactor.get_wallet(address=address)
         if wallet is None:
@@ -248,55 +473,91 @@ class BitcoinWalletCore:
         elif wallet.get_owner_id() != user_id:
             return TransactionResponse(status=403)
 
-        fee: float = self._get_fee(
+        fee: int = self._get_fee(
             sender_id=EXTERNAL_TRANSACTION_ID,
             receiver_id=wallet.get_owner_id(),
-            amount=amount_in_btc,
+            amount=amount_in_satoshis,
         )
         self._transactions_interactor.make_transaction(
-            from_address="DEPOSIT", to_address=address, amount=amount_in_btc, fee=fee
+            from_address="DEPOSIT",
+            to_address=address,
+            amount=amount_in_satoshis,
+            fee=fee,
         )
 
-        self._wallets_interactor.deposit(address, amount_in_btc - fee)
+        self._wallets_interactor.deposit(address, amount_in_satoshis - fee)
         return TransactionResponse(status=201)
 
     def withdraw(
         self, api_key: str, address: str, amount_in_usd: float
+    ) -> TransactionResponse:
+        try:
+            amount_in_satoshis: int = self._currency_converter.convert_to_satoshis(
+                amount_in_usd=amount_in_usd
+            )
+        except InvalidAmountError:
+            return TransactionResponse(status=400)
+        return self._unit_of_work.run(
+            lambda: self._withdraw(api_key, address, amount_in_satoshis)
+        )
+
+    def _withdraw(
+        self, api_key: str, address: str, amount_in_satoshis: int
     ) -> TransactionResponse:
         user_id: int = self.get_user_id_by_api_key(api_key)
         if user_id == -1:
             return TransactionResponse(status=403)
+        elif not 0 < amount_in_satoshis <= MAX_SATOSHIS:
+            return TransactionResponse(status=400)
 
-        amount_in_btc: float = self._currency_converter.convert_to_btc(
-            amount_in_usd=amount_in_usd
-        )
         wallet: Optional[Wallet] = self._wallets_interactor.get_wallet(address=address)
         if wallet is None:
             return TransactionResponse(status=404)
         elif wallet.get_owner_id() != user_id:
             return TransactionResponse(status=403)
 
-        fee: float = self._get_fee(
+        fee: int = self._get_fee(
             sender_id=wallet.get_owner_id(),
             receiver_id=EXTERNAL_TRANSACTION_ID,
-            amount=amount_in_btc,
+            amount=amount_in_satoshis,
         )
 
-        if wallet.get_balance_in_btc() < amount_in_btc + fee:
+        if not self._wallets_interactor.withdraw(address, amount_in_satoshis + fee):
             return TransactionResponse(status=400)
 
         self._transactions_interactor.make_transaction(
-            from_address=address, to_address="WITHDRAW", amount=amount_in_btc, fee=fee
+            from_address=address,
+            to_address="WITHDRAW",
+            amount=amount_in_satoshis,
+            fee=fee,
         )
-        self._wallets_interactor.withdraw(address, amount_in_btc + fee)
         return TransactionResponse(status=201)
 
     def make_transaction(
-        self, api_key: str, from_address: str, to_address: str, amount: float
+        self,
+        api_key: str,
+        from_address: str,
+        to_address: str,
+        amount_in_satoshis: int,
+    ) -> TransactionResponse:
+        return self._unit_of_work.run(
+            lambda: self._make_transaction(
+                api_key, from_address, to_address, amount_in_satoshis
+            )
+        )
+
+    def _make_transaction(
+        self,
+        api_key: str,
+        from_address: str,
+        to_address: str,
+        amount_in_satoshis: int,
     ) -> TransactionResponse:
         user_id: int = self.get_user_id_by_api_key(api_key)
         if user_id == -1:
             return TransactionResponse(status=403)  # TODO
+        elif not 0 < amount_in_satoshis <= MAX_SATOSHIS:
+            return TransactionResponse(status=400)
         sender: Optional[Wallet] = self._wallets_interactor.get_wallet(
             address=from_address
         )
@@ -312,44 +573,249 @@ class BitcoinWalletCore:
         elif sender.get_address() == receiver.get_address():
             return TransactionResponse(status=403)
 
-        fee: float = self._get_fee(
+        fee: int = self._get_fee(
             sender_id=sender.get_owner_id(),
             receiver_id=receiver.get_owner_id(),
-            amount=amount,
+            amount=amount_in_satoshis,
         )
 
-        if sender.get_balance_in_btc() < amount + fee:
+        if not self._wallets_interactor.withdraw(
+            address=sender.get_address(), amount=amount_in_satoshis + fee
+        ):
             return TransactionResponse(status=400)
 
         self._transactions_interactor.make_transaction(
-            from_address, to_address, amount, fee
+            from_address, to_address, amount_in_satoshis, fee
         )
-        self._wallets_interactor.withdraw(
-            address=sender.get_address(), amount=amount + fee
+        self._wallets_interactor.deposit(
+            address=receiver.get_address(), amount=amount_in_satoshis
         )
-        self._wallets_interactor.deposit(address=receiver.get_address(), amount=amount)
 
         return TransactionResponse(status=201)
 
+    def make_transactions(
+        self,
+        api_key: str,
+        transfers: Sequence[Transfer],
+        mode: BatchMode = BatchMode.ALL_OR_NOTHING,
+    ) -> TransfersBatchResponse:
+        if not transfers or len(transfers) > MAX_TRANSFERS_PER_BATCH:
+            return TransfersBatchResponse(status=400)
+        return self._unit_of_work.run(
+            lambda: self._make_transactions(api_key, transfers, mode)
+        )
+
+    def _make_transactions(
+        self, api_key: str, transfers: Sequence[Transfer], mode: BatchMode
+    ) -> TransfersBatchResponse:
+        user_id: int = self.get_user_id_by_api_key(api_key)
+        if user_id == -1:
+            return TransfersBatchResponse(status=403)
+
+        wallets: Dict[str, Wallet] = self._wallets_interactor.get_wallets(
+            [
+                address
+                for transfer in transfers
+                for address in (transfer.from_address, transfer.to_address)
+            ]
+        )
+        balances: Dict[str, int] = {
+            address: wallet.get_balance_in_satoshis()
+            for address, wallet in wallets.items()
+        }
+        statuses: List[int] = []
+        fees: List[int] = []
+        for transfer in transfers:  # running totals: each item sees the ones before
+            status: int = self._check_transfer(user_id, transfer, wallets)
+            fee: int = 0
+            if status == 201:
+                fee = self._get_fee(
+                    sender_id=wallets[transfer.from_address].get_owner_id(),
+                    receiver_id=wallets[transfer.to_address].get_owner_id(),
+                    amount=transfer.amount_in_satoshis,
+                )
+                if balances[transfer.from_address] < transfer.amount_in_satoshis + fee:
+                    status = 400
+                else:
+                    balances[transfer.from_address] -= transfer.amount_in_satoshis + fee
+                    balances[transfer.to_address] += transfer.amount_in_satoshis
+            statuses.append(status)
+            fees.append(fee)
+
+        failed: bool = any(status != 201 for status in statuses)
+        if failed and mode == BatchMode.ALL_OR_NOTHING:
+            return TransfersBatchResponse(
+                status=409,
+                statuses=[424 if status == 201 else status for status in statuses],
+            )
+
+        self._apply_balances(wallets, balances)
+        for transfer, status, fee in zip(transfers, statuses, fees):
+            if status == 201:
+                self._transactions_interactor.make_transaction(
+                    transfer.from_address,
+                    transfer.to_address,
+                    transfer.amount_in_satoshis,
+                    fee,
+                )
+        return TransfersBatchResponse(status=207 if failed else 201, statuses=statuses)
+
+    @staticmethod
+    def _check_transfer(
+        user_id: int, transfer: Transfer, wallets: Dict[str, Wallet]
+    ) -> int:
+        sender: Optional[Wallet] = wallets.get(transfer.from_address)
+        receiver: Optional[Wallet] = wallets.get(transfer.to_address)
+        if not 0 < transfer.amount_in_satoshis <= MAX_SATOSHIS:
+            return 400
+        elif sender is None:
+            return 404
+        elif sender.get_owner_id() != user_id:
+            return 403
+        elif receiver is None:
+            return 404
+        elif sender.get_address() == receiver.get_address():
+            return 403
+        return 201
+
+    def _apply_balances(
+        self, wallets: Dict[str, Wallet], balances: Dict[str, int]
+    ) -> None:
+        # one update per wallet; withdrawals go first so a conflict aborts early
+        deltas: Dict[str, int] = {
+            address: balance - wallets[address].get_balance_in_satoshis()
+            for address, balance in balances.items()
+        }
+        for address, delta in deltas.items():
+            if delta < 0 and not self._wallets_interactor.withdraw(address, -delta):
+                raise BalanceChangedError(f"Balance of {address} changed mid-batch")
+        for address, delta in deltas.items():
+            if delta > 0:
+                self._wallets_interactor.deposit(address, delta)
+
     # STATISTICS RESPONSE
+    def is_admin(self, admin_api_key: str) -> bool:
+        return admin_api_key == ADMIN_API_KEY
+
     def get_statistics(self, admin_api_key: str) -> StatisticsResponse:
-        if admin_api_key != ADMIN_API_KEY:
+        if not self.is_admin(admin_api_key):
             return StatisticsResponse(status=403)
-        transactions: List[
-            Transaction
-        ] = self._transactions_interactor.get_all_transactions()
-
-        platform_profit: float = 0
-        total_number_of_transactions: int = 0
-        for transaction in transactions:
-            total_number_of_transactions += 1
-            platform_profit += transaction.get_fee()
+        statistics: TransactionsStatistics = (
+            self._transactions_interactor.get_statistics()
+        )
 
         return StatisticsResponse(
             status=200,
-            platform_profit_in_btc=platform_profit,
+            platform_profit_in_satoshis=statistics.total_fee,
+            platform_profit_in_btc=satoshis_to_btc(statistics.total_fee),
             platform_profit_in_usd=self._currency_converter.convert_to_usd(
-                amount_in_btc=platform_profit
+                amount_in_satoshis=statistics.total_fee
             ),
-            total_number_of_transactions=total_number_of_transactions,
+            total_number_of_transactions=statistics.number_of_transactions,
+        )
+
+
+@dataclass
+class AsyncBitcoinWalletCore:
+    # Every use case runs whole on the executor: the unit of work binds its
+    # database transaction to the thread that started it.
+    _core: BitcoinWalletCore
+    _executor: Executor
+
+    async def _run(self, operation: Callable[[], T]) -> T:
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        # request-scoped context variables follow the use case onto the worker
+        context: contextvars.Context = contextvars.copy_context()
+        return await loop.run_in_executor(self._executor, context.run, operation)
+
+    async def register_user(self, username: str, password: str) -> UserResponse:
+        return await self._run(lambda: self._core.register_user(username, password))
+
+    async def create_wallet(self, api_key: str) -> WalletResponse:
+        return await self._run(lambda: self._core.create_wallet(api_key))
+
+    async def get_wallet(self, api_key: str, address: str) -> WalletResponse:
+        return await self._run(lambda: self._core.get_wallet(api_key, address))
+
+    async def get_wallets_of_user(self, api_key: str) -> WalletsResponse:
+        return await self._run(lambda: self._core.get_wallets_of_user(api_key))
+
+    async def get_wallets(
+        self, api_key: str, addresses: Sequence[str]
+    ) -> WalletsResponse:
+        return await self._run(lambda: self._core.get_wallets(api_key, addresses))
+
+    async def get_transactions_page_of_wallet(
+        self,
+        api_key: str,
+        address: str,
+        limit: int = DEFAULT_PAGE_SIZE,
+        after_id: Optional[int] = None,
+        direction: Direction = Direction.ASCENDING,
+    ) -> WalletResponse:
+        return await self._run(
+            lambda: self._core.get_transactions_page_of_wallet(
+                api_key, address, limit, after_id, direction
+            )
+        )
+
+    async def stream_transactions(
+        self, api_key: str
+    ) -> AsyncTransactionsStreamResponse:
+        response: TransactionsStreamResponse = await self._run(
+            lambda: self._core.stream_transactions(api_key)
         )
+        return AsyncTransactionsStreamResponse(
+            status=response.status, batches=self._batches(response.transactions)
+        )
+
+    async def _batches(
+        self, transactions: Iterator[Dict[str, Any]]
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        while True:
+            batch: List[Dict[str, Any]] = await self._run(
+                lambda: list(islice(transactions, STREAM_BATCH_SIZE))
+            )
+            if not batch:
+                return
+            yield batch
+
+    async def deposit(
+        self, api_key: str, address: str, amount_in_usd: float
+    ) -> TransactionResponse:
+        return await self._run(
+            lambda: self._core.deposit(api_key, address, amount_in_usd)
+        )
+
+    async def withdraw(
+        self, api_key: str, address: str, amount_in_usd: float
+    ) -> TransactionResponse:
+        return await self._run(
+            lambda: self._core.withdraw(api_key, address, amount_in_usd)
+        )
+
+    async def make_transaction(
+        self,
+        api_key: str,
+        from_address: str,
+        to_address: str,
+        amount_in_satoshis: int,
+    ) -> TransactionResponse:
+        return await self._run(
+            lambda: self._core.make_transaction(
+                api_key, from_address, to_address, amount_in_satoshis
+            )
+        )
+
+    async def make_transactions(
+        self,
+        api_key: str,
+        transfers: Sequence[Transfer],
+        mode: BatchMode = BatchMode.ALL_OR_NOTHING,
+    ) -> TransfersBatchResponse:
+        return await self._run(
+            lambda: self._core.make_transactions(api_key, transfers, mode)
+        )
+
+    async def get_statistics(self, admin_api_key: str) -> StatisticsResponse:
+        return await self._run(lambda: self._core.get_statistics(admin_api_key))
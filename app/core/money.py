@@ -0,0 +1,27 @@
+import math
+
+SATOSHIS_PER_BTC: int = 100_000_000
+BASIS_POINTS_PER_UNIT: int = 10_000
+# no amount can exceed the 21 million BTC that will ever exist
+MAX_SATOSHIS: int = 21_000_000 * SATOSHIS_PER_BTC
+
+
+class InvalidAmountError(ValueError):
+    pass
+
+
+def btc_to_satoshis(amount_in_btc: float) -> int:
+    if not math.isfinite(amount_in_btc):
+        raise InvalidAmountError(f"Amount must be finite, got {amount_in_btc}")
+    amount_in_satoshis: int = round(amount_in_btc * SATOSHIS_PER_BTC)
+    if abs(amount_in_satoshis) > MAX_SATOSHIS:
+        raise InvalidAmountError(f"Amount exceeds {MAX_SATOSHIS} satoshis")
+    return amount_in_satoshis
+
+
+def satoshis_to_btc(amount_in_satoshis: int) -> float:
+    return amount_in_satoshis / SATOSHIS_PER_BTC
+
+
+def apply_basis_points(amount_in_satoshis: int, basis_points: int) -> int:
+    return amount_in_satoshis * basis_points // BASIS_POINTS_PER_UNIT
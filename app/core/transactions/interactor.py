@@ -1,13 +1,19 @@
-from dataclasses import dataclass
-from typing import Any, Dict, List, Protocol
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, Dict, Iterator, List, Optional, Protocol, Sequence
+
+from app.core.money import satoshis_to_btc
+
+# ids are SQLite INTEGER PRIMARY KEYs, so cursors fit in a signed 64-bit int
+MAX_TRANSACTION_ID: int = 2**63 - 1
 
 
 @dataclass
 class Transaction:
     from_address: str
     to_address: str
-    amount: float
-    fee: float
+    amount: int
+    fee: int
 
     def get_from_address(self) -> str:
         return self.from_address
@@ -15,10 +21,10 @@ class Transaction:
     def get_to_address(self) -> str:
         return self.to_address
 
-    def get_amount(self) -> float:
+    def get_amount(self) -> int:
         return self.amount
 
-    def get_fee(self) -> float:
+    def get_fee(self) -> int:
         return self.fee
 
     def __eq__(self, other: object) -> bool:
@@ -35,11 +41,30 @@ class Transaction:
         return {
             "from_address": self.from_address,
             "to_address": self.to_address,
-            "amount": self.amount,
-            "fee": self.fee,
+            "amount": satoshis_to_btc(self.amount),
+            "fee": satoshis_to_btc(self.fee),
+            "amount_in_satoshis": self.amount,
+            "fee_in_satoshis": self.fee,
         }
 
 
+class Direction(str, Enum):
+    ASCENDING = "asc"
+    DESCENDING = "desc"
+
+
+@dataclass
+class TransactionsPage:
+    transactions: List[Transaction] = field(default_factory=lambda: [])
+    next_cursor: Optional[int] = None
+
+
+@dataclass
+class TransactionsStatistics:
+    number_of_transactions: int = 0
+    total_fee: int = 0
+
+
 class ITransactionsRepository(Protocol):
     def add_transaction(self, transaction: Transaction) -> None:
         pass
@@ -47,16 +72,36 @@ class ITransactionsRepository(Protocol):
     def get_wallet_transactions(self, address: str) -> List[Transaction]:
         pass
 
+    def get_wallet_transactions_page(
+        self,
+        address: str,
+        limit: int,
+        after_id: Optional[int] = None,
+        direction: Direction = Direction.ASCENDING,
+    ) -> TransactionsPage:
+        pass
+
     def get_all_transactions(self) -> List[Transaction]:
         pass
 
+    def iterate_all_transactions(self, batch_size: int) -> Iterator[Transaction]:
+        pass
+
+    def iterate_wallets_transactions(
+        self, addresses: Sequence[str], batch_size: int
+    ) -> Iterator[Transaction]:
+        pass
+
+    def get_statistics(self) -> TransactionsStatistics:
+        pass
+
 
 @dataclass
 class TransactionsInteractor:
     _transactions_repository: ITransactionsRepository
 
     def make_transaction(
-        self, from_address: str, to_address: str, amount: float, fee: float
+        self, from_address: str, to_address: str, amount: int, fee: int
     ) -> None:
         transaction: Transaction = Transaction(
             from_address=from_address, to_address=to_address, amount=amount, fee=fee
@@ -66,5 +111,29 @@ class TransactionsInteractor:
     def get_transactions_of_wallet(self, address: str) -> List[Transaction]:
         return self._transactions_repository.get_wallet_transactions(address=address)
 
+    def get_transactions_page_of_wallet(
+        self,
+        address: str,
+        limit: int,
+        after_id: Optional[int] = None,
+        direction: Direction = Direction.ASCENDING,
+    ) -> TransactionsPage:
+        return self._transactions_repository.get_wallet_transactions_page(
+            address=address, limit=limit, after_id=after_id, direction=direction
+        )
+
     def get_all_transactions(self) -> List[Transaction]:
         return self._transactions_repository.get_all_transactions()
+
+    def iterate_all_transactions(self, batch_size: int) -> Iterator[Transaction]:
+        return self._transactions_repository.iterate_all_transactions(batch_size)
+
+    def iterate_transactions_of_wallets(
+        self, addresses: Sequence[str], batch_size: int
+    ) -> Iterator[Transaction]:
+        return self._transactions_repository.iterate_wallets_transactions(
+            addresses=addresses, batch_size=batch_size
+        )
+
+    def get_statistics(self) -> TransactionsStatistics:
+        return self._transactions_repository.get_statistics()
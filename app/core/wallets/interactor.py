@@ -1,24 +1,29 @@
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Protocol
+from typing import Dict, List, Optional, Protocol, Sequence
+
+from app.core.money import satoshis_to_btc
 
 
 @dataclass
 class Wallet:
     _user_id: int
     _address: str
-    _balance_btc: float
+    _balance_satoshis: int
 
-    def deposit(self, amount: float) -> None:
-        self._balance_btc += amount
+    def deposit(self, amount: int) -> None:
+        self._balance_satoshis += amount
 
-    def withdraw(self, amount: float) -> None:
-        self._balance_btc -= amount
+    def withdraw(self, amount: int) -> None:
+        self._balance_satoshis -= amount
 
     def get_address(self) -> str:
         return self._address
 
+    def get_balance_in_satoshis(self) -> int:
+        return self._balance_satoshis
+
     def get_balance_in_btc(self) -> float:
-        return self._balance_btc
+        return satoshis_to_btc(self._balance_satoshis)
 
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, Wallet):
@@ -26,11 +31,15 @@ class Wallet:
         return (
             self.get_owner_id() == other.get_owner_id()
             and self.get_address() == other.get_address()
-            and self.get_balance_in_btc() == other.get_balance_in_btc()
+            and self.get_balance_in_satoshis() == other.get_balance_in_satoshis()
         )
 
-    def to_dict(self) -> Dict[str, str | float]:
-        return {"address": self._address, "balance_in_btc": self._balance_btc}
+    def to_dict(self) -> Dict[str, str | int | float]:
+        return {
+            "address": self._address,
+            "balance_in_satoshis": self._balance_satoshis,
+            "balance_in_btc": self.get_balance_in_btc(),
+        }
 
     def get_owner_id(self) -> int:
         return self._user_id
@@ -43,10 +52,13 @@ class IWalletsRepository(Protocol):
     def get_wallet(self, address: str) -> Optional[Wallet]:
         pass
 
-    def deposit(self, address: str, amount: float) -> bool:
+    def get_wallets(self, addresses: Sequence[str]) -> List[Wallet]:
         pass
 
-    def withdraw(self, address: str, amount: float) -> bool:
+    def deposit(self, address: str, amount: int) -> bool:
+        pass
+
+    def withdraw(self, address: str, amount: int) -> bool:
         pass
 
     def get_all_wallets_of_user(self, user_id: int) -> List[Wallet]:
@@ -61,23 +73,27 @@ class WalletsInteractor:
     _wallets_repository: IWalletsRepository
 
     def create_wallet(
-        self, user_id: int, address: str, balance_in_btc: float
+        self, user_id: int, address: str, balance_in_satoshis: int
     ) -> Wallet:
         wallet: Wallet = Wallet(
-            _user_id=user_id, _address=address, _balance_btc=balance_in_btc
+            _user_id=user_id, _address=address, _balance_satoshis=balance_in_satoshis
         )
         self._wallets_repository.add_wallet(wallet=wallet)
         return wallet
 
-    def deposit(self, address: str, amount: float) -> None:
-        self._wallets_repository.deposit(address=address, amount=amount)
+    def deposit(self, address: str, amount: int) -> bool:
+        return self._wallets_repository.deposit(address=address, amount=amount)
 
-    def withdraw(self, address: str, amount: float) -> None:
-        self._wallets_repository.withdraw(address=address, amount=amount)
+    def withdraw(self, address: str, amount: int) -> bool:
+        return self._wallets_repository.withdraw(address=address, amount=amount)
 
     def get_wallet(self, address: str) -> Optional[Wallet]:
         return self._wallets_repository.get_wallet(address=address)
 
+    def get_wallets(self, addresses: Sequence[str]) -> Dict[str, Wallet]:
+        wallets: List[Wallet] = self._wallets_repository.get_wallets(addresses)
+        return {wallet.get_address(): wallet for wallet in wallets}
+
     def get_all_wallets_of_user(self, user_id: int) -> List[Wallet]:
         return self._wallets_repository.get_all_wallets_of_user(user_id)
 
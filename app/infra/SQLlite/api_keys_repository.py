@@ -1,10 +1,10 @@
-import sqlite3 as database
+from app.infra.SQLlite.connection_pool import SQLiteConnectionPool
 
 
 class SQLAPIKeysRepository:
-    def __init__(self) -> None:
-        self._database_name = "bitcoin.db"
-        with database.connect(self._database_name) as conn:
+    def __init__(self, pool: SQLiteConnectionPool) -> None:
+        self._pool = pool
+        with self._pool.connection() as conn:
             c = conn.cursor()
 
             c.execute(
@@ -18,7 +18,7 @@ class SQLAPIKeysRepository:
             )
 
     def add_api_key_id_pair(self, api_key: str, user_id: int) -> None:
-        with database.connect(self._database_name) as conn:
+        with self._pool.connection() as conn:
             c = conn.cursor()
             c.execute(
                 "INSERT INTO api_keys (user_id, api_key) VALUES (?, ?)",
@@ -26,7 +26,7 @@ class SQLAPIKeysRepository:
             )
 
     def get_user_id_by_api_key(self, api_key: str) -> int:
-        with database.connect(self._database_name) as conn:
+        with self._pool.connection() as conn:
             c = conn.cursor()
             c.execute("SELECT user_id FROM api_keys WHERE api_key=?", (api_key,))
             result = c.fetchone()
@@ -0,0 +1,176 @@
+import sqlite3 as database
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass
+from queue import Empty, LifoQueue
+from typing import Callable, Iterator, List, Optional
+from uuid import uuid4
+
+from app.infra.SQLlite.pragmas import DURABLE, PragmaProfile
+from app.infra.SQLlite.query_tracking import TrackingConnection, record_connection
+
+MEMORY_DATABASE: str = ":memory:"
+
+TransactionCallback = Callable[[bool], None]
+
+
+class ConnectionPoolTimeoutError(Exception):
+    pass
+
+
+@dataclass
+class PoolStatistics:
+    pool_size: int
+    connections_created: int
+    connections_in_use: int
+    connections_idle: int
+    checkouts: int
+    checkout_waits: int
+    checkout_timeouts: int
+
+
+class SQLiteConnectionPool:
+    def __init__(
+        self,
+        database_name: str = "bitcoin.db",
+        pool_size: int = 5,
+        checkout_timeout: float = 5.0,
+        pragma_profile: PragmaProfile = DURABLE,
+        slow_query_threshold: Optional[float] = None,
+    ) -> None:
+        if pool_size < 1:
+            raise ValueError("pool_size must be at least 1")
+        if database_name == MEMORY_DATABASE:
+            # a private in-memory database that every connection of this pool shares
+            database_name = f"file:/bitcoin-{uuid4().hex}?vfs=memdb"
+        self._database_name = database_name
+        self._pool_size = pool_size
+        self._checkout_timeout = checkout_timeout
+        self._pragma_profile = pragma_profile
+        self._slow_query_threshold = slow_query_threshold
+
+        self._idle: LifoQueue[database.Connection] = LifoQueue()
+        self._all_connections: List[database.Connection] = []
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+        self._checkouts = 0
+        self._checkout_waits = 0
+        self._checkout_timeouts = 0
+
+    # CHECKOUT
+
+    def acquire(self) -> database.Connection:
+        try:
+            conn: database.Connection = self._idle.get_nowait()
+        except Empty:
+            conn = self._create_or_wait()
+
+        with self._lock:
+            self._checkouts += 1
+        record_connection()
+        return conn
+
+    def release(self, conn: database.Connection) -> None:
+        if conn.in_transaction:
+            conn.rollback()
+        self._idle.put(conn)
+
+    @contextmanager
+    def connection(self) -> Iterator[database.Connection]:
+        held: Optional[database.Connection] = getattr(self._local, "connection", None)
+        if held is not None:  # nested call on this thread joins the open transaction
+            yield held
+            return
+
+        conn: database.Connection = self.acquire()
+        self._local.connection = conn
+        self._local.callbacks = []
+        self._local.rolled_back = []
+        committed: bool = False
+        try:
+            with conn:
+                yield conn
+            committed = True
+        finally:
+            callbacks: List[TransactionCallback] = self._local.callbacks
+            rolled_back: List[TransactionCallback] = self._local.rolled_back
+            self._local.connection = None
+            self.release(conn)
+            for callback in rolled_back:
+                callback(False)
+            for callback in callbacks:
+                callback(committed)
+
+    @contextmanager
+    def savepoint(self, name: str) -> Iterator[database.Connection]:
+        with self.connection() as conn:
+            mark: int = len(self._local.callbacks)
+            conn.execute(f"SAVEPOINT {name}")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute(f"ROLLBACK TO {name}")
+                self._local.rolled_back.extend(self._local.callbacks[mark:])
+                del self._local.callbacks[mark:]
+                raise
+            finally:
+                conn.execute(f"RELEASE {name}")
+
+    def on_transaction_end(self, callback: TransactionCallback) -> None:
+        if getattr(self._local, "connection", None) is None:
+            callback(True)  # no transaction open, the write was committed already
+            return
+        self._local.callbacks.append(callback)
+
+    def _create_or_wait(self) -> database.Connection:
+        with self._lock:
+            if len(self._all_connections) < self._pool_size:
+                conn: database.Connection = self._connect()
+                self._all_connections.append(conn)
+                return conn
+            self._checkout_waits += 1
+
+        try:
+            return self._idle.get(timeout=self._checkout_timeout)
+        except Empty:
+            with self._lock:
+                self._checkout_timeouts += 1
+            raise ConnectionPoolTimeoutError(
+                f"No connection available after {self._checkout_timeout} seconds"
+            )
+
+    def _connect(self) -> database.Connection:
+        conn: TrackingConnection = database.connect(
+            self._database_name,
+            check_same_thread=False,
+            uri=self._database_name.startswith("file:"),
+            factory=TrackingConnection,
+        )
+        conn.slow_query_threshold = self._slow_query_threshold
+        self._pragma_profile.apply(conn)
+        return conn
+
+    # LIFECYCLE
+
+    def statistics(self) -> PoolStatistics:
+        with self._lock:
+            created: int = len(self._all_connections)
+            idle: int = self._idle.qsize()
+            return PoolStatistics(
+                pool_size=self._pool_size,
+                connections_created=created,
+                connections_in_use=created - idle,
+                connections_idle=idle,
+                checkouts=self._checkouts,
+                checkout_waits=self._checkout_waits,
+                checkout_timeouts=self._checkout_timeouts,
+            )
+
+    def close(self) -> None:
+        with self._lock:
+            for conn in self._all_connections:
+                conn.close()
+            self._all_connections.clear()
+        while not self._idle.empty():
+            self._idle.get_nowait()
@@ -0,0 +1,120 @@
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass
+from queue import Empty, Queue
+from typing import Any, Callable, List, Optional, Tuple, TypeVar
+
+from app.infra.SQLlite.connection_pool import SQLiteConnectionPool
+
+T = TypeVar("T")
+
+Write = Tuple[Callable[[], Any], "Future[Any]"]
+
+
+@dataclass
+class GroupCommitStatistics:
+    batches: int
+    writes: int
+    largest_batch: int
+
+
+class GroupCommitUnitOfWork:
+    def __init__(
+        self,
+        pool: SQLiteConnectionPool,
+        max_batch_size: int = 64,
+        max_delay: float = 0.002,
+    ) -> None:
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1")
+        self._pool = pool
+        self._max_batch_size = max_batch_size
+        self._max_delay = max_delay
+
+        self._queue: Queue[Optional[Write]] = Queue()
+        self._lock = threading.Lock()
+        self._batches = 0
+        self._writes = 0
+        self._largest_batch = 0
+
+        self._thread = threading.Thread(
+            target=self._run_writer, name="sqlite-group-commit", daemon=True
+        )
+        self._thread.start()
+
+    def run(self, operation: Callable[[], T]) -> T:
+        if threading.current_thread() is self._thread:  # nested: joins the batch
+            return operation()
+
+        future: Future[T] = Future()
+        self._queue.put((operation, future))
+        return future.result()
+
+    def statistics(self) -> GroupCommitStatistics:
+        with self._lock:
+            return GroupCommitStatistics(
+                batches=self._batches,
+                writes=self._writes,
+                largest_batch=self._largest_batch,
+            )
+
+    def close(self) -> None:
+        self._queue.put(None)
+        self._thread.join()
+
+    # WRITER
+
+    def _run_writer(self) -> None:
+        while True:
+            first: Optional[Write] = self._queue.get()
+            if first is None:
+                return
+            batch: List[Write] = [first]
+            closing: bool = self._collect(batch)
+            self._commit(batch)
+            if closing:
+                return
+
+    def _collect(self, batch: List[Write]) -> bool:
+        deadline: float = time.monotonic() + self._max_delay
+        while len(batch) < self._max_batch_size:
+            remaining: float = deadline - time.monotonic()
+            try:
+                write: Optional[Write] = (
+                    self._queue.get(timeout=remaining)
+                    if remaining > 0
+                    else self._queue.get_nowait()
+                )
+            except Empty:
+                return False
+            if write is None:
+                return True
+            batch.append(write)
+        return False
+
+    def _commit(self, batch: List[Write]) -> None:
+        outcomes: List[Tuple[Any, Optional[Exception]]] = []
+        try:
+            with self._pool.connection() as conn:
+                conn.execute("BEGIN IMMEDIATE")
+                for operation, _ in batch:
+                    try:
+                        with self._pool.savepoint("group_commit_write"):
+                            outcomes.append((operation(), None))
+                    except Exception as e:
+                        outcomes.append((None, e))
+        except Exception as e:  # the batch never committed
+            for _, future in batch:
+                future.set_exception(e)
+            return
+
+        with self._lock:
+            self._batches += 1
+            self._writes += len(batch)
+            self._largest_batch = max(self._largest_batch, len(batch))
+        for (_, future), (result, error) in zip(batch, outcomes):
+            if error is None:
+                future.set_result(result)
+            else:
+                future.set_exception(error)
@@ -0,0 +1,62 @@
+import sqlite3 as database
+from typing import Sequence
+
+from app.infra.SQLlite.connection_pool import SQLiteConnectionPool
+
+Migration = Sequence[str]
+
+
+class SchemaMigrator:
+    def __init__(self, pool: SQLiteConnectionPool) -> None:
+        self._pool = pool
+
+    def migrate(self, component: str, migrations: Sequence[Migration]) -> int:
+        with self._pool.connection() as conn:
+            # an up-to-date schema is only read, so read-only databases open too
+            current_version: int = self._get_version(conn, component)
+            if current_version >= len(migrations):
+                return current_version
+
+            if not conn.in_transaction:
+                conn.execute("BEGIN IMMEDIATE")
+            # another process may have migrated while we waited for the lock
+            current_version = self._get_version(conn, component)
+            if current_version >= len(migrations):
+                return current_version
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS schema_versions (
+                    component TEXT PRIMARY KEY,
+                    version INTEGER NOT NULL
+                );
+                """
+            )
+            for migration in migrations[current_version:]:
+                for statement in migration:
+                    conn.execute(statement)
+
+            conn.execute(
+                "INSERT OR REPLACE INTO schema_versions (component, version) "
+                "VALUES (?, ?)",
+                (component, len(migrations)),
+            )
+            return len(migrations)
+
+    def get_version(self, component: str) -> int:
+        with self._pool.connection() as conn:
+            return self._get_version(conn, component)
+
+    @staticmethod
+    def _get_version(conn: database.Connection, component: str) -> int:
+        c = conn.cursor()
+        c.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?",
+            ("schema_versions",),
+        )
+        if c.fetchone() is None:
+            return 0
+        c.execute(
+            "SELECT version FROM schema_versions WHERE component = ?", (component,)
+        )
+        result = c.fetchone()
+        return 0 if result is None else int(result[0])
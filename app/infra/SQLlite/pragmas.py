@@ -0,0 +1,62 @@
+import sqlite3 as database
+from dataclasses import dataclass
+from typing import Dict
+
+
+@dataclass(frozen=True)
+class PragmaProfile:
+    journal_mode: str
+    synchronous: str
+    cache_size: int  # negative values are KiB, positive values are pages
+    mmap_size: int
+    temp_store: str
+    busy_timeout: int  # milliseconds
+
+    def apply(self, conn: database.Connection) -> None:
+        conn.execute(f"PRAGMA journal_mode = {self.journal_mode}")
+        conn.execute(f"PRAGMA synchronous = {self.synchronous}")
+        conn.execute(f"PRAGMA cache_size = {self.cache_size}")
+        conn.execute(f"PRAGMA mmap_size = {self.mmap_size}")
+        conn.execute(f"PRAGMA temp_store = {self.temp_store}")
+        conn.execute(f"PRAGMA busy_timeout = {self.busy_timeout}")
+
+
+DURABLE: PragmaProfile = PragmaProfile(
+    journal_mode="WAL",
+    synchronous="FULL",
+    cache_size=-16_000,
+    mmap_size=0,
+    temp_store="DEFAULT",
+    busy_timeout=5_000,
+)
+
+PRAGMA_PROFILES: Dict[str, PragmaProfile] = {
+    "durable": DURABLE,
+    "balanced": PragmaProfile(
+        journal_mode="WAL",
+        synchronous="NORMAL",
+        cache_size=-64_000,
+        mmap_size=256 * 1024 * 1024,
+        temp_store="MEMORY",
+        busy_timeout=5_000,
+    ),
+    # no crash safety at all: for throwaway databases only
+    "benchmark": PragmaProfile(
+        journal_mode="MEMORY",
+        synchronous="OFF",
+        cache_size=-256_000,
+        mmap_size=1024 * 1024 * 1024,
+        temp_store="MEMORY",
+        busy_timeout=5_000,
+    ),
+}
+
+
+def get_pragma_profile(name: str) -> PragmaProfile:
+    try:
+        return PRAGMA_PROFILES[name]
+    except KeyError:
+        expected: str = ", ".join(sorted(PRAGMA_PROFILES))
+        raise ValueError(
+            f"Unknown pragma profile {name!r}, expected one of: {expected}"
+        ) from None
@@ -0,0 +1,63 @@
+import sqlite3 as database
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Tuple
+
+from app.infra.SQLlite.connection_pool import SQLiteConnectionPool
+from app.infra.SQLlite.query_tracking import QueryStatistics, track_queries
+
+# statements whose plan says something about how rows are found
+EXPLAINED_STATEMENTS: Tuple[str, ...] = ("SELECT", "INSERT", "UPDATE", "DELETE", "WITH")
+
+
+@dataclass
+class CapturedStatements(QueryStatistics):
+    # the parameters each statement first ran with, so it can be explained again
+    parameters_by_sql: Dict[str, Any] = field(default_factory=dict)
+
+    def record_statement(self, sql: str, parameters: Any, seconds: float) -> None:
+        super().record_statement(sql, parameters, seconds)
+        self.parameters_by_sql.setdefault(sql, parameters)
+
+
+@dataclass(frozen=True)
+class QueryPlan:
+    sql: str
+    steps: List[str]
+
+    def full_scans(self) -> List[str]:
+        return [
+            step
+            for step in self.steps
+            if step.startswith("SCAN ") and step != "SCAN CONSTANT ROW"
+        ]
+
+    def describe(self) -> str:
+        return "\n".join([" ".join(self.sql.split())] + [f"  {s}" for s in self.steps])
+
+
+@contextmanager
+def capture_statements() -> Iterator[CapturedStatements]:
+    with track_queries(CapturedStatements()) as statistics:
+        assert isinstance(statistics, CapturedStatements)
+        yield statistics
+
+
+def explain(conn: database.Connection, sql: str, parameters: Any = ()) -> QueryPlan:
+    c = conn.cursor()
+    c.execute(f"EXPLAIN QUERY PLAN {sql}", parameters)
+    return QueryPlan(sql=sql, steps=[str(row[3]) for row in c.fetchall()])
+
+
+def find_full_scans(
+    pool: SQLiteConnectionPool, statements: CapturedStatements
+) -> List[QueryPlan]:
+    plans: List[QueryPlan] = []
+    with pool.connection() as conn:
+        for sql, parameters in statements.parameters_by_sql.items():
+            if not sql.lstrip().upper().startswith(EXPLAINED_STATEMENTS):
+                continue
+            plan: QueryPlan = explain(conn, sql, parameters)
+            if plan.full_scans():
+                plans.append(plan)
+    return plans
@@ -0,0 +1,272 @@
+import logging
+import sqlite3 as database
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import (
+    Any,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+# the same statement this often in one request hints at a query inside a loop
+REPEATED_STATEMENT_THRESHOLD: int = 10
+
+
+@dataclass
+class QueryStatistics:
+    statements: int = 0
+    rows: int = 0
+    seconds: float = 0.0
+    connections: int = 0
+    statements_by_sql: "Counter[str]" = field(default_factory=Counter)
+
+    def record_statement(self, sql: str, parameters: Any, seconds: float) -> None:
+        self.statements += 1
+        self.seconds += seconds
+        self.statements_by_sql[sql] += 1
+
+    def record_rows(self, rows: int, seconds: float) -> None:
+        self.rows += rows
+        self.seconds += seconds
+
+    def repeated_statements(
+        self, threshold: int = REPEATED_STATEMENT_THRESHOLD
+    ) -> List[Tuple[str, int]]:
+        return [
+            (sql, count)
+            for sql, count in self.statements_by_sql.most_common()
+            if count >= threshold
+        ]
+
+    def describe(self) -> str:
+        lines: List[str] = [
+            f"{self.statements} statements, {self.rows} rows, "
+            f"{self.seconds * 1000:.2f} ms, {self.connections} connections"
+        ]
+        for sql, count in self.statements_by_sql.most_common():
+            lines.append(f"  {count} x {' '.join(sql.split())}")
+        return "\n".join(lines)
+
+
+class QueryBudgetExceededError(AssertionError):
+    pass
+
+
+# every tracker that is open in this context, innermost last
+_trackers: ContextVar[Tuple[QueryStatistics, ...]] = ContextVar(
+    "query_trackers", default=()
+)
+
+
+@contextmanager
+def track_queries(
+    statistics: Optional[QueryStatistics] = None,
+) -> Iterator[QueryStatistics]:
+    if statistics is None:
+        statistics = QueryStatistics()
+    token = _trackers.set(_trackers.get() + (statistics,))
+    try:
+        yield statistics
+    finally:
+        _trackers.reset(token)
+
+
+@contextmanager
+def assert_max_queries(
+    statements: int, connections: Optional[int] = None
+) -> Iterator[QueryStatistics]:
+    with track_queries() as statistics:
+        yield statistics
+    if statistics.statements > statements or (
+        connections is not None and statistics.connections > connections
+    ):
+        raise QueryBudgetExceededError(
+            f"Query budget of {statements} statements"
+            + ("" if connections is None else f" and {connections} connections")
+            + f" exceeded: {statistics.describe()}"
+        )
+
+
+def record_connection() -> None:
+    for statistics in _trackers.get():
+        statistics.connections += 1
+
+
+def parameter_shape(parameters: Any, many: bool = False) -> str:
+    # the types and lengths of the parameters, never their values
+    if many:
+        if not isinstance(parameters, Sequence):
+            return "many"
+        first: str = parameter_shape(parameters[0]) if parameters else "()"
+        return f"{len(parameters)} x {first}"
+    if isinstance(parameters, Mapping):
+        return (
+            "{"
+            + ", ".join(f"{name}: {_value_shape(v)}" for name, v in parameters.items())
+            + "}"
+        )
+    runs: List[Tuple[str, int]] = []
+    for value in parameters:
+        shape: str = _value_shape(value)
+        if runs and runs[-1][0] == shape:
+            runs[-1] = (shape, runs[-1][1] + 1)
+        else:
+            runs.append((shape, 1))
+    return (
+        "("
+        + ", ".join(shape if n == 1 else f"{shape} x {n}" for shape, n in runs)
+        + ")"
+    )
+
+
+def _value_shape(value: Any) -> str:
+    if isinstance(value, (str, bytes)):
+        return f"{type(value).__name__}[{len(value)}]"
+    return type(value).__name__
+
+
+class TrackingCursor(database.Cursor):
+    def __init__(self, connection: database.Connection) -> None:
+        super().__init__(connection)
+        self._slow_query_threshold: Optional[float] = getattr(
+            connection, "slow_query_threshold", None
+        )
+        # the statement the cursor ran last and the time it has taken so far
+        self._sql: str = ""
+        self._parameters: Any = ()
+        self._many: bool = False
+        self._seconds: float = 0.0
+        self._logged_as_slow: bool = False
+
+    def execute(self, sql: str, parameters: Any = ()) -> "TrackingCursor":
+        if not self._timed():
+            super().execute(sql, parameters)
+            return self
+        started: float = time.perf_counter()
+        try:
+            super().execute(sql, parameters)
+        finally:
+            self._statement(sql, parameters, False, time.perf_counter() - started)
+        return self
+
+    def executemany(self, sql: str, parameters: Iterable[Any]) -> "TrackingCursor":
+        if not self._timed():
+            super().executemany(sql, parameters)
+            return self
+        started: float = time.perf_counter()
+        try:
+            super().executemany(sql, parameters)
+        finally:
+            self._statement(sql, parameters, True, time.perf_counter() - started)
+        return self
+
+    def executescript(self, sql_script: str) -> "TrackingCursor":
+        if not self._timed():
+            super().executescript(sql_script)
+            return self
+        started: float = time.perf_counter()
+        try:
+            super().executescript(sql_script)
+        finally:
+            self._statement(sql_script, (), False, time.perf_counter() - started)
+        return self
+
+    def fetchone(self) -> Any:
+        if not self._timed():
+            return super().fetchone()
+        started: float = time.perf_counter()
+        row: Any = super().fetchone()
+        self._rows(0 if row is None else 1, time.perf_counter() - started)
+        return row
+
+    def fetchmany(self, size: Optional[int] = None) -> List[Any]:
+        if not self._timed():
+            return super().fetchmany(self.arraysize if size is None else size)
+        started: float = time.perf_counter()
+        rows: List[Any] = super().fetchmany(self.arraysize if size is None else size)
+        self._rows(len(rows), time.perf_counter() - started)
+        return rows
+
+    def fetchall(self) -> List[Any]:
+        if not self._timed():
+            return super().fetchall()
+        started: float = time.perf_counter()
+        rows: List[Any] = super().fetchall()
+        self._rows(len(rows), time.perf_counter() - started)
+        return rows
+
+    def __next__(self) -> Any:
+        if not self._timed():
+            return super().__next__()
+        started: float = time.perf_counter()
+        row: Any = super().__next__()
+        self._rows(1, time.perf_counter() - started)
+        return row
+
+    def _timed(self) -> bool:
+        return self._slow_query_threshold is not None or bool(_trackers.get())
+
+    def _statement(self, sql: str, parameters: Any, many: bool, seconds: float) -> None:
+        for statistics in _trackers.get():
+            statistics.record_statement(sql, parameters, seconds)
+        self._sql, self._parameters, self._many = sql, parameters, many
+        self._seconds = seconds
+        self._logged_as_slow = False
+        self._log_if_slow()
+
+    def _rows(self, rows: int, seconds: float) -> None:
+        for statistics in _trackers.get():
+            statistics.record_rows(rows, seconds)
+        self._seconds += seconds
+        self._log_if_slow()
+
+    def _log_if_slow(self) -> None:
+        # SQLite does most of a query's work while its rows are fetched
+        if (
+            self._slow_query_threshold is None
+            or self._logged_as_slow
+            or self._seconds < self._slow_query_threshold
+        ):
+            return
+        self._logged_as_slow = True
+        sql: str = " ".join(self._sql.split())
+        shape: str = parameter_shape(self._parameters, self._many)
+        logger.warning(
+            "Slow SQL statement took %.2f ms: %s with parameters %s",
+            self._seconds * 1000,
+            sql,
+            shape,
+            extra={
+                "sql": sql,
+                "sql_parameters": shape,
+                "sql_seconds": self._seconds,
+            },
+        )
+
+
+class TrackingConnection(database.Connection):
+    # statements slower than this are logged, None turns the slow-query log off
+    slow_query_threshold: Optional[float] = None
+
+    # Connection.execute and friends build their cursor in C, bypassing cursor()
+    def cursor(self, factory: Any = TrackingCursor) -> Any:
+        return super().cursor(factory)
+
+    def execute(self, sql: str, parameters: Any = ()) -> Any:
+        return self.cursor().execute(sql, parameters)
+
+    def executemany(self, sql: str, parameters: Iterable[Any]) -> Any:
+        return self.cursor().executemany(sql, parameters)
+
+    def executescript(self, sql_script: str) -> Any:
+        return self.cursor().executescript(sql_script)
@@ -1,27 +1,142 @@
-import sqlite3 as database
-from typing import List
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
 
-from app.core.transactions.interactor import Transaction
+from app.core.transactions.interactor import (
+    MAX_TRANSACTION_ID,
+    Direction,
+    Transaction,
+    TransactionsPage,
+    TransactionsStatistics,
+)
+from app.infra.SQLlite.connection_pool import SQLiteConnectionPool
+from app.infra.SQLlite.migrations import Migration, SchemaMigrator
+
+TRANSACTIONS_MIGRATIONS: List[Migration] = [
+    (
+        """
+        CREATE TABLE IF NOT EXISTS transactions (
+            from_address TEXT,
+            to_address TEXT,
+            amount REAL,
+            fee REAL
+        );
+        """,
+    ),
+    (
+        """
+        CREATE TABLE transactions_v2 (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            from_address TEXT NOT NULL,
+            to_address TEXT NOT NULL,
+            amount REAL NOT NULL,
+            fee REAL NOT NULL,
+            created_at TEXT NOT NULL
+                DEFAULT (strftime('%Y-%m-%dT%H:%M:%fZ', 'now'))
+        );
+        """,
+        "INSERT INTO transactions_v2 (from_address, to_address, amount, fee) "
+        "SELECT from_address, to_address, amount, fee "
+        "FROM transactions ORDER BY rowid",
+        "DROP TABLE transactions",
+        "ALTER TABLE transactions_v2 RENAME TO transactions",
+        "CREATE INDEX idx_transactions_from_address "
+        "ON transactions (from_address, id)",
+        "CREATE INDEX idx_transactions_to_address ON transactions (to_address, id)",
+    ),
+    (
+        """
+        CREATE TABLE transactions_summary (
+            id INTEGER PRIMARY KEY CHECK (id = 1),
+            number_of_transactions INTEGER NOT NULL,
+            total_fee REAL NOT NULL
+        );
+        """,
+        "INSERT INTO transactions_summary (id, number_of_transactions, total_fee) "
+        "SELECT 1, COUNT(*), COALESCE(SUM(fee), 0) FROM transactions",
+        """
+        CREATE TRIGGER transactions_summary_after_insert
+        AFTER INSERT ON transactions
+        BEGIN
+            UPDATE transactions_summary
+            SET number_of_transactions = number_of_transactions + 1,
+                total_fee = total_fee + NEW.fee
+            WHERE id = 1;
+        END;
+        """,
+    ),
+    (
+        """
+        CREATE TABLE transactions_v4 (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            from_address TEXT NOT NULL,
+            to_address TEXT NOT NULL,
+            amount INTEGER NOT NULL,
+            fee INTEGER NOT NULL,
+            created_at TEXT NOT NULL
+                DEFAULT (strftime('%Y-%m-%dT%H:%M:%fZ', 'now'))
+        );
+        """,
+        "INSERT INTO transactions_v4 "
+        "(id, from_address, to_address, amount, fee, created_at) "
+        "SELECT id, from_address, to_address, "
+        "CAST(ROUND(amount * 100000000) AS INTEGER), "
+        "CAST(ROUND(fee * 100000000) AS INTEGER), created_at "
+        "FROM transactions ORDER BY id",
+        "DROP TABLE transactions",
+        "ALTER TABLE transactions_v4 RENAME TO transactions",
+        "CREATE INDEX idx_transactions_from_address "
+        "ON transactions (from_address, id)",
+        "CREATE INDEX idx_transactions_to_address ON transactions (to_address, id)",
+        "DROP TABLE transactions_summary",
+        """
+        CREATE TABLE transactions_summary (
+            id INTEGER PRIMARY KEY CHECK (id = 1),
+            number_of_transactions INTEGER NOT NULL,
+            total_fee INTEGER NOT NULL
+        );
+        """,
+        "INSERT INTO transactions_summary (id, number_of_transactions, total_fee) "
+        "SELECT 1, COUNT(*), COALESCE(SUM(fee), 0) FROM transactions",
+        """
+        CREATE TRIGGER transactions_summary_after_insert
+        AFTER INSERT ON transactions
+        BEGIN
+            UPDATE transactions_summary
+            SET number_of_transactions = number_of_transactions + 1,
+                total_fee = total_fee + NEW.fee
+            WHERE id = 1;
+        END;
+        """,
+    ),
+]
+
+
+WALLET_TRANSACTIONS_PAGE_QUERIES: Dict[Direction, str] = {
+    Direction.ASCENDING: (
+        "SELECT id, from_address, to_address, amount, fee "
+        "FROM transactions WHERE from_address = ? AND id > ? "
+        "UNION ALL "
+        "SELECT id, from_address, to_address, amount, fee "
+        "FROM transactions WHERE to_address = ? AND from_address != ? AND id > ? "
+        "ORDER BY id LIMIT ?"
+    ),
+    Direction.DESCENDING: (
+        "SELECT id, from_address, to_address, amount, fee "
+        "FROM transactions WHERE from_address = ? AND id < ? "
+        "UNION ALL "
+        "SELECT id, from_address, to_address, amount, fee "
+        "FROM transactions WHERE to_address = ? AND from_address != ? AND id < ? "
+        "ORDER BY id DESC LIMIT ?"
+    ),
+}
 
 
 class SQLTransactionsRepository:
-    def __init__(self) -> None:
-        self._database_name = "bitcoin.db"
-        with database.connect(self._database_name) as conn:
-            c = conn.cursor()
-            c.execute(
-                """
-                CREATE TABLE IF NOT EXISTS transactions (
-                    from_address TEXT,
-                    to_address TEXT,
-                    amount REAL,
-                    fee REAL
-                );
-                """
-            )
+    def __init__(self, pool: SQLiteConnectionPool) -> None:
+        self._pool = pool
+        SchemaMigrator(pool).migrate("transactions", TRANSACTIONS_MIGRATIONS)
 
     def add_transaction(self, transaction: Transaction) -> None:
-        with database.connect(self._database_name) as conn:
+        with self._pool.connection() as conn:
             c = conn.cursor()
             c.execute(
                 "INSERT INTO transactions (from_address, to_address, amount, fee) "
@@ -35,9 +150,12 @@ class SQLTransactionsRepository:
             )
 
     def get_all_transactions(self) -> List[Transaction]:
-        with database.connect(self._database_name) as conn:
+        with self._pool.connection() as conn:
             c = conn.cursor()
-            c.execute("SELECT from_address, to_address, amount, fee FROM transactions")
+            c.execute(
+                "SELECT from_address, to_address, amount, fee "
+                "FROM transactions ORDER BY id"
+            )
             rows = c.fetchall()
             return [
                 Transaction(
@@ -46,14 +164,102 @@ class SQLTransactionsRepository:
                 for row in rows
             ]
 
+    def iterate_all_transactions(self, batch_size: int) -> Iterator[Transaction]:
+        last_id: int = 0
+        while True:
+            with self._pool.connection() as conn:
+                c = conn.cursor()
+                c.execute(
+                    "SELECT id, from_address, to_address, amount, fee "
+                    "FROM transactions WHERE id > ? ORDER BY id LIMIT ?",
+                    (last_id, batch_size),
+                )
+                rows: List[Tuple[int, str, str, int, int]] = c.fetchall()
+
+            for row in rows:  # yielded after the connection went back to the pool
+                yield Transaction(*row[1:])
+            if len(rows) < batch_size:
+                return
+            last_id = rows[-1][0]
+
+    def iterate_wallets_transactions(
+        self, addresses: Sequence[str], batch_size: int
+    ) -> Iterator[Transaction]:
+        if not addresses:
+            return
+        placeholders: str = ",".join("?" * len(addresses))
+        sql: str = (
+            "SELECT id, from_address, to_address, amount, fee "
+            f"FROM transactions WHERE from_address IN ({placeholders}) AND id > ? "
+            "UNION ALL "
+            "SELECT id, from_address, to_address, amount, fee "
+            f"FROM transactions WHERE to_address IN ({placeholders}) "
+            f"AND from_address NOT IN ({placeholders}) AND id > ? "
+            "ORDER BY id LIMIT ?"
+        )
+        last_id: int = 0
+        while True:
+            with self._pool.connection() as conn:
+                c = conn.cursor()
+                c.execute(
+                    sql,
+                    (*addresses, last_id, *addresses, *addresses, last_id, batch_size),
+                )
+                rows: List[Tuple[int, str, str, int, int]] = c.fetchall()
+
+            for row in rows:
+                yield Transaction(*row[1:])
+            if len(rows) < batch_size:
+                return
+            last_id = rows[-1][0]
+
     def get_wallet_transactions(self, address: str) -> List[Transaction]:
-        with database.connect(self._database_name) as conn:
+        with self._pool.connection() as conn:
             c = conn.cursor()
             c.execute(
-                "SELECT from_address, to_address, amount, fee "
-                "FROM transactions "
-                "WHERE from_address = ? OR to_address = ?",
-                (address, address),
+                "SELECT id, from_address, to_address, amount, fee "
+                "FROM transactions WHERE from_address = ? "
+                "UNION ALL "
+                "SELECT id, from_address, to_address, amount, fee "
+                "FROM transactions WHERE to_address = ? AND from_address != ? "
+                "ORDER BY id",
+                (address, address, address),
             )
             rows = c.fetchall()
-            return [Transaction(*row) for row in rows]
+            return [Transaction(*row[1:]) for row in rows]
+
+    def get_wallet_transactions_page(
+        self,
+        address: str,
+        limit: int,
+        after_id: Optional[int] = None,
+        direction: Direction = Direction.ASCENDING,
+    ) -> TransactionsPage:
+        if after_id is None:
+            after_id = 0 if direction == Direction.ASCENDING else MAX_TRANSACTION_ID
+
+        with self._pool.connection() as conn:
+            c = conn.cursor()
+            c.execute(
+                WALLET_TRANSACTIONS_PAGE_QUERIES[direction],
+                (address, after_id, address, address, after_id, limit + 1),
+            )
+            rows: List[Tuple[int, str, str, int, int]] = c.fetchall()
+
+        next_cursor: Optional[int] = rows[limit - 1][0] if len(rows) > limit else None
+        return TransactionsPage(
+            transactions=[Transaction(*row[1:]) for row in rows[:limit]],
+            next_cursor=next_cursor,
+        )
+
+    def get_statistics(self) -> TransactionsStatistics:
+        with self._pool.connection() as conn:
+            c = conn.cursor()
+            c.execute(
+                "SELECT number_of_transactions, total_fee "
+                "FROM transactions_summary WHERE id = 1"
+            )
+            result = c.fetchone()
+            return TransactionsStatistics(
+                number_of_transactions=int(result[0]), total_fee=result[1]
+            )
@@ -0,0 +1,16 @@
+from typing import Callable, TypeVar
+
+from app.infra.SQLlite.connection_pool import SQLiteConnectionPool
+
+T = TypeVar("T")
+
+
+class SQLiteUnitOfWork:
+    def __init__(self, pool: SQLiteConnectionPool) -> None:
+        self._pool = pool
+
+    def run(self, operation: Callable[[], T]) -> T:
+        with self._pool.connection() as conn:
+            if not conn.in_transaction:
+                conn.execute("BEGIN IMMEDIATE")
+            return operation()
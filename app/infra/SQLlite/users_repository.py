@@ -2,12 +2,13 @@ import sqlite3 as database
 from typing import List, Optional
 
 from app.core.users.interactor import User
+from app.infra.SQLlite.connection_pool import SQLiteConnectionPool
 
 
 class SQLUsersRepository:
-    def __init__(self) -> None:
-        self._database_name = "bitcoin.db"
-        with database.connect(self._database_name) as conn:
+    def __init__(self, pool: SQLiteConnectionPool) -> None:
+        self._pool = pool
+        with self._pool.connection() as conn:
             c = conn.cursor()
             c.execute(
                 """
@@ -20,7 +21,7 @@ class SQLUsersRepository:
             )
 
     def add_user(self, new_user: User) -> bool:
-        with database.connect(self._database_name) as conn:
+        with self._pool.connection() as conn:
             c = conn.cursor()
             try:
                 c.execute(
@@ -32,7 +33,7 @@ class SQLUsersRepository:
                 return False
 
     def get_user_by_username(self, username: str) -> Optional[User]:
-        with database.connect(self._database_name) as conn:
+        with self._pool.connection() as conn:
             c = conn.cursor()
             c.execute("SELECT * FROM users WHERE username=?", (username,))
             result = c.fetchone()
@@ -44,7 +45,7 @@ class SQLUsersRepository:
                 return None
 
     def get_user_by_id(self, user_id: int) -> Optional[User]:
-        with database.connect(self._database_name) as conn:
+        with self._pool.connection() as conn:
             c = conn.cursor()
             c.execute("SELECT * FROM users WHERE id=?", (user_id,))
             result = c.fetchone()
@@ -56,7 +57,7 @@ class SQLUsersRepository:
                 return None
 
     def get_all_users(self) -> List[User]:
-        with database.connect(self._database_name) as conn:
+        with self._pool.connection() as conn:
             c = conn.cursor()
             c.execute("SELECT * FROM users")
             result = c.fetchall()
@@ -66,7 +67,7 @@ class SQLUsersRepository:
             ]
 
     def get_max_user_id(self) -> int:
-        with database.connect(self._database_name) as conn:
+        with self._pool.connection() as conn:
             c = conn.cursor()
             c.execute("SELECT max(id) FROM users")
             result = c.fetchone()
@@ -1,112 +1,135 @@
-import sqlite3 as database
-from typing import List, Optional
+from typing import List, Optional, Sequence
 
 from app.core.wallets.interactor import Wallet
+from app.infra.SQLlite.connection_pool import SQLiteConnectionPool
+from app.infra.SQLlite.migrations import Migration, SchemaMigrator
 
+WALLETS_MIGRATIONS: List[Migration] = [
+    (
+        """
+        CREATE TABLE IF NOT EXISTS wallets (
+            user_id INTEGER,
+            address TEXT UNIQUE,
+            balance_in_btc REAL,
+            FOREIGN KEY (user_id) REFERENCES users (id)
+        );
+        """,
+    ),
+    (
+        """
+        CREATE TABLE wallets_v2 (
+            user_id INTEGER NOT NULL,
+            address TEXT NOT NULL UNIQUE,
+            balance_in_satoshis INTEGER NOT NULL CHECK (balance_in_satoshis >= 0),
+            FOREIGN KEY (user_id) REFERENCES users (id)
+        );
+        """,
+        "INSERT INTO wallets_v2 (user_id, address, balance_in_satoshis) "
+        "SELECT user_id, address, CAST(ROUND(balance_in_btc * 100000000) AS INTEGER) "
+        "FROM wallets ORDER BY rowid",
+        "DROP TABLE wallets",
+        "ALTER TABLE wallets_v2 RENAME TO wallets",
+    ),
+    ("CREATE INDEX idx_wallets_user_id ON wallets (user_id)",),
+]
 
-class SQLWalletsRepository:
-    def __init__(self) -> None:
-        self._database_name = "bitcoin.db"
-        with database.connect(self._database_name) as conn:
-            c = conn.cursor()
 
-            c.execute(
-                """
-                CREATE TABLE IF NOT EXISTS wallets (
-                    user_id INTEGER,
-                    address TEXT UNIQUE,
-                    balance_in_btc REAL,
-                    FOREIGN KEY (user_id) REFERENCES users (id)
-                );
-                """
-            )
+# older SQLite builds cap a statement at 999 bound parameters
+MAX_ADDRESSES_PER_QUERY: int = 999
+
+
+class SQLWalletsRepository:
+    def __init__(self, pool: SQLiteConnectionPool) -> None:
+        self._pool = pool
+        SchemaMigrator(pool).migrate("wallets", WALLETS_MIGRATIONS)
 
     # WALLETS
 
     def add_wallet(self, wallet: Wallet) -> None:
-        with database.connect(self._database_name) as conn:
+        with self._pool.connection() as conn:
             c = conn.cursor()
             c.execute(
-                "INSERT INTO wallets (user_id, address, balance_in_btc) "
+                "INSERT INTO wallets (user_id, address, balance_in_satoshis) "
                 "VALUES (?, ?, ?)",
                 (
                     wallet.get_owner_id(),
                     wallet.get_address(),
-                    wallet.get_balance_in_btc(),
+                    wallet.get_balance_in_satoshis(),
                 ),
             )
-            conn.commit()
 
     def get_wallet(self, address: str) -> Optional[Wallet]:
-        with database.connect(self._database_name) as conn:
+        with self._pool.connection() as conn:
             c = conn.cursor()
             c.execute(
-                "SELECT user_id, address, balance_in_btc "
+                "SELECT user_id, address, balance_in_satoshis "
                 "FROM wallets WHERE address = ?",
                 (address,),
             )
             result = c.fetchone()
             if result is not None:
                 return Wallet(
-                    _user_id=result[0], _address=result[1], _balance_btc=result[2]
+                    _user_id=result[0],
+                    _address=result[1],
+                    _balance_satoshis=result[2],
                 )
             else:
                 return None
 
-    def deposit(self, address: str, amount: float) -> bool:
-        with database.connect(self._database_name) as conn:
+    def get_wallets(self, addresses: Sequence[str]) -> List[Wallet]:
+        unique: List[str] = list(dict.fromkeys(addresses))
+        wallets: List[Wallet] = []
+        with self._pool.connection() as conn:
             c = conn.cursor()
-            c.execute(
-                "SELECT balance_in_btc FROM wallets WHERE address = ?", (address,)
-            )
-            result = c.fetchone()
-            if result is not None:
-                current_balance = result[0]
+            for start in range(0, len(unique), MAX_ADDRESSES_PER_QUERY):
+                end: int = start + MAX_ADDRESSES_PER_QUERY
+                chunk: List[str] = unique[start:end]
                 c.execute(
-                    "UPDATE wallets SET balance_in_btc = ? WHERE address = ?",
-                    (current_balance + amount, address),
+                    "SELECT user_id, address, balance_in_satoshis FROM wallets "
+                    f"WHERE address IN ({', '.join('?' * len(chunk))})",
+                    chunk,
                 )
-                conn.commit()
-                return True
-            else:
-                return False
+                wallets.extend(
+                    Wallet(_user_id=row[0], _address=row[1], _balance_satoshis=row[2])
+                    for row in c.fetchall()
+                )
+        return wallets
 
-    def withdraw(self, address: str, amount: float) -> bool:
-        with database.connect(self._database_name) as conn:
+    def deposit(self, address: str, amount: int) -> bool:
+        with self._pool.connection() as conn:
             c = conn.cursor()
             c.execute(
-                "SELECT balance_in_btc FROM wallets WHERE address = ?", (address,)
+                "UPDATE wallets SET balance_in_satoshis = balance_in_satoshis + ? "
+                "WHERE address = ? AND ? > 0",
+                (amount, address, amount),
             )
-            result = c.fetchone()
-            if result is not None:
-                current_balance = result[0]
-                if current_balance >= amount:
-                    c.execute(
-                        "UPDATE wallets SET balance_in_btc = ? WHERE address = ?",
-                        (current_balance - amount, address),
-                    )
-                    conn.commit()
-                    return True
-                else:
-                    return False
-            else:
-                return False
+            return c.rowcount == 1
+
+    def withdraw(self, address: str, amount: int) -> bool:
+        with self._pool.connection() as conn:
+            c = conn.cursor()
+            c.execute(
+                "UPDATE wallets SET balance_in_satoshis = balance_in_satoshis - ? "
+                "WHERE address = ? AND ? > 0 AND balance_in_satoshis >= ?",
+                (amount, address, amount, amount),
+            )
+            return c.rowcount == 1
 
     def get_all_wallets_of_user(self, user_id: int) -> List[Wallet]:
-        with database.connect(self._database_name) as conn:
+        with self._pool.connection() as conn:
             c = conn.cursor()
             c.execute(
-                "SELECT address, balance_in_btc FROM wallets WHERE user_id = ?",
+                "SELECT address, balance_in_satoshis FROM wallets WHERE user_id = ?",
                 (user_id,),
             )
             rows = c.fetchall()
             return [
-                Wallet(_user_id=user_id, _address=row[0], _balance_btc=row[1])
+                Wallet(_user_id=user_id, _address=row[0], _balance_satoshis=row[1])
                 for row in rows
             ]
 
     def get_number_of_wallets_of_user(self, user_id: int) -> int:
-        with database.connect(self._database_name) as conn:
+        with self._pool.connection() as conn:
             c = conn.cursor()
             c.execute("SELECT COUNT(*) FROM wallets WHERE user_id = ?", (user_id,))
             return int(c.fetchone()[0])
@@ -1,8 +1,13 @@
 from starlette.requests import Request
 
-from app.core.facade import BitcoinWalletCore
+from app.core.facade import AsyncBitcoinWalletCore, BitcoinWalletCore
 
 
-def get_core(request: Request) -> BitcoinWalletCore:
+async def get_core(request: Request) -> BitcoinWalletCore:
     core: BitcoinWalletCore = request.app.state.core
     return core
+
+
+async def get_async_core(request: Request) -> AsyncBitcoinWalletCore:
+    core: AsyncBitcoinWalletCore = request.app.state.async_core
+    return core
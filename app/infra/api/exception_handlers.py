@@ -0,0 +1,13 @@
+from fastapi.responses import JSONResponse
+from starlette import status
+from starlette.requests import Request
+
+from app.core.facade import ExchangeRateUnavailableError
+
+
+def exchange_rate_unavailable_handler(request: Request, exc: Exception) -> JSONResponse:
+    assert isinstance(exc, ExchangeRateUnavailableError)
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={"detail": "Exchange rate is currently unavailable"},
+    )
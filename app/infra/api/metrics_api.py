@@ -0,0 +1,19 @@
+# `GET /metrics`
+#   - Returns request, repository, exchange rate and cache metrics in the
+#   Prometheus text format
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+from starlette import status
+from starlette.requests import Request
+
+from app.infra.metrics.registry import MetricsRegistry
+
+metrics_api: APIRouter = APIRouter()
+
+PROMETHEUS_CONTENT_TYPE: str = "text/plain; version=0.0.4; charset=utf-8"
+
+
+@metrics_api.get("/metrics", status_code=status.HTTP_200_OK)
+async def get_metrics(request: Request) -> PlainTextResponse:
+    registry: MetricsRegistry = request.app.state.metrics
+    return PlainTextResponse(registry.render(), media_type=PROMETHEUS_CONTENT_TYPE)
@@ -0,0 +1,69 @@
+# `POST /profiling`
+#   - Requires pre-set (hard coded) Admin API key
+#   - Starts sampling the stacks of a fraction of all requests, dropping older ones
+# `DELETE /profiling`
+#   - Requires pre-set (hard coded) Admin API key
+#   - Stops sampling requests, keeping the collected stacks
+# `GET /profiling`
+#   - Requires pre-set (hard coded) Admin API key
+#   - Returns the sample rate and how much has been collected
+# `GET /profiling/stacks`
+#   - Requires pre-set (hard coded) Admin API key
+#   - Downloads the collected stacks in the collapsed format flame graphs read
+#
+# A single request is profiled when it carries the Admin API key in `X-Profile`.
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import PlainTextResponse
+from starlette import status
+from starlette.requests import Request
+
+from app.core.facade import BitcoinWalletCore
+from app.infra.api.dependables import get_core
+from app.infra.metrics.profiling import ProfilingStatus, StackSampler
+
+profiling_api: APIRouter = APIRouter()
+
+
+async def get_sampler(
+    request: Request,
+    admin_api_key: str,
+    core: BitcoinWalletCore = Depends(get_core),
+) -> StackSampler:
+    if not core.is_admin(admin_api_key):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN, detail="Wrong admin_api_key"
+        )
+    sampler: StackSampler = request.app.state.profiler
+    return sampler
+
+
+@profiling_api.post("/profiling", status_code=status.HTTP_200_OK)
+async def start_profiling(
+    sample_rate: float = Query(0.01, gt=0, le=1),
+    sampler: StackSampler = Depends(get_sampler),
+) -> ProfilingStatus:
+    return sampler.start(sample_rate)
+
+
+@profiling_api.delete("/profiling", status_code=status.HTTP_200_OK)
+async def stop_profiling(
+    sampler: StackSampler = Depends(get_sampler),
+) -> ProfilingStatus:
+    return sampler.stop()
+
+
+@profiling_api.get("/profiling", status_code=status.HTTP_200_OK)
+async def get_profiling_status(
+    sampler: StackSampler = Depends(get_sampler),
+) -> ProfilingStatus:
+    return sampler.status()
+
+
+@profiling_api.get("/profiling/stacks", status_code=status.HTTP_200_OK)
+async def download_stacks(
+    sampler: StackSampler = Depends(get_sampler),
+) -> PlainTextResponse:
+    return PlainTextResponse(
+        sampler.collapsed_stacks(),
+        headers={"Content-Disposition": 'attachment; filename="stacks.folded"'},
+    )
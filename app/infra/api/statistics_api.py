@@ -6,8 +6,8 @@ from typing import Any, Dict
 from fastapi import APIRouter, Depends, HTTPException
 from starlette import status
 
-from app.core.facade import BitcoinWalletCore, StatisticsResponse
-from app.infra.api.dependables import get_core
+from app.core.facade import AsyncBitcoinWalletCore, StatisticsResponse
+from app.infra.api.dependables import get_async_core
 
 statistics_api: APIRouter = APIRouter()
 
@@ -21,10 +21,12 @@ status_translator: Dict[int, Any] = {
 
 
 @statistics_api.get("/statistics", status_code=status.HTTP_200_OK)
-def get_statistics(
-    admin_api_key: str, core: BitcoinWalletCore = Depends(get_core)
+async def get_statistics(
+    admin_api_key: str, core: AsyncBitcoinWalletCore = Depends(get_async_core)
 ) -> StatisticsResponse:
-    response: StatisticsResponse = core.get_statistics(admin_api_key=admin_api_key)
+    response: StatisticsResponse = await core.get_statistics(
+        admin_api_key=admin_api_key
+    )
     if status_translator[response.status]["status_code"] != status.HTTP_200_OK:
         raise HTTPException(
             status_code=status_translator[response.status]["status_code"],
@@ -1,16 +1,41 @@
 # `POST /transactions`
 #   - Requires API key
 #   - Makes a transaction from one wallet to another
+#   - `amount` is in BTC; the core works in integer satoshis
 #   - Transaction is free if the same user is the owner of both wallets
 #   - System takes a 1.5% (of the transferred amount)
 #   fee for transfers to the foreign wallets
-from typing import Any, Dict
+#
+# `POST /transactions/batch`
+#   - Requires API key
+#   - Makes a list of transfers in one database transaction
+#   - `mode` is `all_or_nothing` (409 and nothing applied if any transfer
+#   fails) or `best_effort` (207 when some transfers failed)
+#   - Returns a status per transfer, 424 marks a valid transfer of a
+#   rejected batch
+#
+# `GET /transactions`
+#   - Requires API key
+#   - Streams the ledger as newline-delimited JSON, one transaction per line
+import json
+from typing import Any, AsyncIterator, Dict, List
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Response
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
 from starlette import status
 
-from app.core.facade import BitcoinWalletCore, TransactionResponse
-from app.infra.api.dependables import get_core
+from app.core.facade import (
+    MAX_TRANSFERS_PER_BATCH,
+    AsyncBitcoinWalletCore,
+    AsyncTransactionsStreamResponse,
+    BatchMode,
+    TransactionResponse,
+    Transfer,
+    TransfersBatchResponse,
+)
+from app.core.money import InvalidAmountError, btc_to_satoshis
+from app.infra.api.dependables import get_async_core
 
 transactions_api: APIRouter = APIRouter()
 
@@ -18,7 +43,7 @@ status_translator: Dict[int, Any] = {
     201: {"status_code": status.HTTP_201_CREATED, "msg": "Transaction Created"},
     400: {
         "status_code": status.HTTP_400_BAD_REQUEST,
-        "msg": "Not enough funds in the wallet",
+        "msg": "Invalid amount or not enough funds in the wallet",
     },
     403: {
         "status_code": status.HTTP_403_FORBIDDEN,
@@ -28,19 +53,63 @@ status_translator: Dict[int, Any] = {
 }
 
 
+class TransferRequest(BaseModel):
+    from_address: str
+    to_address: str
+    amount: float
+
+
+class TransfersBatchRequest(BaseModel):
+    transfers: List[TransferRequest]
+    mode: BatchMode = BatchMode.ALL_OR_NOTHING
+
+
+def _to_satoshis(amount_in_btc: float) -> int:
+    try:
+        return btc_to_satoshis(amount_in_btc)
+    except InvalidAmountError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)
+        ) from e
+
+
+async def _ndjson_chunks(
+    batches: AsyncIterator[List[Dict[str, Any]]],
+) -> AsyncIterator[str]:
+    async for batch in batches:
+        yield "".join(json.dumps(transaction) + "\n" for transaction in batch)
+
+
+@transactions_api.get("/transactions", status_code=status.HTTP_200_OK)
+async def get_transactions(
+    api_key: str, core: AsyncBitcoinWalletCore = Depends(get_async_core)
+) -> StreamingResponse:
+    response: AsyncTransactionsStreamResponse = await core.stream_transactions(
+        api_key=api_key
+    )
+    if response.status != status.HTTP_200_OK:
+        raise HTTPException(
+            status_code=status_translator[response.status]["status_code"],
+            detail=status_translator[response.status]["msg"],
+        )
+    return StreamingResponse(
+        _ndjson_chunks(response.batches), media_type="application/x-ndjson"
+    )
+
+
 @transactions_api.post("/transactions", status_code=status.HTTP_201_CREATED)
-def make_transaction(
+async def make_transaction(
     api_key: str,
     from_address: str,
     to_address: str,
     amount: float,
-    core: BitcoinWalletCore = Depends(get_core),
+    core: AsyncBitcoinWalletCore = Depends(get_async_core),
 ) -> TransactionResponse:
-    response: TransactionResponse = core.make_transaction(
+    response: TransactionResponse = await core.make_transaction(
         api_key=api_key,
         from_address=from_address,
         to_address=to_address,
-        amount=amount,
+        amount_in_satoshis=_to_satoshis(amount),
     )
     if status_translator[response.status]["status_code"] != status.HTTP_201_CREATED:
         raise HTTPException(
@@ -50,16 +119,48 @@ def make_transaction(
     return response
 
 
+@transactions_api.post("/transactions/batch", status_code=status.HTTP_201_CREATED)
+async def make_transactions(
+    api_key: str,
+    batch: TransfersBatchRequest,
+    response: Response,
+    core: AsyncBitcoinWalletCore = Depends(get_async_core),
+) -> TransfersBatchResponse:
+    result: TransfersBatchResponse = await core.make_transactions(
+        api_key=api_key,
+        transfers=[
+            Transfer(
+                from_address=transfer.from_address,
+                to_address=transfer.to_address,
+                amount_in_satoshis=_to_satoshis(transfer.amount),
+            )
+            for transfer in batch.transfers
+        ],
+        mode=batch.mode,
+    )
+    if result.status == status.HTTP_403_FORBIDDEN:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN, detail="Wrong api_key"
+        )
+    if result.status == status.HTTP_400_BAD_REQUEST:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"A batch holds 1 to {MAX_TRANSFERS_PER_BATCH} transfers",
+        )
+    response.status_code = result.status
+    return result
+
+
 @transactions_api.post(
     "/wallets/{address}/deposit", status_code=status.HTTP_201_CREATED
 )
-def deposit(
+async def deposit(
     api_key: str,
     address: str,
     amount: float,
-    core: BitcoinWalletCore = Depends(get_core),
+    core: AsyncBitcoinWalletCore = Depends(get_async_core),
 ) -> TransactionResponse:
-    response: TransactionResponse = core.deposit(
+    response: TransactionResponse = await core.deposit(
         api_key=api_key,
         address=address,
         amount_in_usd=amount,
@@ -75,13 +176,13 @@ def deposit(
 @transactions_api.post(
     "/wallets/{address}/withdraw", status_code=status.HTTP_201_CREATED
 )
-def withdraw(
+async def withdraw(
     api_key: str,
     address: str,
     amount: float,
-    core: BitcoinWalletCore = Depends(get_core),
+    core: AsyncBitcoinWalletCore = Depends(get_async_core),
 ) -> TransactionResponse:
-    response: TransactionResponse = core.withdraw(
+    response: TransactionResponse = await core.withdraw(
         api_key=api_key,
         address=address,
         amount_in_usd=amount,
@@ -6,8 +6,8 @@ from typing import Any, Dict
 from fastapi import APIRouter, Depends, HTTPException
 from starlette import status
 
-from app.core.facade import BitcoinWalletCore, UserResponse
-from app.infra.api.dependables import get_core
+from app.core.facade import AsyncBitcoinWalletCore, UserResponse
+from app.infra.api.dependables import get_async_core
 
 users_api: APIRouter = APIRouter()
 
@@ -18,10 +18,12 @@ status_translator: Dict[int, Any] = {
 
 
 @users_api.post("/users", status_code=status.HTTP_201_CREATED)
-def register_user(
-    username: str, password: str, core: BitcoinWalletCore = Depends(get_core)
+async def register_user(
+    username: str, password: str, core: AsyncBitcoinWalletCore = Depends(get_async_core)
 ) -> UserResponse:
-    response: UserResponse = core.register_user(username=username, password=password)
+    response: UserResponse = await core.register_user(
+        username=username, password=password
+    )
     if status_translator[response.status]["status_code"] != status.HTTP_201_CREATED:
         raise HTTPException(
             status_code=status_translator[response.status]["status_code"],
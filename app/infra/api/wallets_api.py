@@ -4,8 +4,14 @@
 #   - Deposits 1 BTC (or 100000000 satoshis) automatically to the new wallet
 #   - User may register up to 3 wallets
 #   - Returns wallet address and balance in BTC and USD
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional
 
+# `GET /wallets`
+#   - Requires API key
+#   - Returns every wallet of the caller, or only the wallets given as
+#   repeated `address` parameters (up to 100)
+#   - Balances are in BTC and USD, converted with one exchange rate read
+#
 # `GET /wallets/{address}`
 #   - Requires API key
 #   - Returns wallet address and balance in BTC and USD
@@ -14,11 +20,21 @@ from typing import Any, Dict
 # `GET /wallets/{address}/transactions`
 #   - Requires API key
 #   - returns transactions related to the wallet
-from fastapi import APIRouter, Depends, HTTPException
+#   - paginated with `limit`, `after_id` (the previous page's `next_cursor`)
+#   and `direction`
+from fastapi import APIRouter, Depends, HTTPException, Query
 from starlette import status
 
-from app.core.facade import BitcoinWalletCore, WalletResponse
-from app.infra.api.dependables import get_core
+from app.core.facade import (
+    DEFAULT_PAGE_SIZE,
+    MAX_ADDRESSES_PER_LOOKUP,
+    MAX_PAGE_SIZE,
+    AsyncBitcoinWalletCore,
+    WalletResponse,
+    WalletsResponse,
+)
+from app.core.transactions.interactor import MAX_TRANSACTION_ID, Direction
+from app.infra.api.dependables import get_async_core
 
 wallets_api: APIRouter = APIRouter()
 
@@ -38,11 +54,11 @@ status_translator: Dict[int, Any] = {
 
 
 @wallets_api.post("/wallets", status_code=status.HTTP_201_CREATED)
-def create_wallet(
+async def create_wallet(
     api_key: str,
-    core: BitcoinWalletCore = Depends(get_core),
+    core: AsyncBitcoinWalletCore = Depends(get_async_core),
 ) -> WalletResponse:
-    response: WalletResponse = core.create_wallet(api_key=api_key)
+    response: WalletResponse = await core.create_wallet(api_key=api_key)
     if status_translator[response.status]["status_code"] != status.HTTP_201_CREATED:
         raise HTTPException(
             status_code=status_translator[response.status]["status_code"],
@@ -51,13 +67,37 @@ def create_wallet(
     return response
 
 
+@wallets_api.get("/wallets", status_code=status.HTTP_200_OK)
+async def get_wallets(
+    api_key: str,
+    address: List[str] = Query([]),
+    core: AsyncBitcoinWalletCore = Depends(get_async_core),
+) -> WalletsResponse:
+    response: WalletsResponse = (
+        await core.get_wallets(api_key=api_key, addresses=address)
+        if address
+        else await core.get_wallets_of_user(api_key=api_key)
+    )
+    if response.status == status.HTTP_400_BAD_REQUEST:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Look up 1 to {MAX_ADDRESSES_PER_LOOKUP} addresses at a time",
+        )
+    if status_translator[response.status]["status_code"] != status.HTTP_200_OK:
+        raise HTTPException(
+            status_code=status_translator[response.status]["status_code"],
+            detail=status_translator[response.status]["msg"],
+        )
+    return response
+
+
 @wallets_api.get("/wallets/{address}", status_code=status.HTTP_200_OK)
-def get_wallet(
+async def get_wallet(
     address: str,
     api_key: str,
-    core: BitcoinWalletCore = Depends(get_core),
+    core: AsyncBitcoinWalletCore = Depends(get_async_core),
 ) -> WalletResponse:
-    response: WalletResponse = core.get_wallet(api_key=api_key, address=address)
+    response: WalletResponse = await core.get_wallet(api_key=api_key, address=address)
     if status_translator[response.status]["status_code"] != status.HTTP_200_OK:
         raise HTTPException(
             status_code=status_translator[response.status]["status_code"],
@@ -67,13 +107,20 @@ def get_wallet(
 
 
 @wallets_api.get("/wallets/{address}/transactions", status_code=status.HTTP_200_OK)
-def get_transactions_for_this_wallet(
+async def get_transactions_for_this_wallet(
     address: str,
     api_key: str,
-    core: BitcoinWalletCore = Depends(get_core),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    after_id: Optional[int] = Query(None, ge=0, le=MAX_TRANSACTION_ID),
+    direction: Direction = Direction.ASCENDING,
+    core: AsyncBitcoinWalletCore = Depends(get_async_core),
 ) -> WalletResponse:
-    response: WalletResponse = core.get_transactions_of_wallet(
-        api_key=api_key, address=address
+    response: WalletResponse = await core.get_transactions_page_of_wallet(
+        api_key=api_key,
+        address=address,
+        limit=limit,
+        after_id=after_id,
+        direction=direction,
     )
     if status_translator[response.status]["status_code"] != status.HTTP_200_OK:
         raise HTTPException(
@@ -0,0 +1,46 @@
+import time
+from typing import Callable, Optional
+
+from app.core.api_key.interactor import IAPIKeysRepository
+from app.infra.cache.lru_cache import CacheStatistics, LRUCache
+
+
+class CachingAPIKeysRepository:
+    def __init__(
+        self,
+        repository: IAPIKeysRepository,
+        capacity: int = 10_000,
+        negative_capacity: int = 10_000,
+        negative_time_to_live: float = 5.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._repository = repository
+        self._negative_time_to_live = negative_time_to_live
+        self._user_ids: LRUCache[str, int] = LRUCache(capacity, clock)
+        self._unknown_keys: LRUCache[str, bool] = LRUCache(negative_capacity, clock)
+
+    def add_api_key_id_pair(self, api_key: str, user_id: int) -> None:
+        self._repository.add_api_key_id_pair(api_key=api_key, user_id=user_id)
+        self._unknown_keys.pop(api_key)
+
+    def get_user_id_by_api_key(self, api_key: str) -> int:
+        user_id: Optional[int] = self._user_ids.get(api_key)
+        if user_id is not None:
+            return user_id
+        if self._unknown_keys.get(api_key):
+            return -1
+
+        user_id = self._repository.get_user_id_by_api_key(api_key=api_key)
+        if user_id == -1:
+            self._unknown_keys.put(
+                api_key, True, time_to_live=self._negative_time_to_live
+            )
+        else:
+            self._user_ids.put(api_key, user_id)
+        return user_id
+
+    def statistics(self) -> CacheStatistics:
+        return self._user_ids.statistics()
+
+    def negative_statistics(self) -> CacheStatistics:
+        return self._unknown_keys.statistics()
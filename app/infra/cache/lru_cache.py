@@ -0,0 +1,86 @@
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Generic, Optional, Tuple, TypeVar
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+
+@dataclass
+class CacheStatistics:
+    capacity: int
+    size: int
+    hits: int
+    misses: int
+    evictions: int
+
+    def get_hit_ratio(self) -> float:
+        lookups: int = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class LRUCache(Generic[K, V]):
+    def __init__(
+        self, capacity: int, clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self._capacity = capacity
+        self._clock = clock
+        self._entries: OrderedDict[K, Tuple[V, Optional[float]]] = OrderedDict()
+        self._lock = threading.Lock()
+
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, key: K) -> Optional[V]:
+        with self._lock:
+            entry: Optional[Tuple[V, Optional[float]]] = self._entries.get(key)
+            if entry is not None and (entry[1] is None or self._clock() < entry[1]):
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return entry[0]
+
+            if entry is not None:
+                del self._entries[key]
+            self._misses += 1
+            return None
+
+    def peek(self, key: K) -> Optional[V]:
+        with self._lock:  # no effect on recency or statistics
+            entry: Optional[Tuple[V, Optional[float]]] = self._entries.get(key)
+            if entry is not None and (entry[1] is None or self._clock() < entry[1]):
+                return entry[0]
+            return None
+
+    def put(self, key: K, value: V, time_to_live: Optional[float] = None) -> None:
+        expires_at: Optional[float] = (
+            None if time_to_live is None else self._clock() + time_to_live
+        )
+        with self._lock:
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self._capacity:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def pop(self, key: K) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def statistics(self) -> CacheStatistics:
+        with self._lock:
+            return CacheStatistics(
+                capacity=self._capacity,
+                size=len(self._entries),
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+            )
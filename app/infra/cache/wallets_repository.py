@@ -0,0 +1,173 @@
+import threading
+from dataclasses import replace
+from typing import Callable, Dict, List, Optional, Protocol, Sequence
+
+from app.core.wallets.interactor import IWalletsRepository, Wallet
+from app.infra.cache.lru_cache import CacheStatistics, LRUCache
+
+
+class ITransactionEvents(Protocol):
+    def on_transaction_end(self, callback: Callable[[bool], None]) -> None:
+        pass
+
+
+class CachingWalletsRepository:
+    def __init__(
+        self,
+        repository: IWalletsRepository,
+        transaction_events: ITransactionEvents,
+        capacity: int = 10_000,
+    ) -> None:
+        self._repository = repository
+        self._transaction_events = transaction_events
+        self._wallets: LRUCache[str, Wallet] = LRUCache(capacity)
+        self._lock = threading.Lock()
+        # versions come from one counter; only addresses with an open write keep
+        # their own, every other address shares the version of the last write
+        # that ended, so a read that raced any write is simply not cached
+        self._last_version: int = 0
+        self._ended_version: int = 0
+        self._versions: Dict[str, int] = {}
+        self._pending_writes: Dict[str, int] = {}
+
+    # READS
+
+    def get_wallet(self, address: str) -> Optional[Wallet]:
+        with self._lock:
+            pending: bool = address in self._pending_writes
+            if not pending:
+                cached: Optional[Wallet] = self._wallets.get(address)
+                if cached is not None:
+                    return replace(cached)
+            version: int = self._version(address)
+
+        # while a write is open the row is read through, so a transaction sees
+        # its own changes and nobody else caches the pre-commit balance
+        wallet: Optional[Wallet] = self._repository.get_wallet(address=address)
+        if wallet is not None and not pending:
+            with self._lock:
+                if (
+                    address not in self._pending_writes
+                    and self._version(address) == version
+                ):
+                    self._wallets.put(address, replace(wallet))
+        return wallet
+
+    def get_wallets(self, addresses: Sequence[str]) -> List[Wallet]:
+        wallets: List[Wallet] = []
+        versions: Dict[str, int] = {}
+        with self._lock:
+            for address in dict.fromkeys(addresses):
+                cached: Optional[Wallet] = (
+                    None
+                    if address in self._pending_writes
+                    else self._wallets.get(address)
+                )
+                if cached is not None:
+                    wallets.append(replace(cached))
+                else:
+                    versions[address] = self._version(address)
+        if not versions:
+            return wallets
+
+        loaded: List[Wallet] = self._repository.get_wallets(list(versions))
+        with self._lock:
+            for wallet in loaded:
+                address = wallet.get_address()
+                if (
+                    address not in self._pending_writes
+                    and self._version(address) == versions[address]
+                ):
+                    self._wallets.put(address, replace(wallet))
+        return wallets + loaded
+
+    def get_all_wallets_of_user(self, user_id: int) -> List[Wallet]:
+        return self._repository.get_all_wallets_of_user(user_id)
+
+    def get_number_of_wallets_of_user(self, user_id: int) -> int:
+        return self._repository.get_number_of_wallets_of_user(user_id)
+
+    # WRITES
+
+    def add_wallet(self, wallet: Wallet) -> None:
+        address: str = wallet.get_address()
+        added: bool = False
+
+        def cache_new_wallet() -> None:
+            if added:
+                self._wallets.put(address, replace(wallet))
+
+        self._begin_write(address)
+        try:
+            self._repository.add_wallet(wallet=wallet)
+            added = True
+        finally:
+            self._after_write(address, cache_new_wallet)
+
+    def deposit(self, address: str, amount: int) -> bool:
+        return self._write(
+            address,
+            lambda: self._repository.deposit(address=address, amount=amount),
+            lambda wallet: wallet.deposit(amount),
+        )
+
+    def withdraw(self, address: str, amount: int) -> bool:
+        return self._write(
+            address,
+            lambda: self._repository.withdraw(address=address, amount=amount),
+            lambda wallet: wallet.withdraw(amount),
+        )
+
+    def _write(
+        self,
+        address: str,
+        write: Callable[[], bool],
+        apply: Callable[[Wallet], None],
+    ) -> bool:
+        changed: bool = False
+
+        def update_cached_wallet() -> None:
+            cached: Optional[Wallet] = self._wallets.peek(address)
+            if changed and cached is not None:
+                apply(cached)
+
+        self._begin_write(address)
+        try:
+            changed = write()
+        finally:
+            self._after_write(address, update_cached_wallet)
+        return changed
+
+    def _begin_write(self, address: str) -> None:
+        with self._lock:
+            self._pending_writes[address] = self._pending_writes.get(address, 0) + 1
+            self._last_version += 1
+            self._versions[address] = self._last_version
+
+    def _version(self, address: str) -> int:
+        return self._versions.get(address, self._ended_version)
+
+    def _after_write(self, address: str, on_commit: Callable[[], None]) -> None:
+        def end_write(committed: bool) -> None:
+            with self._lock:
+                if committed:
+                    on_commit()
+                self._last_version += 1
+                self._pending_writes[address] -= 1
+                if self._pending_writes[address] == 0:
+                    del self._pending_writes[address]
+                    del self._versions[address]
+                    self._ended_version = self._last_version
+                else:
+                    self._versions[address] = self._last_version
+
+        self._transaction_events.on_transaction_end(end_write)
+
+    # METRICS
+
+    def get_version(self, address: str) -> int:
+        with self._lock:
+            return self._version(address)
+
+    def statistics(self) -> CacheStatistics:
+        return self._wallets.statistics()
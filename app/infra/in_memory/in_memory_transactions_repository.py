@@ -1,29 +1,97 @@
+from bisect import bisect_left, bisect_right
 from collections import defaultdict
-from typing import DefaultDict, List
+from heapq import merge
+from typing import DefaultDict, Iterator, List, Optional, Sequence
 
-from app.core.transactions.interactor import Transaction
+from app.core.transactions.interactor import (
+    Direction,
+    Transaction,
+    TransactionsPage,
+    TransactionsStatistics,
+)
 
 
 class InMemoryTransactionsRepository:
     _transactions: DefaultDict[int, Transaction]
+    _transaction_ids_by_address: DefaultDict[str, List[int]]
+    _statistics: TransactionsStatistics
 
     def __init__(self) -> None:
         self._transactions = defaultdict()
+        self._transaction_ids_by_address = defaultdict(list)
+        self._statistics = TransactionsStatistics()
 
     # TRANSACTION
     def add_transaction(self, transaction: Transaction) -> None:
-        self._transactions[len(self._transactions)] = transaction
+        transaction_id: int = len(self._transactions) + 1  # as SQLite numbers them
+        self._transactions[transaction_id] = transaction
+        self._transaction_ids_by_address[transaction.get_from_address()].append(
+            transaction_id
+        )
+        if transaction.get_to_address() != transaction.get_from_address():
+            self._transaction_ids_by_address[transaction.get_to_address()].append(
+                transaction_id
+            )
+        self._statistics.number_of_transactions += 1
+        self._statistics.total_fee += transaction.get_fee()
 
     def get_wallet_transactions(self, address: str) -> List[Transaction]:
-        transactions: List[Transaction] = []
-        for _, transaction in self._transactions.items():
-            if (
-                transaction.get_from_address() == address
-                or transaction.get_to_address() == address
-            ):
-                transactions.append(transaction)
+        return [
+            self._transactions[transaction_id]
+            for transaction_id in self._transaction_ids_by_address.get(address, [])
+        ]
 
-        return transactions
+    def get_wallet_transactions_page(
+        self,
+        address: str,
+        limit: int,
+        after_id: Optional[int] = None,
+        direction: Direction = Direction.ASCENDING,
+    ) -> TransactionsPage:
+        transaction_ids: List[int] = self._transaction_ids_by_address.get(address, [])
+        if direction == Direction.ASCENDING:
+            start: int = (
+                0 if after_id is None else bisect_right(transaction_ids, after_id)
+            )
+            stop: int = start + limit + 1
+            page_ids: List[int] = transaction_ids[start:stop]
+        else:
+            stop = (
+                len(transaction_ids)
+                if after_id is None
+                else bisect_left(transaction_ids, after_id)
+            )
+            start = max(0, stop - limit - 1)
+            page_ids = transaction_ids[start:stop][::-1]
+
+        next_cursor: Optional[int] = (
+            page_ids[limit - 1] if len(page_ids) > limit else None
+        )
+        return TransactionsPage(
+            transactions=[self._transactions[i] for i in page_ids[:limit]],
+            next_cursor=next_cursor,
+        )
 
     def get_all_transactions(self) -> List[Transaction]:
         return list(self._transactions.values())
+
+    def iterate_all_transactions(self, batch_size: int) -> Iterator[Transaction]:
+        for transaction_id in range(1, len(self._transactions) + 1):
+            yield self._transactions[transaction_id]
+
+    def iterate_wallets_transactions(
+        self, addresses: Sequence[str], batch_size: int
+    ) -> Iterator[Transaction]:
+        last_id: int = 0
+        for transaction_id in merge(
+            *(self._transaction_ids_by_address.get(a, []) for a in set(addresses))
+        ):
+            if transaction_id != last_id:  # transfers between the given wallets
+                yield self._transactions[transaction_id]
+            last_id = transaction_id
+
+    def get_statistics(self) -> TransactionsStatistics:
+        return TransactionsStatistics(
+            number_of_transactions=self._statistics.number_of_transactions,
+            total_fee=self._statistics.total_fee,
+        )
@@ -0,0 +1,14 @@
+import threading
+from typing import Callable, TypeVar
+
+T = TypeVar("T")
+
+
+class InMemoryUnitOfWork:
+    def __init__(self) -> None:
+        self._lock = threading.RLock()
+
+    # the repositories have no transactions, so units of work run one at a time
+    def run(self, operation: Callable[[], T]) -> T:
+        with self._lock:
+            return operation()
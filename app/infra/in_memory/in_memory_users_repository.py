@@ -6,24 +6,25 @@ from app.core.users.interactor import User
 
 class InMemoryUsersRepository:
     _users: DefaultDict[int, User]
+    _users_by_username: DefaultDict[str, List[User]]
 
     def __init__(self) -> None:
         self._users = defaultdict()
+        self._users_by_username = defaultdict(list)
 
     # USER
     def add_user(self, new_user: User) -> bool:  # api_key is always unique
-        if new_user in list(self._users.values()):
+        same_username: List[User] = self._users_by_username[new_user.get_username()]
+        if new_user in same_username:
             return False
         else:
             self._users[new_user.get_user_id()] = new_user
+            same_username.append(new_user)
             return True
 
     def get_user_by_username(self, username: str) -> Optional[User]:
-        for _, current_user in self._users.items():
-            if current_user.get_username() == username:
-                return current_user
-
-        return None
+        same_username: Optional[List[User]] = self._users_by_username.get(username)
+        return same_username[0] if same_username else None
 
     def get_user_by_id(self, user_id: int) -> Optional[User]:
         return self._users.get(user_id, None)
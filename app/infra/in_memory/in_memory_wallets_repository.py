@@ -1,42 +1,55 @@
 from collections import defaultdict
-from typing import DefaultDict, List, Optional
+from typing import DefaultDict, List, Optional, Sequence
 
 from app.core.wallets.interactor import Wallet
 
 
 class InMemoryWalletsRepository:
     _wallets: DefaultDict[str, Wallet]
+    _addresses_by_owner: DefaultDict[int, List[str]]
 
     def __init__(self) -> None:
         self._wallets = defaultdict()
+        self._addresses_by_owner = defaultdict(list)
 
     # WALLET
     def add_wallet(
         self, wallet: Wallet
     ) -> None:  # address is generated by the system and is unique
+        if wallet.get_address() not in self._wallets:
+            self._addresses_by_owner[wallet.get_owner_id()].append(wallet.get_address())
         self._wallets[wallet.get_address()] = wallet
 
     def get_wallet(self, address: str) -> Optional[Wallet]:
         return self._wallets.get(address, None)
 
-    def deposit(self, address: str, amount: float) -> bool:
-        if address in self._wallets.keys():
+    def get_wallets(self, addresses: Sequence[str]) -> List[Wallet]:
+        return [
+            self._wallets[address] for address in addresses if address in self._wallets
+        ]
+
+    def deposit(self, address: str, amount: int) -> bool:
+        if amount > 0 and address in self._wallets.keys():
             self._wallets[address].deposit(amount=amount)
             return True
         return False
 
-    def withdraw(self, address: str, amount: float) -> bool:
-        if address in self._wallets.keys():
-            self._wallets[address].withdraw(amount=amount)
+    def withdraw(self, address: str, amount: int) -> bool:
+        wallet: Optional[Wallet] = self._wallets.get(address, None)
+        if (
+            wallet is not None
+            and amount > 0
+            and wallet.get_balance_in_satoshis() >= amount
+        ):
+            wallet.withdraw(amount=amount)
             return True
         return False
 
     def get_all_wallets_of_user(self, user_id: int) -> List[Wallet]:
-        user_wallets: List[Wallet] = []
-        for _, wallet in self._wallets.items():
-            if wallet.get_owner_id() == user_id:
-                user_wallets.append(wallet)
-        return user_wallets
+        return [
+            self._wallets[address]
+            for address in self._addresses_by_owner.get(user_id, [])
+        ]
 
     def get_number_of_wallets_of_user(self, user_id: int) -> int:
-        return len(self.get_all_wallets_of_user(user_id))
+        return len(self._addresses_by_owner.get(user_id, []))
@@ -0,0 +1,197 @@
+import inspect
+import time
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterable, List, Optional, TypeVar, cast
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.infra.cache.lru_cache import CacheStatistics
+from app.infra.metrics.registry import (
+    CallbackMetric,
+    Histogram,
+    HistogramFamily,
+    MetricsRegistry,
+    Sample,
+)
+
+T = TypeVar("T")
+
+# per-request durations by component, read for the Server-Timing header
+request_timings: ContextVar[Optional[Dict[str, float]]] = ContextVar(
+    "request_timings", default=None
+)
+
+
+def record(component: str, seconds: float) -> None:
+    timings: Optional[Dict[str, float]] = request_timings.get()
+    if timings is not None:
+        timings[component] = timings.get(component, 0.0) + seconds
+
+
+class _Timed:
+    def __init__(self, target: Any, histogram: HistogramFamily, component: str) -> None:
+        self._target = target
+        self._histogram = histogram
+        self._component = component
+
+    def __getattr__(self, name: str) -> Any:
+        attribute: Any = getattr(self._target, name)
+        if name.startswith("_") or not callable(attribute):
+            return attribute
+
+        wrapper: Callable[..., Any] = (
+            self._wrap_coroutine(name, attribute)
+            if inspect.iscoroutinefunction(attribute)
+            else self._wrap(name, attribute)
+        )
+        setattr(self, name, wrapper)  # later lookups skip __getattr__
+        return wrapper
+
+    def _wrap(self, name: str, method: Callable[..., Any]) -> Callable[..., Any]:
+        histogram: Histogram = self._histogram.labels(self._component, name)
+        component: str = self._component
+
+        def timed(*args: Any, **kwargs: Any) -> Any:
+            started: float = time.perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                seconds: float = time.perf_counter() - started
+                histogram.observe(seconds)
+                record(component, seconds)
+
+        return timed
+
+    def _wrap_coroutine(
+        self, name: str, method: Callable[..., Any]
+    ) -> Callable[..., Any]:
+        histogram: Histogram = self._histogram.labels(self._component, name)
+        component: str = self._component
+
+        async def timed(*args: Any, **kwargs: Any) -> Any:
+            started: float = time.perf_counter()
+            try:
+                return await method(*args, **kwargs)
+            finally:
+                seconds: float = time.perf_counter() - started
+                histogram.observe(seconds)
+                record(component, seconds)
+
+        return timed
+
+
+def timed(target: T, histogram: HistogramFamily, component: str) -> T:
+    return cast(T, _Timed(target, histogram, component))
+
+
+def cache_metrics(
+    caches: Dict[str, Callable[[], CacheStatistics]],
+) -> List[CallbackMetric]:
+    def collect(read: Callable[[CacheStatistics], float]) -> Iterable[Sample]:
+        return [((name,), read(statistics())) for name, statistics in caches.items()]
+
+    return [
+        CallbackMetric(
+            "cache_hits_total",
+            "Lookups answered from the cache",
+            "counter",
+            ("cache",),
+            lambda: collect(lambda statistics: statistics.hits),
+        ),
+        CallbackMetric(
+            "cache_misses_total",
+            "Lookups that fell through to the backing store",
+            "counter",
+            ("cache",),
+            lambda: collect(lambda statistics: statistics.misses),
+        ),
+        CallbackMetric(
+            "cache_evictions_total",
+            "Entries dropped to stay within capacity",
+            "counter",
+            ("cache",),
+            lambda: collect(lambda statistics: statistics.evictions),
+        ),
+        CallbackMetric(
+            "cache_hit_ratio",
+            "Share of lookups answered from the cache",
+            "gauge",
+            ("cache",),
+            lambda: collect(CacheStatistics.get_hit_ratio),
+        ),
+    ]
+
+
+def _server_timing(timings: Dict[str, float], total: float) -> str:
+    entries: List[str] = [
+        f"{component};dur={seconds * 1000:.3f}"
+        for component, seconds in timings.items()
+    ]
+    entries.append(f"app;dur={total * 1000:.3f}")
+    return ", ".join(entries)
+
+
+class MetricsMiddleware:
+    def __init__(self, app: ASGIApp, registry: MetricsRegistry) -> None:
+        self._app = app
+        self._histogram: HistogramFamily = registry.histogram(
+            "http_request_duration_seconds",
+            "Time spent answering HTTP requests",
+            ("method", "route", "status"),
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self._app(scope, receive, send)
+            return
+
+        timings: Dict[str, float] = {}
+        token = request_timings.set(timings)
+        started: float = time.perf_counter()
+        status_code: int = 500
+
+        async def send_with_server_timing(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                MutableHeaders(scope=message).append(
+                    "Server-Timing",
+                    _server_timing(timings, time.perf_counter() - started),
+                )
+            await send(message)
+
+        try:
+            await self._app(scope, receive, send_with_server_timing)
+        finally:
+            request_timings.reset(token)
+            # the route template, not the raw path, keeps the label set bounded
+            route: str = getattr(scope.get("route"), "path", "unmatched")
+            self._histogram.observe(
+                (scope["method"], route, str(status_code)),
+                time.perf_counter() - started,
+            )
+
+
+def timed_repository(
+    repository: T, registry: Optional[MetricsRegistry], name: str
+) -> T:
+    if registry is None:
+        return repository
+    histogram: HistogramFamily = registry.histogram(
+        "repository_call_duration_seconds",
+        "Time spent in repository methods",
+        ("repository", "method"),
+    )
+    return timed(repository, histogram, name)
+
+
+def timed_exchange_rate_source(source: T, registry: Optional[MetricsRegistry]) -> T:
+    if registry is None:
+        return source
+    histogram: HistogramFamily = registry.histogram(
+        "exchange_rate_fetch_duration_seconds",
+        "Time spent fetching the exchange rate",
+        ("source", "method"),
+    )
+    return timed(source, histogram, "exchange_rate")
@@ -0,0 +1,215 @@
+import random
+import sys
+import threading
+import time
+from collections import Counter
+from concurrent.futures import Executor, Future
+from contextvars import ContextVar
+from dataclasses import dataclass
+from types import FrameType
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+T = TypeVar("T")
+
+PROFILE_HEADER: bytes = b"x-profile"
+
+# the scope of the request being profiled, read when a use case is handed over
+_profiled_scope: ContextVar[Optional[Scope]] = ContextVar(
+    "profiled_scope", default=None
+)
+
+
+@dataclass(frozen=True)
+class ProfilingStatus:
+    sample_rate: float
+    profiled_requests: int
+    samples: int
+
+
+def _label(scope: Scope) -> str:
+    return f"{scope['method']} {getattr(scope.get('route'), 'path', scope['path'])}"
+
+
+def _frame_name(frame: FrameType) -> str:
+    module: str = frame.f_globals.get("__name__", "?")
+    return f"{module}.{frame.f_code.co_name}"
+
+
+class StackSampler:
+    def __init__(self, interval: float = 0.005) -> None:
+        self._interval = interval
+        self._lock = threading.Lock()
+        self._sample_rate: float = 0.0
+        self._profiled_requests: int = 0
+        self._stacks: "Counter[str]" = Counter()
+        # request frames on the event loop and use cases on worker threads
+        self._requests: Dict[FrameType, Scope] = {}
+        self._use_cases: Dict[int, Tuple[FrameType, Scope]] = {}
+        self._thread: Optional[threading.Thread] = None
+
+    # SESSION
+
+    def start(self, sample_rate: float) -> ProfilingStatus:
+        with self._lock:
+            self._sample_rate = sample_rate
+            self._profiled_requests = 0
+            self._stacks.clear()
+            self._ensure_sampling()
+        return self.status()
+
+    def stop(self) -> ProfilingStatus:
+        self._sample_rate = 0.0
+        return self.status()
+
+    def status(self) -> ProfilingStatus:
+        with self._lock:
+            return ProfilingStatus(
+                sample_rate=self._sample_rate,
+                profiled_requests=self._profiled_requests,
+                samples=sum(self._stacks.values()),
+            )
+
+    def collapsed_stacks(self) -> str:
+        with self._lock:
+            stacks: List[Tuple[str, int]] = sorted(self._stacks.items())
+        return "".join(f"{stack} {count}\n" for stack, count in stacks)
+
+    def should_sample(self) -> bool:
+        return self._sample_rate > 0 and random.random() < self._sample_rate
+
+    # REQUESTS
+
+    def begin_request(self, frame: FrameType, scope: Scope) -> None:
+        with self._lock:
+            self._requests[frame] = scope
+            self._profiled_requests += 1
+            self._ensure_sampling()
+
+    def end_request(self, frame: FrameType) -> None:
+        with self._lock:
+            del self._requests[frame]
+
+    def run_use_case(
+        self, scope: Scope, operation: Callable[..., T], *args: Any, **kwargs: Any
+    ) -> T:
+        thread_id: int = threading.get_ident()
+        with self._lock:
+            self._use_cases[thread_id] = (sys._getframe(), scope)
+            self._ensure_sampling()
+        try:
+            return operation(*args, **kwargs)
+        finally:
+            with self._lock:
+                del self._use_cases[thread_id]
+
+    # SAMPLING
+
+    def _ensure_sampling(self) -> None:
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._sample_while_busy, name="stack-sampler", daemon=True
+            )
+            self._thread.start()
+
+    def _sample_while_busy(self) -> None:
+        # runs while a session is open or a flagged request is in flight
+        while True:
+            with self._lock:
+                if not self._requests and not self._use_cases:
+                    if self._sample_rate == 0:
+                        self._thread = None  # the next profiled request starts one
+                        return
+                requests: Dict[FrameType, Scope] = dict(self._requests)
+                use_cases: Dict[int, Tuple[FrameType, Scope]] = dict(self._use_cases)
+
+            if requests or use_cases:
+                self._sample(requests, use_cases)
+            time.sleep(self._interval)
+
+    def _sample(
+        self,
+        requests: Dict[FrameType, Scope],
+        use_cases: Dict[int, Tuple[FrameType, Scope]],
+    ) -> None:
+        stacks: List[str] = []
+        for thread_id, frame in sys._current_frames().items():
+            if thread_id in use_cases:
+                root, scope = use_cases[thread_id]
+                stacks.append(self._collapse(frame, root, scope))
+                continue
+            stack: Optional[str] = self._collapse_request(frame, requests)
+            if stack is not None:
+                stacks.append(stack)
+        with self._lock:
+            self._stacks.update(stacks)
+
+    @staticmethod
+    def _collapse(frame: FrameType, root: FrameType, scope: Scope) -> str:
+        names: List[str] = []
+        current: Optional[FrameType] = frame
+        while current is not None and current is not root:
+            names.append(_frame_name(current))
+            current = current.f_back
+        names.append(_label(scope))
+        return ";".join(reversed(names))
+
+    @classmethod
+    def _collapse_request(
+        cls, frame: FrameType, requests: Dict[FrameType, Scope]
+    ) -> Optional[str]:
+        current: Optional[FrameType] = frame
+        while current is not None:
+            if current in requests:
+                return cls._collapse(frame, current, requests[current])
+            current = current.f_back
+        return None
+
+
+class ProfilingMiddleware:
+    def __init__(
+        self, app: ASGIApp, sampler: StackSampler, is_admin: Callable[[str], bool]
+    ) -> None:
+        self._app = app
+        self._sampler = sampler
+        self._is_admin = is_admin
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not self._should_profile(scope):
+            await self._app(scope, receive, send)
+            return
+
+        frame: FrameType = sys._getframe()  # stays the same across awaits
+        token = _profiled_scope.set(scope)
+        self._sampler.begin_request(frame, scope)
+        try:
+            await self._app(scope, receive, send)
+        finally:
+            self._sampler.end_request(frame)
+            _profiled_scope.reset(token)
+
+    def _should_profile(self, scope: Scope) -> bool:
+        if self._sampler.should_sample():
+            return True
+        for name, value in scope["headers"]:
+            if name == PROFILE_HEADER:
+                return self._is_admin(value.decode("latin-1"))
+        return False
+
+
+class ProfilingExecutor(Executor):
+    def __init__(self, executor: Executor, sampler: StackSampler) -> None:
+        self._executor = executor
+        self._sampler = sampler
+
+    def submit(self, fn: Callable[..., T], /, *args: Any, **kwargs: Any) -> "Future[T]":
+        scope: Optional[Scope] = _profiled_scope.get()
+        if scope is None:
+            return self._executor.submit(fn, *args, **kwargs)
+        return self._executor.submit(
+            self._sampler.run_use_case, scope, fn, *args, **kwargs
+        )
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:
+        self._executor.shutdown(wait, cancel_futures=cancel_futures)
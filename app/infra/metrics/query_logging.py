@@ -0,0 +1,51 @@
+import logging
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.infra.SQLlite.query_tracking import QueryStatistics, track_queries
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+class QueryLoggingMiddleware:
+    def __init__(self, app: ASGIApp) -> None:
+        self._app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self._app(scope, receive, send)
+            return
+
+        with track_queries() as statistics:
+            try:
+                await self._app(scope, receive, send)
+            finally:
+                _log(scope, statistics)
+
+
+def _log(scope: Scope, statistics: QueryStatistics) -> None:
+    request: str = (
+        f"{scope['method']} {getattr(scope.get('route'), 'path', scope['path'])}"
+    )
+    logger.info(
+        "%s ran %d SQL statements (%d rows, %.2f ms) on %d connections",
+        request,
+        statistics.statements,
+        statistics.rows,
+        statistics.seconds * 1000,
+        statistics.connections,
+        extra={
+            "request": request,
+            "sql_statements": statistics.statements,
+            "sql_rows": statistics.rows,
+            "sql_seconds": statistics.seconds,
+            "sql_connections": statistics.connections,
+        },
+    )
+    for sql, count in statistics.repeated_statements():
+        logger.warning(
+            "%s ran the same SQL statement %d times, a query in a loop? %s",
+            request,
+            count,
+            " ".join(sql.split()),
+        )
@@ -0,0 +1,152 @@
+import threading
+from bisect import bisect_left
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    0.0001,
+    0.00025,
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+)
+
+LabelValues = Tuple[str, ...]
+Sample = Tuple[LabelValues, float]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", r"\\").replace('"', r"\"").replace("\n", r"\n")
+
+
+def _labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    pairs: str = ",".join(
+        f'{name}="{_escape(value)}"' for name, value in zip(names, values)
+    )
+    return "{" + pairs + "}"
+
+
+class Histogram:
+    def __init__(self, buckets: Tuple[float, ...]) -> None:
+        self._buckets = buckets
+        self._bucket_counts: List[int] = [0] * (len(buckets) + 1)
+        self._sum: float = 0.0
+        self._count: int = 0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        index: int = bisect_left(self._buckets, value)
+        with self._lock:
+            self._bucket_counts[index] += 1
+            self._sum += value
+            self._count += 1
+
+    def snapshot(self) -> Tuple[List[int], float, int]:
+        with self._lock:
+            return list(self._bucket_counts), self._sum, self._count
+
+
+class HistogramFamily:
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        label_names: Sequence[str],
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> None:
+        self.name = name
+        self._documentation = documentation
+        self._label_names = tuple(label_names)
+        self._buckets = tuple(buckets)
+        self._histograms: Dict[LabelValues, Histogram] = {}
+        self._lock = threading.Lock()
+
+    def labels(self, *label_values: str) -> Histogram:
+        histogram: Optional[Histogram] = self._histograms.get(label_values)
+        if histogram is None:
+            with self._lock:
+                histogram = self._histograms.setdefault(
+                    label_values, Histogram(self._buckets)
+                )
+        return histogram
+
+    def observe(self, label_values: LabelValues, value: float) -> None:
+        self.labels(*label_values).observe(value)
+
+    def get_count(self, label_values: LabelValues) -> int:
+        histogram: Optional[Histogram] = self._histograms.get(label_values)
+        return 0 if histogram is None else histogram.snapshot()[2]
+
+    def render(self) -> Iterator[str]:
+        yield f"# HELP {self.name} {self._documentation}"
+        yield f"# TYPE {self.name} histogram"
+        with self._lock:
+            histograms: List[Tuple[LabelValues, Histogram]] = sorted(
+                self._histograms.items(), key=lambda item: item[0]
+            )
+        snapshot: List[Tuple[LabelValues, List[int], float, int]] = [
+            (values, *histogram.snapshot()) for values, histogram in histograms
+        ]
+        bucket_label_names: Tuple[str, ...] = self._label_names + ("le",)
+        for values, bucket_counts, total, count in snapshot:
+            cumulative: int = 0
+            for bound, bucket_count in zip(self._buckets, bucket_counts):
+                cumulative += bucket_count
+                labels: str = _labels(bucket_label_names, values + (repr(bound),))
+                yield f"{self.name}_bucket{labels} {cumulative}"
+            labels = _labels(bucket_label_names, values + ("+Inf",))
+            yield f"{self.name}_bucket{labels} {count}"
+            labels = _labels(self._label_names, values)
+            yield f"{self.name}_sum{labels} {total}"
+            yield f"{self.name}_count{labels} {count}"
+
+
+@dataclass
+class CallbackMetric:
+    # read at scrape time from a component that already keeps the numbers
+    name: str
+    documentation: str
+    type: str
+    label_names: Tuple[str, ...]
+    collect: Callable[[], Iterable[Sample]]
+
+    def render(self) -> Iterator[str]:
+        yield f"# HELP {self.name} {self.documentation}"
+        yield f"# TYPE {self.name} {self.type}"
+        for values, value in self.collect():
+            yield f"{self.name}{_labels(self.label_names, values)} {value}"
+
+
+class MetricsRegistry:
+    def __init__(self) -> None:
+        self._histograms: Dict[str, HistogramFamily] = {}
+        self._callbacks: List[CallbackMetric] = []
+
+    def histogram(
+        self, name: str, documentation: str, label_names: Sequence[str]
+    ) -> HistogramFamily:
+        if name not in self._histograms:
+            self._histograms[name] = HistogramFamily(name, documentation, label_names)
+        return self._histograms[name]
+
+    def register(self, metric: CallbackMetric) -> None:
+        self._callbacks.append(metric)
+
+    def render(self) -> str:
+        lines: List[str] = []
+        for histogram in self._histograms.values():
+            lines.extend(histogram.render())
+        for metric in self._callbacks:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
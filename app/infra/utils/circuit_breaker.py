@@ -0,0 +1,38 @@
+import time
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+CLOSED: str = "closed"
+OPEN: str = "open"
+HALF_OPEN: str = "half_open"
+
+
+@dataclass
+class CircuitBreaker:
+    failure_threshold: int = 3
+    reset_timeout: float = 30.0
+    _clock: Callable[[], float] = time.monotonic
+    _consecutive_failures: int = 0
+    _opened_at: Optional[float] = None
+
+    def get_state(self) -> str:
+        if self._opened_at is None:
+            return CLOSED
+        if self._clock() - self._opened_at >= self.reset_timeout:
+            return HALF_OPEN
+        return OPEN
+
+    def allow_request(self) -> bool:
+        return self.get_state() != OPEN
+
+    def record_success(self) -> None:
+        self._consecutive_failures = 0
+        self._opened_at = None
+
+    def record_failure(self) -> None:
+        self._consecutive_failures += 1
+        if (
+            self.get_state() == HALF_OPEN
+            or self._consecutive_failures >= self.failure_threshold
+        ):
+            self._opened_at = self._clock()
@@ -1,36 +1,143 @@
-from dataclasses import dataclass
-from typing import Any
+import asyncio
+import contextlib
+import logging
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from typing import Any, Callable, List, Optional, Protocol, Sequence
 
-import requests
+import httpx
+
+from app.core.facade import ExchangeRateUnavailableError
+from app.core.money import btc_to_satoshis, satoshis_to_btc
+from app.infra.utils.circuit_breaker import CircuitBreaker
+
+COINDESK_SOURCE: str = "https://api.coindesk.com/v1/bpi/currentprice/USD.json"
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+class IAsyncExchangeRateSource(Protocol):
+    async def fetch_exchange_rate(self) -> float:
+        pass
+
+
+class ExchangeRateConverter(ABC):
+    # converts at whatever rate the subclass currently holds
+    @abstractmethod
+    def _get_exchange_rate(self) -> float:
+        pass
+
+    def convert_to_usd(self, amount_in_satoshis: int) -> float:
+        return satoshis_to_btc(amount_in_satoshis) * self._get_exchange_rate()
+
+    def convert_all_to_usd(self, amounts_in_satoshis: Sequence[int]) -> List[float]:
+        rate: float = self._get_exchange_rate()
+        return [satoshis_to_btc(amount) * rate for amount in amounts_in_satoshis]
+
+    def convert_to_satoshis(self, amount_in_usd: float) -> int:
+        return btc_to_satoshis(amount_in_usd / self._get_exchange_rate())
 
 
 @dataclass
-class DefaultCurrencyConverter:
+class DefaultCurrencyConverter(ExchangeRateConverter):
     _exchange_rate: float = 20000.11
 
     def _get_exchange_rate(self) -> float:
         return self._exchange_rate
 
-    def convert_to_usd(self, amount_in_btc: float) -> float:
-        return amount_in_btc * self._get_exchange_rate()
 
-    def convert_to_btc(self, amount_in_usd: float) -> float:
-        return amount_in_usd / self._get_exchange_rate()
+@dataclass
+class AsyncCoindeskExchangeRateSource:
+    source: str = COINDESK_SOURCE
+    timeout: float = 5.0
+    _client: httpx.AsyncClient = field(default_factory=httpx.AsyncClient)
+
+    async def fetch_exchange_rate(self) -> float:
+        try:
+            response: httpx.Response = await self._client.get(
+                self.source, timeout=self.timeout
+            )
+            result: Any = response.json()["bpi"]["USD"]["rate_float"]
+        except (httpx.HTTPError, ValueError, KeyError, TypeError) as e:
+            raise ExchangeRateUnavailableError(str(e)) from e
+
+        if isinstance(result, (int, float)) and result > 0:
+            return float(result)
+        raise ExchangeRateUnavailableError(f"Invalid exchange rate: {result!r}")
+
+    async def close(self) -> None:
+        await self._client.aclose()
+
+
+@dataclass(frozen=True)
+class ExchangeRateSnapshot:
+    rate: float
+    fetched_at: float
 
 
 @dataclass
-class CoindeskCurrencyConverter:
-    source: str = "https://api.coindesk.com/v1/bpi/currentprice/USD.json"
+class AsyncRefreshingCurrencyConverter(ExchangeRateConverter):
+    _source: IAsyncExchangeRateSource
+    _refresh_interval: float = 15.0
+    _max_staleness: float = 300.0
+    _initial_refresh_timeout: float = 5.0
+    _circuit_breaker: CircuitBreaker = field(default_factory=CircuitBreaker)
+    _clock: Callable[[], float] = time.monotonic
+    _snapshot: Optional[ExchangeRateSnapshot] = None
+    _task: Optional["asyncio.Task[None]"] = None
 
-    def _get_exchange_rate(self) -> float:
-        result: Any = requests.get(self.source).json()["bpi"]["USD"]["rate_float"]
-        if isinstance(result, float):
-            return result
-        else:
-            return 1
+    async def start(self) -> None:
+        # serve a rate from the first request on, unless the source is slow
+        refreshed: bool = False
+        try:
+            refreshed = await asyncio.wait_for(
+                self.refresh(), self._initial_refresh_timeout
+            )
+        except asyncio.TimeoutError:
+            logger.warning(
+                "Initial exchange rate refresh timed out after %.1f s",
+                self._initial_refresh_timeout,
+            )
+        self._task = asyncio.get_running_loop().create_task(
+            self._run(refresh_first=not refreshed)
+        )
 
-    def convert_to_usd(self, amount_in_btc: float) -> float:
-        return amount_in_btc * self._get_exchange_rate()
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
 
-    def convert_to_btc(self, amount_in_usd: float) -> float:
-        return amount_in_usd / self._get_exchange_rate()
+    async def refresh(self) -> bool:
+        if not self._circuit_breaker.allow_request():
+            return False
+        try:
+            rate: float = await self._source.fetch_exchange_rate()
+        except Exception:
+            logger.warning("Exchange rate refresh failed", exc_info=True)
+            self._circuit_breaker.record_failure()
+            return False
+
+        self._circuit_breaker.record_success()
+        self._snapshot = ExchangeRateSnapshot(rate=rate, fetched_at=self._clock())
+        return True
+
+    def get_circuit_breaker(self) -> CircuitBreaker:
+        return self._circuit_breaker
+
+    async def _run(self, refresh_first: bool) -> None:
+        if not refresh_first:
+            await asyncio.sleep(self._refresh_interval)
+        while True:
+            await self.refresh()
+            await asyncio.sleep(self._refresh_interval)
+
+    def _get_exchange_rate(self) -> float:
+        snapshot: Optional[ExchangeRateSnapshot] = self._snapshot
+        if snapshot is None:
+            raise ExchangeRateUnavailableError("No exchange rate fetched yet")
+        if self._clock() - snapshot.fetched_at > self._max_staleness:
+            raise ExchangeRateUnavailableError("Exchange rate is too stale")
+        return snapshot.rate
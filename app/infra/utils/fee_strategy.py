@@ -2,20 +2,20 @@ from dataclasses import dataclass
 
 
 @dataclass
-class FeeRateStrategy:
-    fee_rate_for_different_owners: float = 0.015
-    fee_rate_for_same_owner: float = 0
-    fee_rate_for_deposit: float = 0
-    fee_rate_for_withdraw: float = 0
+class FeeRateStrategy:  # rates are in basis points, 150 is 1.5%
+    fee_rate_for_different_owners: int = 150
+    fee_rate_for_same_owner: int = 0
+    fee_rate_for_deposit: int = 0
+    fee_rate_for_withdraw: int = 0
 
-    def get_fee_rate_for_different_owners(self) -> float:
+    def get_fee_rate_for_different_owners(self) -> int:
         return self.fee_rate_for_different_owners
 
-    def get_fee_rate_for_same_owner(self) -> float:
+    def get_fee_rate_for_same_owner(self) -> int:
         return self.fee_rate_for_same_owner
 
-    def get_fee_rate_for_deposit(self) -> float:
+    def get_fee_rate_for_deposit(self) -> int:
         return self.fee_rate_for_deposit
 
-    def get_fee_rate_for_withdraw(self) -> float:
+    def get_fee_rate_for_withdraw(self) -> int:
         return self.fee_rate_for_withdraw
@@ -1,5 +1,7 @@
+from app.runner.configuration import Configuration
 from app.runner.setup import setup
 
 __all__ = [
+    "Configuration",
     "setup",
 ]
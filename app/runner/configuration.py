@@ -0,0 +1,35 @@
+from dataclasses import dataclass
+from typing import Optional
+
+from app.infra.utils.currency_converter import COINDESK_SOURCE
+
+SQLITE_BACKEND: str = "sqlite"
+IN_MEMORY_BACKEND: str = "memory"
+
+
+@dataclass(frozen=True)
+class Configuration:
+    backend: str = SQLITE_BACKEND
+    database_name: str = "bitcoin.db"
+    pool_size: int = 5
+    pool_checkout_timeout: float = 5.0
+    pragma_profile: str = "durable"
+    core_executor_workers: int = 5
+    group_commit: bool = False
+    group_commit_max_batch_size: int = 64
+    group_commit_max_delay: float = 0.002
+    exchange_rate_source: str = COINDESK_SOURCE
+    exchange_rate_refresh_interval: float = 15.0
+    exchange_rate_max_staleness: float = 300.0
+    exchange_rate_initial_refresh_timeout: float = 5.0
+    exchange_rate_failure_threshold: int = 3
+    exchange_rate_reset_timeout: float = 30.0
+    api_key_cache_capacity: int = 10_000
+    api_key_negative_cache_capacity: int = 10_000
+    api_key_negative_cache_time_to_live: float = 5.0
+    wallet_cache_capacity: int = 10_000
+    metrics: bool = True
+    query_logging: bool = True
+    slow_query_threshold: Optional[float] = 0.1
+    profiling: bool = True
+    profiling_sample_interval: float = 0.005
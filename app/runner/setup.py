@@ -1,32 +1,149 @@
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Optional, Tuple
+
 from fastapi import FastAPI
 
-from app.core.facade import BitcoinWalletCore
+from app.core.api_key.interactor import IAPIKeysRepository
+from app.core.facade import (
+    AsyncBitcoinWalletCore,
+    BitcoinWalletCore,
+    ExchangeRateUnavailableError,
+    IUnitOfWork,
+)
+from app.core.transactions.interactor import ITransactionsRepository
+from app.core.users.interactor import IUsersRepository
+from app.core.wallets.interactor import IWalletsRepository
+from app.infra.api.exception_handlers import exchange_rate_unavailable_handler
+from app.infra.api.metrics_api import metrics_api
+from app.infra.api.profiling_api import profiling_api
 from app.infra.api.statistics_api import statistics_api
 from app.infra.api.transactions_api import transactions_api
 from app.infra.api.users_api import users_api
 from app.infra.api.wallets_api import wallets_api
+from app.infra.cache.api_keys_repository import CachingAPIKeysRepository
+from app.infra.cache.wallets_repository import CachingWalletsRepository
+from app.infra.in_memory.in_memory_api_key_repository import InMemoryAPIKeyRepository
+from app.infra.in_memory.in_memory_transactions_repository import (
+    InMemoryTransactionsRepository,
+)
+from app.infra.in_memory.in_memory_unit_of_work import InMemoryUnitOfWork
+from app.infra.in_memory.in_memory_users_repository import InMemoryUsersRepository
+from app.infra.in_memory.in_memory_wallets_repository import InMemoryWalletsRepository
+from app.infra.metrics.instrumentation import (
+    MetricsMiddleware,
+    cache_metrics,
+    timed_exchange_rate_source,
+    timed_repository,
+)
+from app.infra.metrics.profiling import (
+    ProfilingExecutor,
+    ProfilingMiddleware,
+    StackSampler,
+)
+from app.infra.metrics.query_logging import QueryLoggingMiddleware
+from app.infra.metrics.registry import MetricsRegistry
 from app.infra.SQLlite.api_keys_repository import SQLAPIKeysRepository
+from app.infra.SQLlite.connection_pool import SQLiteConnectionPool
+from app.infra.SQLlite.group_commit import GroupCommitUnitOfWork
+from app.infra.SQLlite.pragmas import get_pragma_profile
 from app.infra.SQLlite.transactions_repository import SQLTransactionsRepository
+from app.infra.SQLlite.unit_of_work import SQLiteUnitOfWork
 from app.infra.SQLlite.users_repository import SQLUsersRepository
 from app.infra.SQLlite.wallets_repository import SQLWalletsRepository
-from app.infra.utils.currency_converter import CoindeskCurrencyConverter
+from app.infra.utils.circuit_breaker import CircuitBreaker
+from app.infra.utils.currency_converter import (
+    AsyncCoindeskExchangeRateSource,
+    AsyncRefreshingCurrencyConverter,
+    IAsyncExchangeRateSource,
+)
 from app.infra.utils.fee_strategy import FeeRateStrategy
 from app.infra.utils.generator import DefaultUniqueValueGenerators
 from app.infra.utils.hasher import DefaultHashFunction
+from app.runner.configuration import IN_MEMORY_BACKEND, SQLITE_BACKEND, Configuration
+
+Repositories = Tuple[
+    IUsersRepository,
+    IWalletsRepository,
+    ITransactionsRepository,
+    IAPIKeysRepository,
+    IUnitOfWork,
+]
 
 
-def setup() -> FastAPI:
+def setup(
+    configuration: Configuration = Configuration(),
+    exchange_rate_source: Optional[IAsyncExchangeRateSource] = None,
+) -> FastAPI:
     app = FastAPI()
 
     app.include_router(users_api)
     app.include_router(wallets_api)
     app.include_router(transactions_api)
     app.include_router(statistics_api)
+    app.add_exception_handler(
+        ExchangeRateUnavailableError, exchange_rate_unavailable_handler
+    )
+
+    metrics: Optional[MetricsRegistry] = None
+    if configuration.metrics:
+        metrics = MetricsRegistry()
+        app.add_middleware(MetricsMiddleware, registry=metrics)
+        app.include_router(metrics_api)
+    app.state.metrics = metrics
+    if configuration.query_logging:
+        app.add_middleware(QueryLoggingMiddleware)
+
+    executor: ThreadPoolExecutor = ThreadPoolExecutor(
+        max_workers=configuration.core_executor_workers,
+        thread_name_prefix="wallet-core",
+    )
+    app.add_event_handler("shutdown", executor.shutdown)
+    core_executor: Executor = executor
+    sampler: Optional[StackSampler] = None
+    if configuration.profiling:
+        sampler = StackSampler(interval=configuration.profiling_sample_interval)
+        core_executor = ProfilingExecutor(executor, sampler)
+        app.include_router(profiling_api)
+    app.state.profiler = sampler
 
-    user_repository: SQLUsersRepository = SQLUsersRepository()
-    wallets_repository: SQLWalletsRepository = SQLWalletsRepository()
-    transactions_repository: SQLTransactionsRepository = SQLTransactionsRepository()
-    api_keys_repository: SQLAPIKeysRepository = SQLAPIKeysRepository()
+    if configuration.backend == SQLITE_BACKEND:
+        repositories: Repositories = _sqlite_repositories(app, configuration, metrics)
+    elif configuration.backend == IN_MEMORY_BACKEND:
+        repositories = _in_memory_repositories(app, metrics)
+    else:
+        raise ValueError(f"Unknown backend: {configuration.backend!r}")
+    (
+        user_repository,
+        wallets_repository,
+        transactions_repository,
+        api_keys_repository,
+        unit_of_work,
+    ) = repositories
+    app.state.unit_of_work = unit_of_work
+
+    if exchange_rate_source is None:
+        coindesk: AsyncCoindeskExchangeRateSource = AsyncCoindeskExchangeRateSource(
+            source=configuration.exchange_rate_source
+        )
+        app.add_event_handler("shutdown", coindesk.close)
+        exchange_rate_source = coindesk
+    currency_converter: AsyncRefreshingCurrencyConverter = (
+        AsyncRefreshingCurrencyConverter(
+            _source=timed_exchange_rate_source(exchange_rate_source, metrics),
+            _refresh_interval=configuration.exchange_rate_refresh_interval,
+            _max_staleness=configuration.exchange_rate_max_staleness,
+            _initial_refresh_timeout=(
+                configuration.exchange_rate_initial_refresh_timeout
+            ),
+            _circuit_breaker=CircuitBreaker(
+                failure_threshold=configuration.exchange_rate_failure_threshold,
+                reset_timeout=configuration.exchange_rate_reset_timeout,
+            ),
+        )
+    )
+    app.state.currency_converter = currency_converter
+    app.add_event_handler("startup", currency_converter.start)
+    app.add_event_handler("shutdown", currency_converter.stop)
 
     app.state.core = BitcoinWalletCore.create(
         users_repository=user_repository,
@@ -34,9 +151,95 @@ def setup() -> FastAPI:
         transactions_repository=transactions_repository,
         api_key_repository=api_keys_repository,
         hash_function=DefaultHashFunction(),
-        currency_converter=CoindeskCurrencyConverter(),
+        currency_converter=currency_converter,
         fee_strategy=FeeRateStrategy(),
         unique_value_generator=DefaultUniqueValueGenerators(),
+        unit_of_work=unit_of_work,
+    )
+
+    app.state.async_core = AsyncBitcoinWalletCore(
+        _core=app.state.core, _executor=core_executor
     )
+    if sampler is not None:
+        app.add_middleware(
+            ProfilingMiddleware, sampler=sampler, is_admin=app.state.core.is_admin
+        )
 
     return app
+
+
+def _sqlite_repositories(
+    app: FastAPI, configuration: Configuration, metrics: Optional[MetricsRegistry]
+) -> Repositories:
+    pool: SQLiteConnectionPool = SQLiteConnectionPool(
+        database_name=configuration.database_name,
+        pool_size=configuration.pool_size,
+        checkout_timeout=configuration.pool_checkout_timeout,
+        pragma_profile=get_pragma_profile(configuration.pragma_profile),
+        slow_query_threshold=configuration.slow_query_threshold,
+    )
+    app.state.connection_pool = pool
+
+    unit_of_work: IUnitOfWork = SQLiteUnitOfWork(pool)
+    if configuration.group_commit:
+        group_commit: GroupCommitUnitOfWork = GroupCommitUnitOfWork(
+            pool,
+            max_batch_size=configuration.group_commit_max_batch_size,
+            max_delay=configuration.group_commit_max_delay,
+        )
+        app.add_event_handler("shutdown", group_commit.close)
+        unit_of_work = group_commit
+    app.add_event_handler("shutdown", pool.close)
+
+    user_repository: SQLUsersRepository = timed_repository(
+        SQLUsersRepository(pool), metrics, "users"
+    )
+    wallets_repository: CachingWalletsRepository = CachingWalletsRepository(
+        timed_repository(SQLWalletsRepository(pool), metrics, "wallets"),
+        transaction_events=pool,
+        capacity=configuration.wallet_cache_capacity,
+    )
+    app.state.wallets_repository = wallets_repository
+    transactions_repository: SQLTransactionsRepository = timed_repository(
+        SQLTransactionsRepository(pool), metrics, "transactions"
+    )
+    api_keys_repository: CachingAPIKeysRepository = CachingAPIKeysRepository(
+        timed_repository(SQLAPIKeysRepository(pool), metrics, "api_keys"),
+        capacity=configuration.api_key_cache_capacity,
+        negative_capacity=configuration.api_key_negative_cache_capacity,
+        negative_time_to_live=configuration.api_key_negative_cache_time_to_live,
+    )
+    app.state.api_keys_repository = api_keys_repository
+    if metrics is not None:
+        for metric in cache_metrics(
+            {
+                "api_keys": api_keys_repository.statistics,
+                "unknown_api_keys": api_keys_repository.negative_statistics,
+                "wallets": wallets_repository.statistics,
+            }
+        ):
+            metrics.register(metric)
+
+    return (
+        user_repository,
+        wallets_repository,
+        transactions_repository,
+        api_keys_repository,
+        unit_of_work,
+    )
+
+
+def _in_memory_repositories(
+    app: FastAPI, metrics: Optional[MetricsRegistry]
+) -> Repositories:
+    wallets_repository: InMemoryWalletsRepository = InMemoryWalletsRepository()
+    app.state.wallets_repository = wallets_repository
+    api_keys_repository: InMemoryAPIKeyRepository = InMemoryAPIKeyRepository()
+    app.state.api_keys_repository = api_keys_repository
+    return (
+        timed_repository(InMemoryUsersRepository(), metrics, "users"),
+        timed_repository(wallets_repository, metrics, "wallets"),
+        timed_repository(InMemoryTransactionsRepository(), metrics, "transactions"),
+        timed_repository(api_keys_repository, metrics, "api_keys"),
+        InMemoryUnitOfWork(),
+    )
@@ -0,0 +1,140 @@
+# Sustained transfer throughput with one commit per request versus the
+# group-commit writer.
+#
+#   python -m benchmarks.group_commit --threads 32 --transfers-per-thread 200
+#
+# Every thread moves money between its own two wallets, so each transfer is a
+# full read-check-write unit of work that ends in a durable commit.
+import argparse
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple
+
+from app.core.facade import BitcoinWalletCore, IUnitOfWork
+from app.infra.SQLlite.api_keys_repository import SQLAPIKeysRepository
+from app.infra.SQLlite.connection_pool import SQLiteConnectionPool
+from app.infra.SQLlite.group_commit import GroupCommitUnitOfWork
+from app.infra.SQLlite.transactions_repository import SQLTransactionsRepository
+from app.infra.SQLlite.unit_of_work import SQLiteUnitOfWork
+from app.infra.SQLlite.users_repository import SQLUsersRepository
+from app.infra.SQLlite.wallets_repository import SQLWalletsRepository
+from app.infra.utils.currency_converter import DefaultCurrencyConverter
+from app.infra.utils.fee_strategy import FeeRateStrategy
+from app.infra.utils.generator import DefaultUniqueValueGenerators
+from app.infra.utils.hasher import DefaultHashFunction
+from benchmarks.reporting import print_report, summarize_latencies
+
+
+def _core(pool: SQLiteConnectionPool, unit_of_work: IUnitOfWork) -> BitcoinWalletCore:
+    return BitcoinWalletCore.create(
+        users_repository=SQLUsersRepository(pool),
+        wallets_repository=SQLWalletsRepository(pool),
+        transactions_repository=SQLTransactionsRepository(pool),
+        api_key_repository=SQLAPIKeysRepository(pool),
+        hash_function=DefaultHashFunction(),
+        currency_converter=DefaultCurrencyConverter(),
+        fee_strategy=FeeRateStrategy(),
+        unique_value_generator=DefaultUniqueValueGenerators(),
+        unit_of_work=unit_of_work,
+    )
+
+
+def _measure(
+    core: BitcoinWalletCore, threads: int, transfers_per_thread: int
+) -> Dict[str, Any]:
+    accounts: List[Tuple[str, str, str]] = []
+    for thread in range(threads):
+        api_key: str = core.register_user(f"user{thread}", "password").api_key
+        first: str = core.create_wallet(api_key).wallet_info["address"]
+        second: str = core.create_wallet(api_key).wallet_info["address"]
+        accounts.append((api_key, first, second))
+
+    samples: List[float] = []
+    lock: threading.Lock = threading.Lock()
+
+    def transfer(api_key: str, first: str, second: str) -> None:
+        local: List[float] = []
+        for transfer_number in range(transfers_per_thread):
+            sender, receiver = (
+                (first, second) if transfer_number % 2 == 0 else (second, first)
+            )
+            started: float = time.perf_counter()
+            core.make_transaction(api_key, sender, receiver, 1_000)
+            local.append(time.perf_counter() - started)
+        with lock:
+            samples.extend(local)
+
+    workers: List[threading.Thread] = [
+        threading.Thread(target=transfer, args=account) for account in accounts
+    ]
+    started: float = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    elapsed: float = time.perf_counter() - started
+
+    return {
+        "transfers_per_second": len(samples) / elapsed,
+        **summarize_latencies(samples),
+    }
+
+
+def run(
+    threads: int,
+    transfers_per_thread: int,
+    max_batch_size: int,
+    max_delay: float,
+    directory: Path,
+) -> List[Dict[str, Any]]:
+    factories: Dict[str, Callable[[SQLiteConnectionPool], Any]] = {
+        "commit_per_request": SQLiteUnitOfWork,
+        "group_commit": lambda pool: GroupCommitUnitOfWork(
+            pool, max_batch_size=max_batch_size, max_delay=max_delay
+        ),
+    }
+    report: List[Dict[str, Any]] = []
+    for name, factory in factories.items():
+        pool: SQLiteConnectionPool = SQLiteConnectionPool(
+            database_name=str(directory / f"{name}.db"), pool_size=threads + 1
+        )
+        unit_of_work: Any = factory(pool)
+        report.append(
+            {
+                "unit_of_work": name,
+                "threads": threads,
+                **_measure(_core(pool, unit_of_work), threads, transfers_per_thread),
+            }
+        )
+        if isinstance(unit_of_work, GroupCommitUnitOfWork):
+            report[-1]["batches"] = unit_of_work.statistics().batches
+            unit_of_work.close()
+        pool.close()
+    return report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--threads", type=int, default=32)
+    parser.add_argument("--transfers-per-thread", type=int, default=200)
+    parser.add_argument("--max-batch-size", type=int, default=64)
+    parser.add_argument("--max-delay", type=float, default=0.002)
+    parser.add_argument("--directory", type=Path, default=None)
+    arguments = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temporary_directory:
+        print_report(
+            run(
+                threads=arguments.threads,
+                transfers_per_thread=arguments.transfers_per_thread,
+                max_batch_size=arguments.max_batch_size,
+                max_delay=arguments.max_delay,
+                directory=arguments.directory or Path(temporary_directory),
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
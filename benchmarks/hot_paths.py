@@ -0,0 +1,132 @@
+# The hot paths the regression check times: the core use cases on SQLite and
+# every repository method that serves them, on a seeded database. Whole-table
+# reads are left out because their cost grows with the writes the other cases
+# make, and create_wallet because a user holds at most three wallets.
+import itertools
+import random
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
+
+from app.core.facade import ADMIN_API_KEY, BitcoinWalletCore
+from app.core.transactions.interactor import Transaction
+from app.core.users.interactor import User
+from app.core.wallets.interactor import Wallet
+from app.infra.SQLlite.api_keys_repository import SQLAPIKeysRepository
+from app.infra.SQLlite.connection_pool import SQLiteConnectionPool
+from app.infra.SQLlite.transactions_repository import SQLTransactionsRepository
+from app.infra.SQLlite.unit_of_work import SQLiteUnitOfWork
+from app.infra.SQLlite.users_repository import SQLUsersRepository
+from app.infra.SQLlite.wallets_repository import SQLWalletsRepository
+from app.infra.utils.currency_converter import DefaultCurrencyConverter
+from app.infra.utils.fee_strategy import FeeRateStrategy
+from app.infra.utils.generator import DefaultUniqueValueGenerators
+from app.infra.utils.hasher import DefaultHashFunction
+
+Case = Callable[[], Any]
+
+SEEDED_USERS: int = 200
+SEEDED_TRANSACTIONS: int = 5_000
+HISTORY_PAGE_SIZE: int = 20
+
+
+def build_cases(pool: SQLiteConnectionPool) -> Dict[str, Case]:
+    users: SQLUsersRepository = SQLUsersRepository(pool)
+    wallets: SQLWalletsRepository = SQLWalletsRepository(pool)
+    transactions: SQLTransactionsRepository = SQLTransactionsRepository(pool)
+    api_keys: SQLAPIKeysRepository = SQLAPIKeysRepository(pool)
+    core: BitcoinWalletCore = BitcoinWalletCore.create(
+        users_repository=users,
+        wallets_repository=wallets,
+        transactions_repository=transactions,
+        api_key_repository=api_keys,
+        hash_function=DefaultHashFunction(),
+        currency_converter=DefaultCurrencyConverter(),
+        fee_strategy=FeeRateStrategy(),
+        unique_value_generator=DefaultUniqueValueGenerators(),
+        unit_of_work=SQLiteUnitOfWork(pool),
+    )
+
+    rng: random.Random = random.Random(0)
+    api_key: str = core.register_user("owner", "password").api_key
+    first: str = core.create_wallet(api_key).wallet_info["address"]
+    second: str = core.create_wallet(api_key).wallet_info["address"]
+    with pool.connection():  # one transaction for the whole seed
+        for number in range(SEEDED_USERS):
+            users.add_user(User(0, f"seeded-{number}", "password"))
+            seeded: Optional[User] = users.get_user_by_username(f"seeded-{number}")
+            assert seeded is not None
+            for wallet in range(3):
+                wallets.add_wallet(
+                    Wallet(seeded.get_user_id(), f"{number}-{wallet}", 10**12)
+                )
+        for _ in range(SEEDED_TRANSACTIONS):
+            transactions.add_transaction(
+                Transaction(
+                    f"{rng.randrange(SEEDED_USERS)}-0",
+                    rng.choice((first, second, f"{rng.randrange(SEEDED_USERS)}-1")),
+                    rng.randint(1, 10_000),
+                    0,
+                )
+            )
+
+    user_id: int = wallets.get_wallets(["7-0"])[0].get_owner_id()
+    counter: Iterator[int] = itertools.count()
+    transfer_directions: Iterator[Tuple[str, str]] = itertools.cycle(
+        ((first, second), (second, first))
+    )
+
+    def make_transaction() -> Any:
+        sender, receiver = next(transfer_directions)
+        return core.make_transaction(api_key, sender, receiver, 1_000)
+
+    return {
+        "core.register_user": lambda: core.register_user(
+            f"user-{next(counter)}", "password"
+        ),
+        "core.get_wallet": lambda: core.get_wallet(api_key, first),
+        "core.get_wallets_of_user": lambda: core.get_wallets_of_user(api_key),
+        "core.get_wallets": lambda: core.get_wallets(api_key, [first, second]),
+        "core.get_transactions_page_of_wallet": (
+            lambda: core.get_transactions_page_of_wallet(
+                api_key, first, HISTORY_PAGE_SIZE
+            )
+        ),
+        "core.make_transaction": make_transaction,
+        "core.deposit": lambda: core.deposit(api_key, first, 1.0),
+        "core.withdraw": lambda: core.withdraw(api_key, first, 1.0),
+        "core.get_statistics": lambda: core.get_statistics(ADMIN_API_KEY),
+        "users.add_user": lambda: users.add_user(
+            User(0, f"added-{next(counter)}", "password")
+        ),
+        "users.get_user_by_username": lambda: users.get_user_by_username("seeded-7"),
+        "users.get_user_by_id": lambda: users.get_user_by_id(user_id),
+        "users.get_max_user_id": users.get_max_user_id,
+        "wallets.add_wallet": lambda: wallets.add_wallet(
+            Wallet(0, f"added-{next(counter)}", 0)  # no reader looks up owner 0
+        ),
+        "wallets.get_wallet": lambda: wallets.get_wallet("7-0"),
+        "wallets.get_wallets": lambda: wallets.get_wallets(["7-0", "7-1", "7-2"]),
+        "wallets.deposit": lambda: wallets.deposit("7-0", 1),
+        "wallets.withdraw": lambda: wallets.withdraw("7-0", 1),
+        "wallets.get_all_wallets_of_user": lambda: wallets.get_all_wallets_of_user(
+            user_id
+        ),
+        "wallets.get_number_of_wallets_of_user": (
+            lambda: wallets.get_number_of_wallets_of_user(user_id)
+        ),
+        "transactions.add_transaction": lambda: transactions.add_transaction(
+            Transaction("7-0", "8-0", 1, 0)
+        ),
+        "transactions.get_wallet_transactions": (
+            lambda: transactions.get_wallet_transactions("7-1")
+        ),
+        "transactions.get_wallet_transactions_page": (
+            lambda: transactions.get_wallet_transactions_page(first, HISTORY_PAGE_SIZE)
+        ),
+        "transactions.get_statistics": transactions.get_statistics,
+        "api_keys.add_api_key_id_pair": lambda: api_keys.add_api_key_id_pair(
+            f"added-{next(counter)}", user_id
+        ),
+        "api_keys.get_user_id_by_api_key": lambda: api_keys.get_user_id_by_api_key(
+            api_key
+        ),
+    }
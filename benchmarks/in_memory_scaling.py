@@ -0,0 +1,123 @@
+# Lookup latency of the in-memory repositories while they grow.
+#
+#   python -m benchmarks.in_memory_scaling --users 1000000 --transactions 10000000
+#
+# Users, wallets and transactions are added in steps up to the requested totals;
+# after each step the indexed lookups are timed on random keys.
+import argparse
+import random
+import time
+from typing import Any, Callable, Dict, List
+
+from app.core.transactions.interactor import Transaction
+from app.core.users.interactor import User
+from app.core.wallets.interactor import Wallet
+from app.infra.in_memory.in_memory_transactions_repository import (
+    InMemoryTransactionsRepository,
+)
+from app.infra.in_memory.in_memory_users_repository import InMemoryUsersRepository
+from app.infra.in_memory.in_memory_wallets_repository import InMemoryWalletsRepository
+from benchmarks.reporting import print_report, summarize_latencies
+
+WALLETS_PER_USER: int = 3
+STEPS: int = 4
+
+
+def _username(user_id: int) -> str:
+    return f"user-{user_id:09d}"
+
+
+def _address(wallet_number: int) -> str:
+    return f"wallet-{wallet_number:010d}"
+
+
+def _time(operation: Callable[[], Any], repeat: int) -> Dict[str, float]:
+    samples: List[float] = []
+    for _ in range(repeat):
+        started: float = time.perf_counter()
+        operation()
+        samples.append(time.perf_counter() - started)
+    return summarize_latencies(samples)
+
+
+def _checkpoints(total: int) -> List[int]:
+    return [max(1, total // 10 ** (STEPS - step)) for step in range(1, STEPS + 1)]
+
+
+def run(users: int, transactions: int, lookups: int) -> List[Dict[str, Any]]:
+    rng: random.Random = random.Random(0)
+    users_repository: InMemoryUsersRepository = InMemoryUsersRepository()
+    wallets_repository: InMemoryWalletsRepository = InMemoryWalletsRepository()
+    transactions_repository = InMemoryTransactionsRepository()
+
+    report: List[Dict[str, Any]] = []
+    user_count: int = 0
+    transaction_count: int = 0
+    for user_target, transaction_target in zip(
+        _checkpoints(users), _checkpoints(transactions)
+    ):
+        for user_id in range(user_count, user_target):
+            users_repository.add_user(User(user_id, _username(user_id), "password"))
+            for wallet in range(WALLETS_PER_USER):
+                wallets_repository.add_wallet(
+                    Wallet(user_id, _address(user_id * WALLETS_PER_USER + wallet), 1)
+                )
+        user_count = user_target
+
+        wallet_count: int = user_count * WALLETS_PER_USER
+        for _ in range(transaction_count, transaction_target):
+            transactions_repository.add_transaction(
+                Transaction(
+                    _address(rng.randrange(wallet_count)),
+                    _address(rng.randrange(wallet_count)),
+                    1,
+                    0,
+                )
+            )
+        transaction_count = transaction_target
+
+        report.append(
+            {
+                "users": user_count,
+                "transactions": transaction_count,
+                "get_user_by_username": _time(
+                    lambda: users_repository.get_user_by_username(
+                        _username(rng.randrange(user_count))
+                    ),
+                    lookups,
+                ),
+                "add_user_duplicate_check": _time(
+                    lambda: users_repository.add_user(
+                        User(-1, _username(rng.randrange(user_count)), "password")
+                    ),
+                    lookups,
+                ),
+                "get_all_wallets_of_user": _time(
+                    lambda: wallets_repository.get_all_wallets_of_user(
+                        rng.randrange(user_count)
+                    ),
+                    lookups,
+                ),
+                "get_wallet_transactions": _time(
+                    lambda: transactions_repository.get_wallet_transactions(
+                        _address(rng.randrange(wallet_count))
+                    ),
+                    lookups,
+                ),
+            }
+        )
+    return report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--users", type=int, default=1_000_000)
+    parser.add_argument("--transactions", type=int, default=10_000_000)
+    parser.add_argument("--lookups", type=int, default=10_000)
+    arguments = parser.parse_args()
+
+    print_report(run(arguments.users, arguments.transactions, arguments.lookups))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+# Cost of the built-in metrics: the same HTTP workload against an application
+# with instrumentation turned on and one with it turned off.
+#
+#   python -m benchmarks.instrumentation_overhead --rounds 10 --requests 500
+#
+# Requests go through the ASGI stack in-process, so the comparison includes
+# routing, the middleware, the executor hop and SQLite but no network. Rounds
+# alternate between the two applications to spread out machine noise.
+import argparse
+import statistics
+import time
+from typing import Any, Dict, List, Tuple
+
+import anyio
+import httpx
+from fastapi import FastAPI
+
+from app import runner
+from app.core.wallets.interactor import Wallet
+from app.infra.metrics.instrumentation import timed
+from app.infra.metrics.registry import HistogramFamily, MetricsRegistry
+from app.infra.SQLlite.connection_pool import MEMORY_DATABASE
+from benchmarks.reporting import print_report, summarize_latencies
+
+
+async def _seed(client: httpx.AsyncClient, app: FastAPI) -> Tuple[str, str, str]:
+    registered: httpx.Response = await client.post(
+        "/users", params={"username": "user", "password": "password"}
+    )
+    api_key: str = registered.json()["api_key"]
+    user_id: int = app.state.api_keys_repository.get_user_id_by_api_key(api_key)
+    for address in ("first", "second"):  # seeded directly: no exchange rate needed
+        app.state.wallets_repository.add_wallet(
+            Wallet(_user_id=user_id, _address=address, _balance_satoshis=10**12)
+        )
+    return api_key, "first", "second"
+
+
+async def _round(
+    client: httpx.AsyncClient, account: Tuple[str, str, str], requests: int
+) -> List[float]:
+    api_key, first, second = account
+    samples: List[float] = []
+    for request in range(requests):
+        started: float = time.perf_counter()
+        if request % 2 == 0:
+            response: httpx.Response = await client.post(
+                "/transactions",
+                params={
+                    "api_key": api_key,
+                    "from_address": first,
+                    "to_address": second,
+                    "amount": 0.0001,
+                },
+            )
+        else:
+            response = await client.get(
+                f"/wallets/{second}/transactions",
+                params={"api_key": api_key, "limit": 10, "direction": "desc"},
+            )
+        samples.append(time.perf_counter() - started)
+        assert response.status_code < 300, response.text
+    return samples
+
+
+async def _run(rounds: int, requests: int) -> List[Dict[str, Any]]:
+    variants: Dict[str, FastAPI] = {
+        name: runner.setup(
+            runner.Configuration(database_name=MEMORY_DATABASE, metrics=enabled)
+        )
+        for name, enabled in (("metrics_off", False), ("metrics_on", True))
+    }
+    clients: Dict[str, httpx.AsyncClient] = {
+        name: httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://benchmark"
+        )
+        for name, app in variants.items()
+    }
+    accounts: Dict[str, Tuple[str, str, str]] = {
+        name: await _seed(clients[name], app) for name, app in variants.items()
+    }
+    for name in variants:  # warm-up
+        await _round(clients[name], accounts[name], requests // 10 or 1)
+
+    samples: Dict[str, List[float]] = {name: [] for name in variants}
+    round_times: Dict[str, List[float]] = {name: [] for name in variants}
+    for round_number in range(rounds):
+        order: List[str] = list(variants)
+        if round_number % 2:
+            order.reverse()
+        for name in order:
+            latencies: List[float] = await _round(
+                clients[name], accounts[name], requests
+            )
+            samples[name].extend(latencies)
+            round_times[name].append(sum(latencies))
+    for client in clients.values():
+        await client.aclose()
+
+    # rounds are paired, so drift of the machine cancels out of each ratio
+    ratios: List[float] = [
+        on / off
+        for on, off in zip(round_times["metrics_on"], round_times["metrics_off"])
+    ]
+    report: List[Dict[str, Any]] = [
+        {
+            "variant": name,
+            "requests_per_second": requests / statistics.median(round_times[name]),
+            **summarize_latencies(samples[name]),
+        }
+        for name in variants
+    ]
+    report.append(
+        {
+            "overhead_percent": (statistics.median(ratios) - 1) * 100,
+            "repository_call_overhead_ns": _call_overhead_ns(),
+        }
+    )
+    return report
+
+
+def _call_overhead_ns(calls: int = 200_000) -> float:
+    class Repository:
+        def get(self) -> int:
+            return 1
+
+    histogram: HistogramFamily = MetricsRegistry().histogram(
+        "calls", "Calls", ("repository", "method")
+    )
+    durations: List[float] = []
+    for repository in (Repository(), timed(Repository(), histogram, "repository")):
+        started: float = time.perf_counter()
+        for _ in range(calls):
+            repository.get()
+        durations.append(time.perf_counter() - started)
+    return (durations[1] - durations[0]) / calls * 1e9
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rounds", type=int, default=10)
+    parser.add_argument("--requests", type=int, default=500)
+    arguments = parser.parse_args()
+
+    print_report(anyio.run(_run, arguments.rounds, arguments.requests))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+# Load test of the HTTP API: a seeded closed-loop workload against the
+# application from runner.setup, in-process and behind uvicorn, on the SQLite
+# and the in-memory backends.
+#
+#   python -m benchmarks.load --concurrency 16 --requests 4000 --seed 0 \
+#       --mix transfer=40,read_wallet=20,list_wallets=10,read_transactions=20,\
+#   statistics=5,register=5
+#
+# Every virtual user registers, creates its wallets and then sends its share of
+# the mixed requests one after another. The same seed yields the same requests.
+# The exchange rate comes from a stub, so no network is needed.
+import argparse
+import tempfile
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, DefaultDict, Dict, List
+
+import anyio
+import httpx
+
+from app.runner.configuration import IN_MEMORY_BACKEND, SQLITE_BACKEND
+from benchmarks.load.drivers import DRIVERS
+from benchmarks.load.workload import DEFAULT_MIX, Request, VirtualUser, parse_mix
+from benchmarks.reporting import print_report, summarize_latencies
+
+
+class _Recorder:
+    def __init__(self, client: httpx.AsyncClient) -> None:
+        self._client = client
+        self.samples: DefaultDict[str, List[float]] = defaultdict(list)
+        self.errors: DefaultDict[str, int] = defaultdict(int)
+
+    async def send(self, request: Request) -> httpx.Response:
+        started: float = time.perf_counter()
+        response: httpx.Response = await self._client.request(
+            request.method, request.url, params=request.params
+        )
+        self.samples[request.endpoint].append(time.perf_counter() - started)
+        if response.status_code >= 400:
+            self.errors[request.endpoint] += 1
+        return response
+
+
+async def _prepare(recorder: _Recorder, user: VirtualUser, wallets: int) -> None:
+    registered: httpx.Response = await recorder.send(user.register())
+    registered.raise_for_status()
+    user.api_key = registered.json()["api_key"]
+    for _ in range(wallets):
+        created: httpx.Response = await recorder.send(user.create_wallet())
+        created.raise_for_status()
+        user.addresses.append(created.json()["wallet_info"]["address"])
+
+
+async def _drive(
+    recorder: _Recorder,
+    user: VirtualUser,
+    requests: int,
+    weights: Dict[str, int],
+    peers: List[str],
+) -> None:
+    for _ in range(requests):
+        await recorder.send(user.next_request(weights, peers))
+
+
+async def _scenario(
+    client: httpx.AsyncClient, arguments: argparse.Namespace
+) -> Dict[str, Any]:
+    weights: Dict[str, int] = parse_mix(arguments.mix)
+    users: List[VirtualUser] = [
+        VirtualUser(number, arguments.seed) for number in range(arguments.concurrency)
+    ]
+    recorder: _Recorder = _Recorder(client)
+
+    started: float = time.perf_counter()
+    async with anyio.create_task_group() as group:
+        for user in users:
+            group.start_soon(_prepare, recorder, user, arguments.wallets)
+    peers: List[str] = [address for user in users for address in user.addresses]
+    per_user: int = arguments.requests // arguments.concurrency
+    async with anyio.create_task_group() as group:
+        for user in users:
+            group.start_soon(_drive, recorder, user, per_user, weights, peers)
+    duration: float = time.perf_counter() - started
+
+    total: int = sum(len(samples) for samples in recorder.samples.values())
+    return {
+        "requests": total,
+        "errors": sum(recorder.errors.values()),
+        "duration_seconds": duration,
+        "requests_per_second": total / duration,
+        "endpoints": {
+            endpoint: {
+                "requests_per_second": len(samples) / duration,
+                "errors": recorder.errors[endpoint],
+                **summarize_latencies(samples),
+            }
+            for endpoint, samples in sorted(recorder.samples.items())
+        },
+    }
+
+
+async def _run(arguments: argparse.Namespace) -> List[Dict[str, Any]]:
+    report: List[Dict[str, Any]] = []
+    for backend in arguments.backend:
+        for driver in arguments.driver:
+            with tempfile.TemporaryDirectory() as directory:
+                database_name: str = str(Path(directory) / "load.db")
+                async with DRIVERS[driver](
+                    backend, database_name, arguments.concurrency
+                ) as client:
+                    result: Dict[str, Any] = await _scenario(client, arguments)
+            report.append(
+                {
+                    "backend": backend,
+                    "driver": driver,
+                    "concurrency": arguments.concurrency,
+                    "seed": arguments.seed,
+                    **result,
+                }
+            )
+    return report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--backend",
+        nargs="+",
+        choices=(SQLITE_BACKEND, IN_MEMORY_BACKEND),
+        default=[SQLITE_BACKEND, IN_MEMORY_BACKEND],
+    )
+    parser.add_argument(
+        "--driver", nargs="+", choices=tuple(DRIVERS), default=list(DRIVERS)
+    )
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--requests", type=int, default=4000)
+    parser.add_argument("--wallets", type=int, default=2)
+    parser.add_argument("--mix", default=DEFAULT_MIX)
+    parser.add_argument("--seed", type=int, default=0)
+    arguments = parser.parse_args()
+
+    print_report(anyio.run(_run, arguments))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,20 @@
+from fastapi import FastAPI
+
+from app import runner
+
+STUB_EXCHANGE_RATE: float = 20000.0
+
+
+class StubExchangeRateSource:
+    def __init__(self, rate: float = STUB_EXCHANGE_RATE) -> None:
+        self._rate = rate
+
+    async def fetch_exchange_rate(self) -> float:
+        return self._rate
+
+
+def build_app(backend: str, database_name: str) -> FastAPI:
+    return runner.setup(
+        runner.Configuration(backend=backend, database_name=database_name),
+        exchange_rate_source=StubExchangeRateSource(),
+    )
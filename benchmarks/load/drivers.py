@@ -0,0 +1,75 @@
+import socket
+import subprocess
+import sys
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+import anyio
+import httpx
+
+from benchmarks.load.app import build_app
+
+SERVER_START_TIMEOUT: float = 30.0
+
+
+@asynccontextmanager
+async def in_process(
+    backend: str, database_name: str, concurrency: int
+) -> AsyncIterator[httpx.AsyncClient]:
+    app = build_app(backend, database_name)
+    await app.router.startup()  # the ASGI transport does not run lifespan events
+    await app.state.currency_converter.refresh()
+    try:
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://load-test"
+        ) as client:
+            yield client
+    finally:
+        await app.router.shutdown()
+
+
+@asynccontextmanager
+async def uvicorn_server(
+    backend: str, database_name: str, concurrency: int
+) -> AsyncIterator[httpx.AsyncClient]:
+    port: int = _free_port()
+    server: subprocess.Popen[bytes] = subprocess.Popen(
+        [sys.executable, "-m", "benchmarks.load.serve"]
+        + ["--backend", backend, "--database", database_name, "--port", str(port)]
+    )
+    try:
+        async with httpx.AsyncClient(
+            base_url=f"http://127.0.0.1:{port}",
+            limits=httpx.Limits(max_connections=concurrency),
+        ) as client:
+            await _wait_until_serving(client, server)
+            yield client
+    finally:
+        server.terminate()
+        server.wait()
+
+
+DRIVERS = {"in_process": in_process, "uvicorn": uvicorn_server}
+
+
+def _free_port() -> int:
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        port: int = probe.getsockname()[1]
+        return port
+
+
+async def _wait_until_serving(
+    client: httpx.AsyncClient, server: "subprocess.Popen[bytes]"
+) -> None:
+    deadline: float = time.monotonic() + SERVER_START_TIMEOUT
+    while time.monotonic() < deadline:
+        if server.poll() is not None:
+            raise RuntimeError(f"uvicorn exited with {server.returncode}")
+        try:
+            await client.get("/openapi.json")
+            return
+        except httpx.TransportError:
+            await anyio.sleep(0.05)
+    raise RuntimeError(f"uvicorn did not start in {SERVER_START_TIMEOUT} seconds")
@@ -0,0 +1,28 @@
+# Serves the load-test application on its own uvicorn process.
+#
+#   python -m benchmarks.load.serve --backend sqlite --database load.db --port 8001
+import argparse
+
+import uvicorn
+
+from benchmarks.load.app import build_app
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--backend", required=True)
+    parser.add_argument("--database", required=True)
+    parser.add_argument("--port", type=int, required=True)
+    arguments = parser.parse_args()
+
+    uvicorn.run(
+        build_app(arguments.backend, arguments.database),
+        host="127.0.0.1",
+        port=arguments.port,
+        log_level="warning",
+        access_log=False,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+import random
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.core.facade import ADMIN_API_KEY
+from app.core.money import satoshis_to_btc
+
+OPERATIONS: Tuple[str, ...] = (
+    "transfer",
+    "read_wallet",
+    "list_wallets",
+    "read_transactions",
+    "statistics",
+    "register",
+)
+
+DEFAULT_MIX: str = (
+    "transfer=40,read_wallet=20,list_wallets=10,read_transactions=20,"
+    "statistics=5,register=5"
+)
+
+
+@dataclass(frozen=True)
+class Request:
+    endpoint: str  # route template, the key latencies are reported under
+    method: str
+    url: str
+    params: Dict[str, Any]
+
+
+def parse_mix(mix: str) -> Dict[str, int]:
+    weights: Dict[str, int] = {}
+    for entry in mix.split(","):
+        operation, _, weight = entry.partition("=")
+        if operation.strip() not in OPERATIONS:
+            raise ValueError(f"Unknown operation in mix: {operation!r}")
+        weights[operation.strip()] = int(weight)
+    if sum(weights.values()) <= 0:
+        raise ValueError("The mix needs at least one positive weight")
+    return weights
+
+
+@dataclass
+class VirtualUser:
+    number: int
+    seed: int
+    api_key: Optional[str] = None
+    addresses: List[str] = field(default_factory=list)
+    _registrations: int = 0
+
+    def __post_init__(self) -> None:
+        self._rng: random.Random = random.Random(f"{self.seed}-{self.number}")
+
+    def register(self) -> Request:
+        return Request(
+            endpoint="POST /users",
+            method="POST",
+            url="/users",
+            params={"username": f"load-user-{self.number}", "password": "password"},
+        )
+
+    def create_wallet(self) -> Request:
+        return Request(
+            endpoint="POST /wallets",
+            method="POST",
+            url="/wallets",
+            params={"api_key": self.api_key},
+        )
+
+    def next_request(self, weights: Dict[str, int], peers: List[str]) -> Request:
+        operation: str = self._rng.choices(
+            list(weights), weights=list(weights.values())
+        )[0]
+        address: str = self._rng.choice(self.addresses)
+        if operation == "transfer":
+            return Request(
+                endpoint="POST /transactions",
+                method="POST",
+                url="/transactions",
+                params={
+                    "api_key": self.api_key,
+                    "from_address": address,
+                    "to_address": self._peer(address, peers),
+                    "amount": satoshis_to_btc(self._rng.randint(1, 10_000)),
+                },
+            )
+        if operation == "read_wallet":
+            return Request(
+                endpoint="GET /wallets/{address}",
+                method="GET",
+                url=f"/wallets/{address}",
+                params={"api_key": self.api_key},
+            )
+        if operation == "list_wallets":
+            return Request(
+                endpoint="GET /wallets",
+                method="GET",
+                url="/wallets",
+                params={"api_key": self.api_key},
+            )
+        if operation == "read_transactions":
+            return Request(
+                endpoint="GET /wallets/{address}/transactions",
+                method="GET",
+                url=f"/wallets/{address}/transactions",
+                params={"api_key": self.api_key, "limit": 20, "direction": "desc"},
+            )
+        if operation == "statistics":
+            return Request(
+                endpoint="GET /statistics",
+                method="GET",
+                url="/statistics",
+                params={"admin_api_key": ADMIN_API_KEY},
+            )
+        self._registrations += 1
+        return Request(
+            endpoint="POST /users",
+            method="POST",
+            url="/users",
+            params={
+                "username": f"load-user-{self.number}-{self._registrations}",
+                "password": "password",
+            },
+        )
+
+    def _peer(self, address: str, peers: List[str]) -> str:
+        # uniform over every other wallet: a hit on the sender is swapped for the
+        # one address that randrange leaves out
+        peer: str = peers[self._rng.randrange(len(peers) - 1)]
+        return peers[-1] if peer == address else peer
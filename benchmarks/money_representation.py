@@ -0,0 +1,125 @@
+# Storage size, scan speed and rounding drift of REAL (BTC) versus INTEGER
+# (satoshi) money columns.
+#
+#   python -m benchmarks.money_representation --rows 1000000
+#
+# Both tables hold the same random amounts; the REAL table stores them in BTC
+# as the schema did before the satoshi migration.
+import argparse
+import random
+import sqlite3
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple
+
+from app.core.money import SATOSHIS_PER_BTC, apply_basis_points, satoshis_to_btc
+from benchmarks.reporting import print_report, summarize_latencies
+
+FEE_RATE: int = 150
+INSERT_BATCH_SIZE: int = 100_000
+
+COLUMN_TYPES: Dict[str, Callable[[int], Any]] = {
+    "REAL": satoshis_to_btc,
+    "INTEGER": lambda amount: amount,
+}
+
+
+def _amounts(rows: int, seed: int) -> List[Tuple[int, int]]:
+    rng: random.Random = random.Random(seed)
+    amounts: List[Tuple[int, int]] = []
+    for _ in range(rows):
+        amount: int = rng.randrange(1, SATOSHIS_PER_BTC)
+        amounts.append((amount, apply_basis_points(amount, FEE_RATE)))
+    return amounts
+
+
+def _time(operation: Callable[[], Any], repeats: int) -> Dict[str, float]:
+    samples: List[float] = []
+    for _ in range(repeats):
+        started: float = time.perf_counter()
+        operation()
+        samples.append(time.perf_counter() - started)
+    return summarize_latencies(samples)
+
+
+def _measure_column_type(
+    column_type: str, amounts: List[Tuple[int, int]], repeats: int, directory: Path
+) -> Dict[str, Any]:
+    path: Path = directory / f"money_{column_type.lower()}.db"
+    convert: Callable[[int], Any] = COLUMN_TYPES[column_type]
+    conn: sqlite3.Connection = sqlite3.connect(path)
+    conn.execute(f"CREATE TABLE ledger (amount {column_type}, fee {column_type})")
+    for start in range(0, len(amounts), INSERT_BATCH_SIZE):
+        stop: int = start + INSERT_BATCH_SIZE
+        conn.executemany(
+            "INSERT INTO ledger (amount, fee) VALUES (?, ?)",
+            ((convert(amount), convert(fee)) for amount, fee in amounts[start:stop]),
+        )
+    conn.commit()
+    conn.execute("VACUUM")
+
+    threshold: Any = convert(SATOSHIS_PER_BTC // 2)
+    total_fee: Any = conn.execute("SELECT SUM(fee) FROM ledger").fetchone()[0]
+    report: Dict[str, Any] = {
+        "column_type": column_type,
+        "file_bytes": path.stat().st_size,
+        "sum_fee": _time(
+            lambda: conn.execute("SELECT SUM(fee) FROM ledger").fetchone(), repeats
+        ),
+        "count_amount_at_least": _time(
+            lambda: conn.execute(
+                "SELECT COUNT(*) FROM ledger WHERE amount >= ?", (threshold,)
+            ).fetchone(),
+            repeats,
+        ),
+        "total_fee_in_satoshis": (
+            total_fee if column_type == "INTEGER" else total_fee * SATOSHIS_PER_BTC
+        ),
+    }
+    conn.close()
+    return report
+
+
+def run(rows: int, repeats: int, seed: int, directory: Path) -> Dict[str, Any]:
+    amounts: List[Tuple[int, int]] = _amounts(rows, seed)
+    exact_total_fee: int = sum(fee for _, fee in amounts)
+
+    float_total_fee: float = 0
+    for _, fee in amounts:
+        float_total_fee += satoshis_to_btc(fee)
+
+    return {
+        "rows": rows,
+        "exact_total_fee_in_satoshis": exact_total_fee,
+        "float_accumulation_drift_in_satoshis": (
+            float_total_fee * SATOSHIS_PER_BTC - exact_total_fee
+        ),
+        "column_types": [
+            _measure_column_type(column_type, amounts, repeats, directory)
+            for column_type in COLUMN_TYPES
+        ],
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--repeats", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--directory", type=Path, default=None)
+    arguments = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temporary_directory:
+        print_report(
+            run(
+                rows=arguments.rows,
+                repeats=arguments.repeats,
+                seed=arguments.seed,
+                directory=arguments.directory or Path(temporary_directory),
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
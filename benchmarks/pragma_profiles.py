@@ -0,0 +1,141 @@
+# Mixed read/write throughput of the SQLite backend under each pragma profile.
+#
+#   python -m benchmarks.pragma_profiles --readers 8 --writers 4 --duration 5
+#
+# Writers keep moving money between their own two wallets while readers poll
+# wallet balances, so the numbers show how much each profile lets readers and
+# writers get in each other's way.
+import argparse
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+from app.core.facade import BitcoinWalletCore
+from app.infra.SQLlite.api_keys_repository import SQLAPIKeysRepository
+from app.infra.SQLlite.connection_pool import SQLiteConnectionPool
+from app.infra.SQLlite.pragmas import PRAGMA_PROFILES
+from app.infra.SQLlite.transactions_repository import SQLTransactionsRepository
+from app.infra.SQLlite.unit_of_work import SQLiteUnitOfWork
+from app.infra.SQLlite.users_repository import SQLUsersRepository
+from app.infra.SQLlite.wallets_repository import SQLWalletsRepository
+from app.infra.utils.currency_converter import DefaultCurrencyConverter
+from app.infra.utils.fee_strategy import FeeRateStrategy
+from app.infra.utils.generator import DefaultUniqueValueGenerators
+from app.infra.utils.hasher import DefaultHashFunction
+from benchmarks.reporting import print_report, summarize_latencies
+
+
+def _core(pool: SQLiteConnectionPool) -> BitcoinWalletCore:
+    return BitcoinWalletCore.create(
+        users_repository=SQLUsersRepository(pool),
+        wallets_repository=SQLWalletsRepository(pool),
+        transactions_repository=SQLTransactionsRepository(pool),
+        api_key_repository=SQLAPIKeysRepository(pool),
+        hash_function=DefaultHashFunction(),
+        currency_converter=DefaultCurrencyConverter(),
+        fee_strategy=FeeRateStrategy(),
+        unique_value_generator=DefaultUniqueValueGenerators(),
+        unit_of_work=SQLiteUnitOfWork(pool),
+    )
+
+
+def _measure(
+    core: BitcoinWalletCore, readers: int, writers: int, duration: float
+) -> Dict[str, Any]:
+    accounts: List[Tuple[str, str, str]] = []
+    for writer in range(writers):
+        api_key: str = core.register_user(f"user{writer}", "password").api_key
+        first: str = core.create_wallet(api_key).wallet_info["address"]
+        second: str = core.create_wallet(api_key).wallet_info["address"]
+        accounts.append((api_key, first, second))
+
+    read_samples: List[float] = []
+    write_samples: List[float] = []
+    lock: threading.Lock = threading.Lock()
+    stopped: threading.Event = threading.Event()
+
+    def write(api_key: str, first: str, second: str) -> None:
+        local: List[float] = []
+        while not stopped.is_set():
+            sender, receiver = (
+                (first, second) if len(local) % 2 == 0 else (second, first)
+            )
+            started: float = time.perf_counter()
+            core.make_transaction(api_key, sender, receiver, 1_000)
+            local.append(time.perf_counter() - started)
+        with lock:
+            write_samples.extend(local)
+
+    def read(reader: int) -> None:
+        local: List[float] = []
+        while not stopped.is_set():
+            api_key, first, _ = accounts[(reader + len(local)) % len(accounts)]
+            started: float = time.perf_counter()
+            core.get_wallet(api_key, first)
+            local.append(time.perf_counter() - started)
+        with lock:
+            read_samples.extend(local)
+
+    workers: List[threading.Thread] = [
+        threading.Thread(target=write, args=account) for account in accounts
+    ] + [threading.Thread(target=read, args=(reader,)) for reader in range(readers)]
+    for worker in workers:
+        worker.start()
+    time.sleep(duration)
+    stopped.set()
+    for worker in workers:
+        worker.join()
+
+    return {
+        "reads_per_second": len(read_samples) / duration,
+        "writes_per_second": len(write_samples) / duration,
+        "read_latency": summarize_latencies(read_samples),
+        "write_latency": summarize_latencies(write_samples),
+    }
+
+
+def run(
+    readers: int, writers: int, duration: float, directory: Path
+) -> List[Dict[str, Any]]:
+    report: List[Dict[str, Any]] = []
+    for name, profile in PRAGMA_PROFILES.items():
+        pool: SQLiteConnectionPool = SQLiteConnectionPool(
+            database_name=str(directory / f"{name}.db"),
+            pool_size=readers + writers,
+            pragma_profile=profile,
+        )
+        report.append(
+            {
+                "profile": name,
+                "readers": readers,
+                "writers": writers,
+                **_measure(_core(pool), readers, writers, duration),
+            }
+        )
+        pool.close()
+    return report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--readers", type=int, default=8)
+    parser.add_argument("--writers", type=int, default=4)
+    parser.add_argument("--duration", type=float, default=5.0)
+    parser.add_argument("--directory", type=Path, default=None)
+    arguments = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temporary_directory:
+        print_report(
+            run(
+                readers=arguments.readers,
+                writers=arguments.writers,
+                duration=arguments.duration,
+                directory=arguments.directory or Path(temporary_directory),
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+# Baselines for the hot paths in benchmarks.hot_paths and a check of new runs
+# against them.
+#
+#   python -m benchmarks.regression record
+#   python -m benchmarks.regression check --threshold 10 --repeats 10
+#   python -m benchmarks.regression check --only core. wallets.get_wallet
+#
+# Every case is timed in repeated runs, interleaved so drift of the machine is
+# spread over all cases, and summarized as a mean with a 95% confidence
+# interval. A case regresses when it is slower than the baseline by more than
+# the threshold and the two intervals do not overlap; check then exits with 1,
+# as it does when a hot path of the baseline is no longer measured.
+import argparse
+import json
+import platform
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from app.infra.SQLlite.connection_pool import MEMORY_DATABASE, SQLiteConnectionPool
+from benchmarks.hot_paths import Case, build_cases
+from benchmarks.reporting import confidence_interval
+
+DEFAULT_BASELINE: Path = Path(".benchmarks") / "hot_paths.json"
+SECONDS_PER_RUN: float = 0.02
+CALIBRATION_SECONDS: float = 0.002
+
+
+def _calls_per_run(case: Case) -> int:
+    calls: int = 1
+    while True:
+        elapsed: float = _time(case, calls)
+        if elapsed >= CALIBRATION_SECONDS:
+            return max(1, round(calls * SECONDS_PER_RUN / elapsed))
+        calls *= 2
+
+
+def _time(case: Case, calls: int) -> float:
+    started: float = time.perf_counter()
+    for _ in range(calls):
+        case()
+    return time.perf_counter() - started
+
+
+def measure(repeats: int, only: Sequence[str]) -> Dict[str, List[float]]:
+    pool: SQLiteConnectionPool = SQLiteConnectionPool(database_name=MEMORY_DATABASE)
+    cases: Dict[str, Case] = {
+        name: case
+        for name, case in build_cases(pool).items()
+        if not only or name.startswith(tuple(only))
+    }
+    calls: Dict[str, int] = {name: _calls_per_run(case) for name, case in cases.items()}
+    runs_ns: Dict[str, List[float]] = {name: [] for name in cases}
+    for _ in range(repeats):
+        for name, case in cases.items():
+            runs_ns[name].append(_time(case, calls[name]) / calls[name] * 1e9)
+    pool.close()
+    return runs_ns
+
+
+def _summary(runs_ns: Dict[str, List[float]], repeats: int) -> Dict[str, Any]:
+    cases: Dict[str, Any] = {}
+    for name, runs in runs_ns.items():
+        mean, half_width = confidence_interval(runs)
+        cases[name] = {"mean_ns": mean, "ci_ns": half_width, "runs_ns": runs}
+    return {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "repeats": repeats,
+        "cases": cases,
+    }
+
+
+def _verdict(
+    baseline: Dict[str, Any], current: Dict[str, Any], threshold: float
+) -> str:
+    change: float = current["mean_ns"] / baseline["mean_ns"] - 1
+    baseline_low: float = baseline["mean_ns"] - baseline["ci_ns"]
+    baseline_high: float = baseline["mean_ns"] + baseline["ci_ns"]
+    if change > threshold and current["mean_ns"] - current["ci_ns"] > baseline_high:
+        return "REGRESSED"
+    if change < -threshold and current["mean_ns"] + current["ci_ns"] < baseline_low:
+        return "improved"
+    return ""
+
+
+def _format(case: Dict[str, Any]) -> str:
+    return f"{case['mean_ns'] / 1000:9.2f} ± {case['ci_ns'] / 1000:6.2f} us"
+
+
+def compare(
+    baseline: Dict[str, Any], current: Dict[str, Any], threshold: float
+) -> Tuple[List[str], int]:
+    lines: List[str] = [
+        f"{'hot path':45} {'baseline':>21} {'current':>21} {'change':>8}"
+    ]
+    regressions: int = 0
+    improvements: int = 0
+    missing: int = 0
+    compared: int = 0
+    for name in sorted(set(baseline["cases"]) | set(current["cases"])):
+        before: Any = baseline["cases"].get(name)
+        after: Any = current["cases"].get(name)
+        if after is None:
+            missing += 1
+            lines.append(f"{name:45} {'not measured any more':>43}  MISSING")
+            continue
+        if before is None:
+            lines.append(f"{name:45} {'new, not in the baseline':>43}")
+            continue
+        compared += 1
+        verdict: str = _verdict(before, after, threshold)
+        regressions += verdict == "REGRESSED"
+        improvements += verdict == "improved"
+        change: float = (after["mean_ns"] / before["mean_ns"] - 1) * 100
+        lines.append(
+            f"{name:45} {_format(before)} {_format(after)} {change:+7.1f}%  {verdict}"
+        )
+    lines.append(
+        f"{regressions} regressed, {improvements} improved, "
+        f"{compared - regressions - improvements} unchanged, {missing} missing "
+        f"(threshold {threshold * 100:g}%, 95% confidence)"
+    )
+    return lines, regressions + missing
+
+
+def load_baseline(path: Path, only: Sequence[str]) -> Dict[str, Any]:
+    try:
+        baseline: Any = json.loads(path.read_text())
+    except FileNotFoundError:
+        raise SystemExit(
+            f"No baseline at {path}, run `make benchmark-baseline` first"
+        ) from None
+    except ValueError as e:
+        raise SystemExit(f"Baseline {path} is not valid JSON: {e}") from None
+    if not isinstance(baseline, dict) or not isinstance(baseline.get("cases"), dict):
+        raise SystemExit(
+            f"Baseline {path} has no hot paths, run `make benchmark-baseline` again"
+        )
+
+    if only:
+        baseline["cases"] = {
+            name: case
+            for name, case in baseline["cases"].items()
+            if name.startswith(tuple(only))
+        }
+    return baseline
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("command", choices=("record", "check"))
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument("--repeats", type=int, default=10)
+    parser.add_argument("--threshold", type=float, default=10.0, help="percent")
+    parser.add_argument("--only", nargs="*", default=[], help="case name prefixes")
+    arguments = parser.parse_args()
+
+    baseline: Optional[Dict[str, Any]] = None
+    if arguments.command == "check":  # before minutes of measuring
+        baseline = load_baseline(arguments.baseline, arguments.only)
+
+    current: Dict[str, Any] = _summary(
+        measure(arguments.repeats, arguments.only), arguments.repeats
+    )
+    if baseline is None:
+        arguments.baseline.parent.mkdir(parents=True, exist_ok=True)
+        arguments.baseline.write_text(json.dumps(current, indent=2))
+        print(f"Recorded {len(current['cases'])} hot paths to {arguments.baseline}")
+        return
+
+    lines, failures = compare(baseline, current, arguments.threshold / 100)
+    print("\n".join(lines))
+    if failures:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
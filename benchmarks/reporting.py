@@ -0,0 +1,43 @@
+import json
+import statistics
+from typing import Any, Dict, Sequence, Tuple
+
+# two-sided 95% critical values of Student's t by degrees of freedom
+T_CRITICAL_95: Tuple[float, ...] = (
+    12.706, 4.303, 3.182, 2.776, 2.571, 2.447, 2.365, 2.306, 2.262, 2.228,
+    2.201, 2.179, 2.160, 2.145, 2.131, 2.120, 2.110, 2.101, 2.093, 2.086,
+    2.080, 2.074, 2.069, 2.064, 2.060, 2.056, 2.052, 2.048, 2.045, 2.042,
+)  # fmt: skip
+
+
+def percentile(samples: Sequence[float], fraction: float) -> float:
+    ordered = sorted(samples)
+    index: int = min(len(ordered) - 1, max(0, round(fraction * len(ordered)) - 1))
+    return ordered[index]
+
+
+def summarize_latencies(samples_in_seconds: Sequence[float]) -> Dict[str, float]:
+    return {
+        "count": len(samples_in_seconds),
+        "mean_ms": statistics.fmean(samples_in_seconds) * 1000,
+        "p50_ms": percentile(samples_in_seconds, 0.50) * 1000,
+        "p95_ms": percentile(samples_in_seconds, 0.95) * 1000,
+        "p99_ms": percentile(samples_in_seconds, 0.99) * 1000,
+    }
+
+
+def confidence_interval(samples: Sequence[float]) -> Tuple[float, float]:
+    mean: float = statistics.fmean(samples)
+    if len(samples) < 2:
+        return mean, 0.0
+    degrees_of_freedom: int = len(samples) - 1
+    t: float = (
+        T_CRITICAL_95[degrees_of_freedom - 1]
+        if degrees_of_freedom <= len(T_CRITICAL_95)
+        else 1.96
+    )
+    return mean, t * statistics.stdev(samples) / len(samples) ** 0.5
+
+
+def print_report(report: Any) -> None:
+    print(json.dumps(report, indent=2))
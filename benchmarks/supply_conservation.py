@@ -0,0 +1,94 @@
+# Total supply over a long run of random transfers through the core.
+#
+#   python -m benchmarks.supply_conservation --transfers 1000000
+#
+# Every wallet starts with 1 BTC; at the end the balances plus the platform
+# profit must still add up to exactly that, with no satoshi lost to rounding.
+import argparse
+import random
+import time
+from typing import Any, Dict, List, Tuple
+
+from app.core.facade import (
+    ADMIN_API_KEY,
+    MAX_NUM_OF_WALLET,
+    BitcoinWalletCore,
+    StatisticsResponse,
+)
+from app.core.money import SATOSHIS_PER_BTC
+from app.infra.in_memory.in_memory_api_key_repository import InMemoryAPIKeyRepository
+from app.infra.in_memory.in_memory_transactions_repository import (
+    InMemoryTransactionsRepository,
+)
+from app.infra.in_memory.in_memory_users_repository import InMemoryUsersRepository
+from app.infra.in_memory.in_memory_wallets_repository import InMemoryWalletsRepository
+from app.infra.utils.currency_converter import DefaultCurrencyConverter
+from app.infra.utils.fee_strategy import FeeRateStrategy
+from app.infra.utils.generator import DefaultUniqueValueGenerators
+from app.infra.utils.hasher import DefaultHashFunction
+from benchmarks.reporting import print_report
+
+MAX_TRANSFER: int = 100_000
+
+
+def run(users: int, transfers: int, seed: int) -> Dict[str, Any]:
+    core: BitcoinWalletCore = BitcoinWalletCore.create(
+        users_repository=InMemoryUsersRepository(),
+        wallets_repository=InMemoryWalletsRepository(),
+        api_key_repository=InMemoryAPIKeyRepository(),
+        transactions_repository=InMemoryTransactionsRepository(),
+        hash_function=DefaultHashFunction(),
+        currency_converter=DefaultCurrencyConverter(),
+        fee_strategy=FeeRateStrategy(),
+        unique_value_generator=DefaultUniqueValueGenerators(),
+    )
+    wallets: List[Tuple[str, str]] = []
+    for user in range(users):
+        api_key: str = core.register_user(f"user{user}", "password").api_key
+        for _ in range(MAX_NUM_OF_WALLET):
+            address: str = core.create_wallet(api_key).wallet_info["address"]
+            wallets.append((api_key, address))
+    total_supply: int = len(wallets) * SATOSHIS_PER_BTC
+
+    rng: random.Random = random.Random(seed)
+    started: float = time.perf_counter()
+    for _ in range(transfers):
+        api_key, sender = rng.choice(wallets)
+        _, receiver = rng.choice(wallets)
+        core.make_transaction(api_key, sender, receiver, rng.randint(1, MAX_TRANSFER))
+    elapsed: float = time.perf_counter() - started
+
+    balances: int = sum(
+        core.get_wallet(api_key, address).wallet_info["balance_in_satoshis"]
+        for api_key, address in wallets
+    )
+    statistics: StatisticsResponse = core.get_statistics(ADMIN_API_KEY)
+    report: Dict[str, Any] = {
+        "transfers": transfers,
+        "accepted_transfers": statistics.total_number_of_transactions,
+        "transfers_per_second": transfers / elapsed,
+        "platform_profit_in_satoshis": statistics.platform_profit_in_satoshis,
+        "supply_drift_in_satoshis": (
+            balances + statistics.platform_profit_in_satoshis - total_supply
+        ),
+    }
+    if report["supply_drift_in_satoshis"] != 0:
+        print_report(report)
+        raise SystemExit("Total supply was not conserved")
+    return report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--users", type=int, default=10)
+    parser.add_argument("--transfers", type=int, default=1_000_000)
+    parser.add_argument("--seed", type=int, default=12)
+    arguments = parser.parse_args()
+
+    print_report(
+        run(users=arguments.users, transfers=arguments.transfers, seed=arguments.seed)
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+# Wallet history lookup latency while the ledger grows.
+#
+#   python -m benchmarks.transactions_history --sizes 10000 100000 1000000 10000000
+#
+# The ledger is grown in place to each size; every wallet keeps roughly the same
+# number of transactions, so with indexed lookups the latency should stay flat.
+import argparse
+import random
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Tuple
+
+from app.core.money import SATOSHIS_PER_BTC
+from app.infra.SQLlite.connection_pool import SQLiteConnectionPool
+from app.infra.SQLlite.transactions_repository import SQLTransactionsRepository
+from benchmarks.reporting import print_report, summarize_latencies
+
+INSERT_BATCH_SIZE: int = 100_000
+
+
+def _address(wallet_number: int) -> str:
+    return f"wallet-{wallet_number:010d}"
+
+
+def _rows(
+    rng: random.Random, start: int, stop: int, transactions_per_wallet: int
+) -> Iterator[Tuple[str, str, int, int]]:
+    for row_number in range(start, stop):
+        wallets: int = max(2, row_number // transactions_per_wallet + 1)
+        sender: int = rng.randrange(wallets)
+        receiver: int = rng.randrange(wallets)
+        yield _address(sender), _address(receiver), rng.randrange(SATOSHIS_PER_BTC), 0
+
+
+def _grow(
+    pool: SQLiteConnectionPool,
+    rng: random.Random,
+    start: int,
+    stop: int,
+    transactions_per_wallet: int,
+) -> None:
+    for batch_start in range(start, stop, INSERT_BATCH_SIZE):
+        batch_stop: int = min(stop, batch_start + INSERT_BATCH_SIZE)
+        with pool.connection() as conn:
+            conn.executemany(
+                "INSERT INTO transactions (from_address, to_address, amount, fee) "
+                "VALUES (?, ?, ?, ?)",
+                _rows(rng, batch_start, batch_stop, transactions_per_wallet),
+            )
+
+
+def _measure(
+    repository: SQLTransactionsRepository,
+    rng: random.Random,
+    wallets: int,
+    lookups: int,
+) -> Dict[str, float]:
+    samples: List[float] = []
+    for _ in range(lookups):
+        address: str = _address(rng.randrange(wallets))
+        started: float = time.perf_counter()
+        repository.get_wallet_transactions(address)
+        samples.append(time.perf_counter() - started)
+    return summarize_latencies(samples)
+
+
+def run(
+    sizes: List[int], transactions_per_wallet: int, lookups: int, directory: Path
+) -> List[Dict[str, Any]]:
+    rng: random.Random = random.Random(0)
+    pool: SQLiteConnectionPool = SQLiteConnectionPool(
+        database_name=str(directory / "transactions_history.db"), pool_size=1
+    )
+    repository: SQLTransactionsRepository = SQLTransactionsRepository(pool)
+
+    report: List[Dict[str, Any]] = []
+    current_size: int = 0
+    for size in sorted(sizes):
+        _grow(pool, rng, current_size, size, transactions_per_wallet)
+        current_size = size
+        wallets: int = max(2, size // transactions_per_wallet)
+        report.append({"rows": size, **_measure(repository, rng, wallets, lookups)})
+    pool.close()
+    return report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=[10_000, 100_000, 1_000_000, 10_000_000],
+    )
+    parser.add_argument("--transactions-per-wallet", type=int, default=20)
+    parser.add_argument("--lookups", type=int, default=1_000)
+    parser.add_argument("--directory", type=Path, default=None)
+    arguments = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temporary_directory:
+        print_report(
+            run(
+                sizes=arguments.sizes,
+                transactions_per_wallet=arguments.transactions_per_wallet,
+                lookups=arguments.lookups,
+                directory=arguments.directory or Path(temporary_directory),
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterator, List, Set
+
+import anyio
+import pytest
+
+from app.core import facade
+from app.core.facade import (
+    AsyncBitcoinWalletCore,
+    AsyncTransactionsStreamResponse,
+    BitcoinWalletCore,
+    WalletResponse,
+)
+from app.infra.in_memory.in_memory_api_key_repository import InMemoryAPIKeyRepository
+from app.infra.in_memory.in_memory_transactions_repository import (
+    InMemoryTransactionsRepository,
+)
+from app.infra.in_memory.in_memory_users_repository import InMemoryUsersRepository
+from app.infra.in_memory.in_memory_wallets_repository import InMemoryWalletsRepository
+from app.infra.utils.currency_converter import DefaultCurrencyConverter
+from app.infra.utils.fee_strategy import FeeRateStrategy
+from app.infra.utils.generator import DefaultUniqueValueGenerators
+from app.infra.utils.hasher import DefaultHashFunction
+
+
+class ThreadRecordingCurrencyConverter(DefaultCurrencyConverter):
+    def __init__(self) -> None:
+        super().__init__()
+        self.threads: Set[str] = set()
+
+    def convert_to_usd(self, amount_in_satoshis: int) -> float:
+        self.threads.add(threading.current_thread().name)
+        return super().convert_to_usd(amount_in_satoshis)
+
+
+@pytest.fixture
+def currency_converter() -> ThreadRecordingCurrencyConverter:
+    return ThreadRecordingCurrencyConverter()
+
+
+@pytest.fixture
+def executor() -> Iterator[ThreadPoolExecutor]:
+    executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="wallet-core")
+    yield executor
+    executor.shutdown()
+
+
+@pytest.fixture
+def core(
+    executor: ThreadPoolExecutor, currency_converter: ThreadRecordingCurrencyConverter
+) -> AsyncBitcoinWalletCore:
+    return AsyncBitcoinWalletCore(
+        _core=BitcoinWalletCore.create(
+            users_repository=InMemoryUsersRepository(),
+            wallets_repository=InMemoryWalletsRepository(),
+            api_key_repository=InMemoryAPIKeyRepository(),
+            transactions_repository=InMemoryTransactionsRepository(),
+            hash_function=DefaultHashFunction(),
+            currency_converter=currency_converter,
+            fee_strategy=FeeRateStrategy(),
+            unique_value_generator=DefaultUniqueValueGenerators(),
+        ),
+        _executor=executor,
+    )
+
+
+def test_in_flight_requests_exceed_executor_workers(
+    core: AsyncBitcoinWalletCore, currency_converter: ThreadRecordingCurrencyConverter
+) -> None:
+    async def scenario() -> List[WalletResponse]:
+        api_key: str = (await core.register_user("user", "password")).api_key
+        address: str = (await core.create_wallet(api_key)).wallet_info["address"]
+        return list(
+            await asyncio.gather(
+                *(core.get_wallet(api_key, address) for _ in range(500))
+            )
+        )
+
+    responses: List[WalletResponse] = anyio.run(scenario)
+
+    assert [response.status for response in responses] == [200] * 500
+    assert 1 <= len(currency_converter.threads) <= 2
+    assert all(name.startswith("wallet-core") for name in currency_converter.threads)
+
+
+def test_stream_is_pulled_in_batches(
+    core: AsyncBitcoinWalletCore, monkeypatch: Any
+) -> None:
+    monkeypatch.setattr(facade, "STREAM_BATCH_SIZE", 2)
+
+    async def scenario() -> List[List[Dict[str, Any]]]:
+        api_key: str = (await core.register_user("user", "password")).api_key
+        address1: str = (await core.create_wallet(api_key)).wallet_info["address"]
+        address2: str = (await core.create_wallet(api_key)).wallet_info["address"]
+        for _ in range(5):
+            await core.make_transaction(api_key, address1, address2, 1)
+
+        forbidden: AsyncTransactionsStreamResponse = await core.stream_transactions(
+            "invalid"
+        )
+        assert forbidden.status == 403
+
+        response: AsyncTransactionsStreamResponse = await core.stream_transactions(
+            api_key
+        )
+        assert response.status == 200
+        return [batch async for batch in response.batches]
+
+    batches: List[List[Dict[str, Any]]] = anyio.run(scenario)
+
+    assert [len(batch) for batch in batches] == [2, 2, 1]
@@ -6,6 +6,7 @@ from app.core.facade import (
     UserResponse,
     WalletResponse,
 )
+from app.core.money import SATOSHIS_PER_BTC, apply_basis_points
 from app.core.transactions.interactor import Transaction
 from app.core.users.interactor import User
 from app.infra.in_memory.in_memory_api_key_repository import InMemoryAPIKeyRepository
@@ -120,9 +121,12 @@ def test_deposit_and_transaction_to_same_wallet_neg_user_has_two_wallets(
     assert address1 != ""
     address1 = core.create_wallet(api_key=api_key).wallet_info["address"]
 
-    amount: float = 1
+    amount: int = SATOSHIS_PER_BTC
     core.make_transaction(
-        api_key=api_key, from_address=address1, to_address=address1, amount=amount
+        api_key=api_key,
+        from_address=address1,
+        to_address=address1,
+        amount_in_satoshis=amount,
     )
 
     statistics_response: StatisticsResponse = core.get_statistics(
@@ -142,9 +146,12 @@ def test_deposit_and_transaction_to_same_wallet_neg_user_has_one_wallet(
 
     address1: str = core.create_wallet(api_key=api_key).wallet_info["address"]
 
-    amount: float = 1
+    amount: int = SATOSHIS_PER_BTC
     core.make_transaction(
-        api_key=api_key, from_address=address1, to_address=address1, amount=amount
+        api_key=api_key,
+        from_address=address1,
+        to_address=address1,
+        amount_in_satoshis=amount,
     )
 
     statistics_response: StatisticsResponse = core.get_statistics(
@@ -165,9 +172,12 @@ def test_deposit_and_transaction_to_different_wallet_of_same_user(
     address1: str = core.create_wallet(api_key=api_key).wallet_info["address"]
     address2: str = core.create_wallet(api_key=api_key).wallet_info["address"]
 
-    amount: float = 1
+    amount: int = SATOSHIS_PER_BTC
     core.make_transaction(
-        api_key=api_key, from_address=address1, to_address=address2, amount=amount
+        api_key=api_key,
+        from_address=address1,
+        to_address=address2,
+        amount_in_satoshis=amount,
     )
 
     statistics_response: StatisticsResponse = core.get_statistics(
@@ -176,12 +186,13 @@ def test_deposit_and_transaction_to_different_wallet_of_same_user(
     assert (
         statistics_response.platform_profit_in_usd
         == currency_converter.convert_to_usd(
-            amount_in_btc=amount * fee_strategy.get_fee_rate_for_same_owner()
+            amount_in_satoshis=apply_basis_points(
+                amount, fee_strategy.get_fee_rate_for_same_owner()
+            )
         )
     )
-    assert (
-        statistics_response.platform_profit_in_btc
-        == amount * fee_strategy.get_fee_rate_for_same_owner()
+    assert statistics_response.platform_profit_in_satoshis == apply_basis_points(
+        amount, fee_strategy.get_fee_rate_for_same_owner()
     )
     assert statistics_response.total_number_of_transactions == 1
 
@@ -200,9 +211,12 @@ def test_transaction_to_other_user_wallet_neg_no_funds(
     address1: str = core.create_wallet(api_key=api_key1).wallet_info["address"]
     address2: str = core.create_wallet(api_key=api_key2).wallet_info["address"]
 
-    amount: float = 10
+    amount: int = 10 * SATOSHIS_PER_BTC
     core.make_transaction(
-        api_key=api_key1, from_address=address1, to_address=address2, amount=amount
+        api_key=api_key1,
+        from_address=address1,
+        to_address=address2,
+        amount_in_satoshis=amount,
     )
 
     statistics_response: StatisticsResponse = core.get_statistics(
@@ -226,18 +240,20 @@ def test_deposit_and_transaction_to_different_wallet_of_same_user_neg_no_funds(
     address1: str = core.create_wallet(api_key=api_key).wallet_info["address"]
     address2: str = core.create_wallet(api_key=api_key).wallet_info["address"]
 
-    amount: float = 10
+    amount: int = 10 * SATOSHIS_PER_BTC
     core.make_transaction(
-        api_key=api_key, from_address=address1, to_address=address2, amount=amount
+        api_key=api_key,
+        from_address=address1,
+        to_address=address2,
+        amount_in_satoshis=amount,
     )
 
     statistics_response: StatisticsResponse = core.get_statistics(
         admin_api_key="admin_api_key"
     )
     assert statistics_response.platform_profit_in_usd == 0
-    assert (
-        statistics_response.platform_profit_in_btc
-        == amount * fee_strategy.get_fee_rate_for_same_owner()
+    assert statistics_response.platform_profit_in_satoshis == apply_basis_points(
+        amount, fee_strategy.get_fee_rate_for_same_owner()
     )
     assert statistics_response.total_number_of_transactions == 0
 
@@ -264,10 +280,10 @@ def test_get_transactions(user1: User, user2: User, core: BitcoinWalletCore) ->
     transaction1: Transaction = Transaction(
         from_address="DEPOSIT",
         to_address=wallet_response1.wallet_info["address"],
-        amount=currency_converter.convert_to_btc(amount_in_usd=100),
-        fee=float(
-            fee_strategy.get_fee_rate_for_deposit()
-            * currency_converter.convert_to_btc(amount_in_usd=100)
+        amount=currency_converter.convert_to_satoshis(amount_in_usd=100),
+        fee=apply_basis_points(
+            currency_converter.convert_to_satoshis(amount_in_usd=100),
+            fee_strategy.get_fee_rate_for_deposit(),
         ),
     )
     core.deposit(
@@ -278,10 +294,10 @@ def test_get_transactions(user1: User, user2: User, core: BitcoinWalletCore) ->
     transaction2: Transaction = Transaction(
         from_address=wallet_response1.wallet_info["address"],
         to_address="WITHDRAW",
-        amount=currency_converter.convert_to_btc(amount_in_usd=50),
-        fee=float(
-            fee_strategy.get_fee_rate_for_withdraw()
-            * currency_converter.convert_to_btc(amount_in_usd=100)
+        amount=currency_converter.convert_to_satoshis(amount_in_usd=50),
+        fee=apply_basis_points(
+            currency_converter.convert_to_satoshis(amount_in_usd=100),
+            fee_strategy.get_fee_rate_for_withdraw(),
         ),
     )
     core.withdraw(
@@ -292,14 +308,16 @@ def test_get_transactions(user1: User, user2: User, core: BitcoinWalletCore) ->
     transaction3: Transaction = Transaction(
         from_address=wallet_response1.wallet_info["address"],
         to_address=wallet_response2.wallet_info["address"],
-        amount=0.3,
-        fee=float(fee_strategy.get_fee_rate_for_different_owners() * 0.3),
+        amount=30_000_000,
+        fee=apply_basis_points(
+            30_000_000, fee_strategy.get_fee_rate_for_different_owners()
+        ),
     )
     core.make_transaction(
         api_key=user_response1.api_key,
         from_address=wallet_response1.wallet_info["address"],
         to_address=wallet_response2.wallet_info["address"],
-        amount=0.3,
+        amount_in_satoshis=30_000_000,
     )
 
     assert (
@@ -1,6 +1,7 @@
 import pytest
 
 from app.core.facade import BitcoinWalletCore, UserResponse, WalletResponse
+from app.core.money import SATOSHIS_PER_BTC
 from app.core.users.interactor import User
 from app.infra.in_memory.in_memory_api_key_repository import InMemoryAPIKeyRepository
 from app.infra.in_memory.in_memory_transactions_repository import (
@@ -61,8 +62,8 @@ def test_deposit_balance(user: User, core: BitcoinWalletCore) -> None:
     )
 
     assert wallet_response.wallet_info[
-        "balance_in_btc"
-    ] == 1 + currency_converter.convert_to_btc(amount_in_usd=1000)
+        "balance_in_satoshis"
+    ] == SATOSHIS_PER_BTC + currency_converter.convert_to_satoshis(amount_in_usd=1000)
 
 
 def test_deposit_withdraw(user: User, core: BitcoinWalletCore) -> None:
@@ -81,8 +82,10 @@ def test_deposit_withdraw(user: User, core: BitcoinWalletCore) -> None:
         user_response.api_key, wallet_response.wallet_info["address"]
     )
 
-    expected: float = 1 + currency_converter.convert_to_btc(amount_in_usd=1000)
-    assert wallet_response.wallet_info["balance_in_btc"] == expected
+    expected: int = SATOSHIS_PER_BTC + currency_converter.convert_to_satoshis(
+        amount_in_usd=1000
+    )
+    assert wallet_response.wallet_info["balance_in_satoshis"] == expected
 
     core.withdraw(
         api_key=user_response.api_key,
@@ -93,8 +96,8 @@ def test_deposit_withdraw(user: User, core: BitcoinWalletCore) -> None:
     wallet_response = core.get_wallet(
         user_response.api_key, wallet_response.wallet_info["address"]
     )
-    expected = expected - currency_converter.convert_to_btc(amount_in_usd=2500)
-    assert wallet_response.wallet_info["balance_in_btc"] == expected
+    expected = expected - currency_converter.convert_to_satoshis(amount_in_usd=2500)
+    assert wallet_response.wallet_info["balance_in_satoshis"] == expected
 
 
 def test_withdraw_more_than_on_balance(user: User, core: BitcoinWalletCore) -> None:
@@ -113,8 +116,10 @@ def test_withdraw_more_than_on_balance(user: User, core: BitcoinWalletCore) -> N
         user_response.api_key, wallet_response.wallet_info["address"]
     )
 
-    expected: float = 1 + currency_converter.convert_to_btc(amount_in_usd=1000)
-    assert wallet_response.wallet_info["balance_in_btc"] == expected
+    expected: int = SATOSHIS_PER_BTC + currency_converter.convert_to_satoshis(
+        amount_in_usd=1000
+    )
+    assert wallet_response.wallet_info["balance_in_satoshis"] == expected
 
     core.withdraw(
         api_key=user_response.api_key,
@@ -125,7 +130,7 @@ def test_withdraw_more_than_on_balance(user: User, core: BitcoinWalletCore) -> N
     wallet_response = core.get_wallet(
         user_response.api_key, wallet_response.wallet_info["address"]
     )
-    assert wallet_response.wallet_info["balance_in_btc"] == expected
+    assert wallet_response.wallet_info["balance_in_satoshis"] == expected
 
 
 def test_deposit_neg_wrong_api_key_deposit(user: User, core: BitcoinWalletCore) -> None:
@@ -147,8 +152,8 @@ def test_deposit_neg_wrong_api_key_deposit(user: User, core: BitcoinWalletCore)
         user_response.api_key, wallet_response.wallet_info["address"]
     )
 
-    expected: float = 1
-    assert wallet_response.wallet_info["balance_in_btc"] == expected
+    expected: int = SATOSHIS_PER_BTC
+    assert wallet_response.wallet_info["balance_in_satoshis"] == expected
 
 
 def test_withdraw_neg_wrong_api_key(user: User, core: BitcoinWalletCore) -> None:
@@ -170,7 +175,7 @@ def test_withdraw_neg_wrong_api_key(user: User, core: BitcoinWalletCore) -> None
         user_response.api_key, wallet_response.wallet_info["address"]
     )
 
-    assert wallet_response.wallet_info["balance_in_btc"] == 1
+    assert wallet_response.wallet_info["balance_in_satoshis"] == SATOSHIS_PER_BTC
 
 
 def test_withdraw_neg_wrong_wallet_address(user: User, core: BitcoinWalletCore) -> None:
@@ -192,7 +197,7 @@ def test_withdraw_neg_wrong_wallet_address(user: User, core: BitcoinWalletCore)
         user_response.api_key, wallet_response.wallet_info["address"]
     )
 
-    assert wallet_response.wallet_info["balance_in_btc"] == 1
+    assert wallet_response.wallet_info["balance_in_satoshis"] == SATOSHIS_PER_BTC
 
 
 def test_withdraw_neg_wrong_owner_key(user: User, core: BitcoinWalletCore) -> None:
@@ -217,7 +222,7 @@ def test_withdraw_neg_wrong_owner_key(user: User, core: BitcoinWalletCore) -> No
         user_response.api_key, wallet_response.wallet_info["address"]
     )
 
-    assert wallet_response.wallet_info["balance_in_btc"] == 1
+    assert wallet_response.wallet_info["balance_in_satoshis"] == SATOSHIS_PER_BTC
 
 
 def test_deposit_neg_wrong_wallet_address(user: User, core: BitcoinWalletCore) -> None:
@@ -239,7 +244,7 @@ def test_deposit_neg_wrong_wallet_address(user: User, core: BitcoinWalletCore) -
         user_response.api_key, wallet_response.wallet_info["address"]
     )
 
-    assert wallet_response.wallet_info["balance_in_btc"] == 1
+    assert wallet_response.wallet_info["balance_in_satoshis"] == SATOSHIS_PER_BTC
 
 
 def test_deposit_neg_wrong_owner_key(user: User, core: BitcoinWalletCore) -> None:
@@ -264,7 +269,7 @@ def test_deposit_neg_wrong_owner_key(user: User, core: BitcoinWalletCore) -> Non
         user_response.api_key, wallet_response.wallet_info["address"]
     )
 
-    assert wallet_response.wallet_info["balance_in_btc"] == 1
+    assert wallet_response.wallet_info["balance_in_satoshis"] == SATOSHIS_PER_BTC
 
 
 def test_transaction_between_wallets(user: User, core: BitcoinWalletCore) -> None:
@@ -287,7 +292,7 @@ def test_transaction_between_wallets(user: User, core: BitcoinWalletCore) -> Non
             api_key=user_response1.api_key + "wrong",
             from_address=wallet_response1.wallet_info["address"],
             to_address=wallet_response2.wallet_info["address"],
-            amount=0.5,
+            amount_in_satoshis=50_000_000,
         ).status
         == 403
     )
@@ -296,7 +301,7 @@ def test_transaction_between_wallets(user: User, core: BitcoinWalletCore) -> Non
             api_key=user_response1.api_key,
             from_address=wallet_response1.wallet_info["address"] + "wrong",
             to_address=wallet_response2.wallet_info["address"],
-            amount=0.5,
+            amount_in_satoshis=50_000_000,
         ).status
         == 404
     )
@@ -305,7 +310,7 @@ def test_transaction_between_wallets(user: User, core: BitcoinWalletCore) -> Non
             api_key=user_response2.api_key,
             from_address=wallet_response1.wallet_info["address"],
             to_address=wallet_response2.wallet_info["address"],
-            amount=0.5,
+            amount_in_satoshis=50_000_000,
         ).status
         == 403
     )
@@ -314,7 +319,7 @@ def test_transaction_between_wallets(user: User, core: BitcoinWalletCore) -> Non
             api_key=user_response1.api_key,
             from_address=wallet_response1.wallet_info["address"],
             to_address=wallet_response2.wallet_info["address"] + "wrong",
-            amount=0.5,
+            amount_in_satoshis=50_000_000,
         ).status
         == 404
     )
@@ -323,7 +328,38 @@ def test_transaction_between_wallets(user: User, core: BitcoinWalletCore) -> Non
             api_key=user_response1.api_key,
             from_address=wallet_response1.wallet_info["address"],
             to_address=wallet_response2.wallet_info["address"],
-            amount=0.5,
+            amount_in_satoshis=50_000_000,
         ).status
         == 201
     )
+
+
+def test_negative_amounts_are_rejected(user: User, core: BitcoinWalletCore) -> None:
+    attacker: UserResponse = core.register_user(
+        username=user.get_username() + "a", password=user.get_password()
+    )
+    victim: UserResponse = core.register_user(
+        username=user.get_username() + "b", password=user.get_password()
+    )
+    own: str = core.create_wallet(api_key=attacker.api_key).wallet_info["address"]
+    other: str = core.create_wallet(api_key=victim.api_key).wallet_info["address"]
+
+    for amount in (-50_000_000, 0):
+        assert (
+            core.make_transaction(
+                api_key=attacker.api_key,
+                from_address=own,
+                to_address=other,
+                amount_in_satoshis=amount,
+            ).status
+            == 400
+        )
+    assert core.deposit(attacker.api_key, own, amount_in_usd=-1000).status == 400
+    assert core.withdraw(attacker.api_key, own, amount_in_usd=-1000).status == 400
+
+    for api_key, address in ((attacker.api_key, own), (victim.api_key, other)):
+        balance: int = core.get_wallet(api_key, address).wallet_info[
+            "balance_in_satoshis"
+        ]
+        assert balance == SATOSHIS_PER_BTC
+    assert core.get_transactions_of_wallet(attacker.api_key, own).transactions == []
@@ -0,0 +1,65 @@
+import random
+from typing import List, Tuple
+
+from app.core.facade import MAX_NUM_OF_WALLET, BitcoinWalletCore, StatisticsResponse
+from app.core.money import SATOSHIS_PER_BTC
+from app.core.transactions.interactor import Transaction
+from app.infra.in_memory.in_memory_api_key_repository import InMemoryAPIKeyRepository
+from app.infra.in_memory.in_memory_transactions_repository import (
+    InMemoryTransactionsRepository,
+)
+from app.infra.in_memory.in_memory_users_repository import InMemoryUsersRepository
+from app.infra.in_memory.in_memory_wallets_repository import InMemoryWalletsRepository
+from app.infra.utils.currency_converter import DefaultCurrencyConverter
+from app.infra.utils.fee_strategy import FeeRateStrategy
+from app.infra.utils.generator import DefaultUniqueValueGenerators
+from app.infra.utils.hasher import DefaultHashFunction
+
+NUMBER_OF_USERS: int = 10
+# the 1M transfer run is `python -m benchmarks.supply_conservation`
+NUMBER_OF_TRANSFERS: int = 5_000
+MAX_TRANSFER: int = 100_000
+
+
+def test_total_supply_is_conserved_over_random_transfers() -> None:
+    transactions_repository: InMemoryTransactionsRepository = (
+        InMemoryTransactionsRepository()
+    )
+    core: BitcoinWalletCore = BitcoinWalletCore.create(
+        users_repository=InMemoryUsersRepository(),
+        wallets_repository=InMemoryWalletsRepository(),
+        api_key_repository=InMemoryAPIKeyRepository(),
+        transactions_repository=transactions_repository,
+        hash_function=DefaultHashFunction(),
+        currency_converter=DefaultCurrencyConverter(),
+        fee_strategy=FeeRateStrategy(),
+        unique_value_generator=DefaultUniqueValueGenerators(),
+    )
+    wallets: List[Tuple[str, str]] = []
+    for user in range(NUMBER_OF_USERS):
+        api_key: str = core.register_user(f"user{user}", "password").api_key
+        for _ in range(MAX_NUM_OF_WALLET):
+            address: str = core.create_wallet(api_key).wallet_info["address"]
+            wallets.append((api_key, address))
+    total_supply: int = len(wallets) * SATOSHIS_PER_BTC
+
+    rng: random.Random = random.Random(12)
+    for _ in range(NUMBER_OF_TRANSFERS):
+        api_key, sender = rng.choice(wallets)
+        _, receiver = rng.choice(wallets)
+        core.make_transaction(api_key, sender, receiver, rng.randint(1, MAX_TRANSFER))
+
+    balances: int = 0
+    for api_key, address in wallets:
+        balance: int = core.get_wallet(api_key, address).wallet_info[
+            "balance_in_satoshis"
+        ]
+        assert isinstance(balance, int) and balance >= 0
+        balances += balance
+    statistics: StatisticsResponse = core.get_statistics("admin_api_key")
+    transactions: List[Transaction] = transactions_repository.get_all_transactions()
+
+    assert statistics.total_number_of_transactions > NUMBER_OF_TRANSFERS // 2
+    assert statistics.platform_profit_in_satoshis > 0
+    assert statistics.platform_profit_in_satoshis == sum(t.fee for t in transactions)
+    assert balances + statistics.platform_profit_in_satoshis == total_supply
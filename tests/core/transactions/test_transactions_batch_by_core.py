@@ -0,0 +1,152 @@
+from typing import List, Tuple
+
+import pytest
+
+from app.core.facade import (
+    MAX_TRANSFERS_PER_BATCH,
+    BatchMode,
+    BitcoinWalletCore,
+    Transfer,
+    TransfersBatchResponse,
+)
+from app.infra.in_memory.in_memory_api_key_repository import InMemoryAPIKeyRepository
+from app.infra.in_memory.in_memory_transactions_repository import (
+    InMemoryTransactionsRepository,
+)
+from app.infra.in_memory.in_memory_users_repository import InMemoryUsersRepository
+from app.infra.in_memory.in_memory_wallets_repository import InMemoryWalletsRepository
+from app.infra.utils.currency_converter import DefaultCurrencyConverter
+from app.infra.utils.fee_strategy import FeeRateStrategy
+from app.infra.utils.generator import DefaultUniqueValueGenerators
+from app.infra.utils.hasher import DefaultHashFunction
+
+
+@pytest.fixture
+def core() -> BitcoinWalletCore:
+    return BitcoinWalletCore.create(
+        users_repository=InMemoryUsersRepository(),
+        wallets_repository=InMemoryWalletsRepository(),
+        api_key_repository=InMemoryAPIKeyRepository(),
+        transactions_repository=InMemoryTransactionsRepository(),
+        hash_function=DefaultHashFunction(),
+        currency_converter=DefaultCurrencyConverter(),
+        fee_strategy=FeeRateStrategy(),
+        unique_value_generator=DefaultUniqueValueGenerators(),
+    )
+
+
+@pytest.fixture
+def accounts(core: BitcoinWalletCore) -> Tuple[str, str, str, str, str]:
+    api_key: str = core.register_user(username="payer", password="password").api_key
+    first: str = core.create_wallet(api_key=api_key).wallet_info["address"]
+    second: str = core.create_wallet(api_key=api_key).wallet_info["address"]
+    other_api_key: str = core.register_user("payee", "password").api_key
+    foreign: str = core.create_wallet(api_key=other_api_key).wallet_info["address"]
+    return api_key, first, second, other_api_key, foreign
+
+
+def _balances(core: BitcoinWalletCore, api_key: str, *addresses: str) -> List[int]:
+    return [
+        core.get_wallet(api_key, address).wallet_info["balance_in_satoshis"]
+        for address in addresses
+    ]
+
+
+def test_batch_uses_running_totals(
+    core: BitcoinWalletCore, accounts: Tuple[str, str, str, str, str]
+) -> None:
+    api_key, first, second, other_api_key, foreign = accounts
+
+    response: TransfersBatchResponse = core.make_transactions(
+        api_key,
+        [
+            Transfer(first, second, 50_000_000),
+            Transfer(second, foreign, 120_000_000),  # only covered by the first one
+        ],
+    )
+
+    assert response == TransfersBatchResponse(status=201, statuses=[201, 201])
+    assert _balances(core, api_key, first, second) == [50_000_000, 28_200_000]
+    assert _balances(core, other_api_key, foreign) == [220_000_000]
+    assert core.get_statistics("admin_api_key").platform_profit_in_satoshis == (
+        1_800_000
+    )
+
+
+def test_all_or_nothing_batch_is_rejected_as_a_whole(
+    core: BitcoinWalletCore, accounts: Tuple[str, str, str, str, str]
+) -> None:
+    api_key, first, _, other_api_key, foreign = accounts
+
+    response: TransfersBatchResponse = core.make_transactions(
+        api_key,
+        [Transfer(first, foreign, 60_000_000), Transfer(first, foreign, 60_000_000)],
+        BatchMode.ALL_OR_NOTHING,
+    )
+
+    assert response == TransfersBatchResponse(status=409, statuses=[424, 400])
+    assert _balances(core, api_key, first) == [100_000_000]
+    assert _balances(core, other_api_key, foreign) == [100_000_000]
+    assert core.get_statistics("admin_api_key").total_number_of_transactions == 0
+
+
+def test_best_effort_batch_applies_the_valid_transfers(
+    core: BitcoinWalletCore, accounts: Tuple[str, str, str, str, str]
+) -> None:
+    api_key, first, _, other_api_key, foreign = accounts
+
+    response: TransfersBatchResponse = core.make_transactions(
+        api_key,
+        [Transfer(first, foreign, 60_000_000), Transfer(first, foreign, 60_000_000)],
+        BatchMode.BEST_EFFORT,
+    )
+
+    assert response == TransfersBatchResponse(status=207, statuses=[201, 400])
+    assert _balances(core, api_key, first) == [39_100_000]
+    assert _balances(core, other_api_key, foreign) == [160_000_000]
+    assert core.get_statistics("admin_api_key").total_number_of_transactions == 1
+
+
+def test_every_transfer_gets_its_own_status(
+    core: BitcoinWalletCore, accounts: Tuple[str, str, str, str, str]
+) -> None:
+    api_key, first, second, _, foreign = accounts
+
+    response: TransfersBatchResponse = core.make_transactions(
+        api_key,
+        [
+            Transfer(first, second, 1),
+            Transfer("unknown", second, 1),
+            Transfer(foreign, first, 1),
+            Transfer(first, "unknown", 1),
+            Transfer(first, first, 1),
+            Transfer(first, second, 0),
+        ],
+        BatchMode.BEST_EFFORT,
+    )
+
+    assert response.statuses == [201, 404, 403, 404, 403, 400]
+
+
+def test_batch_with_invalid_api_key(
+    core: BitcoinWalletCore, accounts: Tuple[str, str, str, str, str]
+) -> None:
+    _, first, second, _, _ = accounts
+
+    response: TransfersBatchResponse = core.make_transactions(
+        "invalid", [Transfer(first, second, 1)]
+    )
+
+    assert response == TransfersBatchResponse(status=403)
+
+
+def test_batch_size_is_bounded(
+    core: BitcoinWalletCore, accounts: Tuple[str, str, str, str, str]
+) -> None:
+    api_key, first, second, _, _ = accounts
+    transfers: List[Transfer] = [Transfer(first, second, 1)] * (
+        MAX_TRANSFERS_PER_BATCH + 1
+    )
+
+    assert core.make_transactions(api_key, []).status == 400
+    assert core.make_transactions(api_key, transfers).status == 400
@@ -5,7 +5,7 @@ from app.core.transactions.interactor import Transaction
 
 @pytest.fixture
 def transaction() -> Transaction:
-    return Transaction(from_address="1", to_address="2", amount=10.3, fee=3)
+    return Transaction(from_address="1", to_address="2", amount=1030, fee=3)
 
 
 def test_transaction_get_from_address(transaction: Transaction) -> None:
@@ -25,11 +25,11 @@ def test_transaction_get_to_address_neg(transaction: Transaction) -> None:
 
 
 def test_transaction_get_amount(transaction: Transaction) -> None:
-    assert transaction.get_amount() == 10.3
+    assert transaction.get_amount() == 1030
 
 
 def test_transaction_get_amount_neg(transaction: Transaction) -> None:
-    assert not transaction.get_amount() == 10.4
+    assert not transaction.get_amount() == 1040
 
 
 def test_transaction_get_fee(transaction: Transaction) -> None:
@@ -42,31 +42,31 @@ def test_transaction_get_fee_neg(transaction: Transaction) -> None:
 
 def test_transactions_equals(transaction: Transaction) -> None:
     assert transaction == Transaction(
-        from_address="1", to_address="2", amount=10.3, fee=3
+        from_address="1", to_address="2", amount=1030, fee=3
     )
 
 
 def test_transactions_equals_neg_from_address(transaction: Transaction) -> None:
     assert not transaction == Transaction(
-        from_address="7", to_address="2", amount=10.3, fee=3
+        from_address="7", to_address="2", amount=1030, fee=3
     )
 
 
 def test_transactions_equals_neg_to_address(transaction: Transaction) -> None:
     assert not transaction == Transaction(
-        from_address="1", to_address="23", amount=10.3, fee=3
+        from_address="1", to_address="23", amount=1030, fee=3
     )
 
 
 def test_transactions_equals_neg_amount(transaction: Transaction) -> None:
     assert not transaction == Transaction(
-        from_address="1", to_address="2", amount=10.4, fee=3
+        from_address="1", to_address="2", amount=1040, fee=3
     )
 
 
 def test_transactions_equals_neg_fee(transaction: Transaction) -> None:
     assert not transaction == Transaction(
-        from_address="1", to_address="2", amount=10.3, fee=7.2
+        from_address="1", to_address="2", amount=1030, fee=720
     )
 
 
@@ -74,8 +74,10 @@ def test_transaction_to_dict(transaction: Transaction) -> None:
     assert transaction.to_dict() == {
         "from_address": transaction.get_from_address(),
         "to_address": transaction.get_to_address(),
-        "amount": transaction.get_amount(),
-        "fee": transaction.get_fee(),
+        "amount": 0.0000103,
+        "fee": 0.00000003,
+        "amount_in_satoshis": transaction.get_amount(),
+        "fee_in_satoshis": transaction.get_fee(),
     }
 
 
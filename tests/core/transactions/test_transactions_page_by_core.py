@@ -0,0 +1,77 @@
+import pytest
+
+from app.core.facade import BitcoinWalletCore, WalletResponse
+from app.core.transactions.interactor import Direction
+from app.infra.in_memory.in_memory_api_key_repository import InMemoryAPIKeyRepository
+from app.infra.in_memory.in_memory_transactions_repository import (
+    InMemoryTransactionsRepository,
+)
+from app.infra.in_memory.in_memory_users_repository import InMemoryUsersRepository
+from app.infra.in_memory.in_memory_wallets_repository import InMemoryWalletsRepository
+from app.infra.utils.currency_converter import DefaultCurrencyConverter
+from app.infra.utils.fee_strategy import FeeRateStrategy
+from app.infra.utils.generator import DefaultUniqueValueGenerators
+from app.infra.utils.hasher import DefaultHashFunction
+
+
+@pytest.fixture
+def core() -> BitcoinWalletCore:
+    return BitcoinWalletCore.create(
+        users_repository=InMemoryUsersRepository(),
+        wallets_repository=InMemoryWalletsRepository(),
+        api_key_repository=InMemoryAPIKeyRepository(),
+        transactions_repository=InMemoryTransactionsRepository(),
+        hash_function=DefaultHashFunction(),
+        currency_converter=DefaultCurrencyConverter(),
+        fee_strategy=FeeRateStrategy(),
+        unique_value_generator=DefaultUniqueValueGenerators(),
+    )
+
+
+def test_transactions_page_of_wallet(core: BitcoinWalletCore) -> None:
+    api_key: str = core.register_user(username="user", password="password").api_key
+    address1: str = core.create_wallet(api_key=api_key).wallet_info["address"]
+    address2: str = core.create_wallet(api_key=api_key).wallet_info["address"]
+    for _ in range(3):
+        core.make_transaction(api_key, address1, address2, 10_000_000)
+
+    first: WalletResponse = core.get_transactions_page_of_wallet(
+        api_key=api_key, address=address1, limit=2
+    )
+    second: WalletResponse = core.get_transactions_page_of_wallet(
+        api_key=api_key, address=address1, limit=2, after_id=first.next_cursor
+    )
+
+    assert first.status == 200
+    assert len(first.transactions) == 2
+    assert first.next_cursor is not None
+    assert len(second.transactions) == 1
+    assert second.next_cursor is None
+
+
+def test_transactions_page_newest_first(core: BitcoinWalletCore) -> None:
+    api_key: str = core.register_user(username="user", password="password").api_key
+    address: str = core.create_wallet(api_key=api_key).wallet_info["address"]
+    core.deposit(api_key=api_key, address=address, amount_in_usd=100)
+    core.withdraw(api_key=api_key, address=address, amount_in_usd=50)
+
+    response: WalletResponse = core.get_transactions_page_of_wallet(
+        api_key=api_key, address=address, direction=Direction.DESCENDING
+    )
+
+    assert [t["to_address"] for t in response.transactions] == ["WITHDRAW", address]
+
+
+def test_transactions_page_of_foreign_wallet(core: BitcoinWalletCore) -> None:
+    api_key1: str = core.register_user(username="user1", password="password").api_key
+    api_key2: str = core.register_user(username="user2", password="password").api_key
+    address: str = core.create_wallet(api_key=api_key1).wallet_info["address"]
+
+    assert (
+        core.get_transactions_page_of_wallet(api_key=api_key2, address=address).status
+        == 403
+    )
+    assert (
+        core.get_transactions_page_of_wallet(api_key=api_key1, address="none").status
+        == 404
+    )
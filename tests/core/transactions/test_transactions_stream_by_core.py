@@ -0,0 +1,75 @@
+from typing import List
+
+import pytest
+
+from app.core.facade import (
+    ADMIN_API_KEY,
+    BitcoinWalletCore,
+    TransactionsStreamResponse,
+)
+from app.infra.in_memory.in_memory_api_key_repository import InMemoryAPIKeyRepository
+from app.infra.in_memory.in_memory_transactions_repository import (
+    InMemoryTransactionsRepository,
+)
+from app.infra.in_memory.in_memory_users_repository import InMemoryUsersRepository
+from app.infra.in_memory.in_memory_wallets_repository import InMemoryWalletsRepository
+from app.infra.utils.currency_converter import DefaultCurrencyConverter
+from app.infra.utils.fee_strategy import FeeRateStrategy
+from app.infra.utils.generator import DefaultUniqueValueGenerators
+from app.infra.utils.hasher import DefaultHashFunction
+
+
+@pytest.fixture
+def core() -> BitcoinWalletCore:
+    return BitcoinWalletCore.create(
+        users_repository=InMemoryUsersRepository(),
+        wallets_repository=InMemoryWalletsRepository(),
+        api_key_repository=InMemoryAPIKeyRepository(),
+        transactions_repository=InMemoryTransactionsRepository(),
+        hash_function=DefaultHashFunction(),
+        currency_converter=DefaultCurrencyConverter(),
+        fee_strategy=FeeRateStrategy(),
+        unique_value_generator=DefaultUniqueValueGenerators(),
+    )
+
+
+def test_stream_transactions(core: BitcoinWalletCore) -> None:
+    api_key: str = core.register_user(username="user", password="password").api_key
+    address1: str = core.create_wallet(api_key=api_key).wallet_info["address"]
+    address2: str = core.create_wallet(api_key=api_key).wallet_info["address"]
+    core.make_transaction(api_key, address1, address2, 10_000_000)
+    core.make_transaction(api_key, address2, address1, 20_000_000)
+
+    response: TransactionsStreamResponse = core.stream_transactions(api_key)
+
+    assert response.status == 200
+    assert [(t["amount"], t["amount_in_satoshis"]) for t in response.transactions] == [
+        (0.1, 10_000_000),
+        (0.2, 20_000_000),
+    ]
+
+
+def test_stream_transactions_with_invalid_api_key(core: BitcoinWalletCore) -> None:
+    response: TransactionsStreamResponse = core.stream_transactions("invalid")
+
+    assert response.status == 403
+    assert list(response.transactions) == []
+
+
+def test_stream_transactions_of_other_users_wallets(core: BitcoinWalletCore) -> None:
+    owner: str = core.register_user(username="owner", password="password").api_key
+    address1: str = core.create_wallet(api_key=owner).wallet_info["address"]
+    address2: str = core.create_wallet(api_key=owner).wallet_info["address"]
+    core.make_transaction(owner, address1, address2, 10_000_000)
+    stranger: str = core.register_user(username="stranger", password="pass").api_key
+    address3: str = core.create_wallet(api_key=stranger).wallet_info["address"]
+    core.make_transaction(stranger, address3, address1, 20_000_000)
+
+    def amounts(api_key: str) -> List[int]:
+        response: TransactionsStreamResponse = core.stream_transactions(api_key)
+        assert response.status == 200
+        return [t["amount_in_satoshis"] for t in response.transactions]
+
+    assert amounts(owner) == [10_000_000, 20_000_000]
+    assert amounts(stranger) == [20_000_000]
+    assert amounts(ADMIN_API_KEY) == [10_000_000, 20_000_000]
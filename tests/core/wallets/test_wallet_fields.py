@@ -8,7 +8,7 @@ def wallet() -> Wallet:
     return Wallet(
         _user_id=10,
         _address="wallet_address_1",
-        _balance_btc=10.7,
+        _balance_satoshis=1_070_000_000,
     )
 
 
@@ -21,6 +21,7 @@ def test_address(wallet: Wallet) -> None:
 
 
 def test_balance(wallet: Wallet) -> None:
+    assert wallet.get_balance_in_satoshis() == 1_070_000_000
     assert wallet.get_balance_in_btc() == 10.7
 
 
@@ -28,7 +29,7 @@ def test_equals_method(wallet: Wallet) -> None:
     assert wallet == Wallet(
         _user_id=10,
         _address="wallet_address_1",
-        _balance_btc=10.7,
+        _balance_satoshis=1_070_000_000,
     )
 
 
@@ -0,0 +1,112 @@
+from typing import List
+
+import pytest
+
+from app.core.facade import (
+    MAX_ADDRESSES_PER_LOOKUP,
+    BitcoinWalletCore,
+    WalletsResponse,
+)
+from app.infra.in_memory.in_memory_api_key_repository import InMemoryAPIKeyRepository
+from app.infra.in_memory.in_memory_transactions_repository import (
+    InMemoryTransactionsRepository,
+)
+from app.infra.in_memory.in_memory_users_repository import InMemoryUsersRepository
+from app.infra.in_memory.in_memory_wallets_repository import InMemoryWalletsRepository
+from app.infra.utils.currency_converter import DefaultCurrencyConverter
+from app.infra.utils.fee_strategy import FeeRateStrategy
+from app.infra.utils.generator import DefaultUniqueValueGenerators
+from app.infra.utils.hasher import DefaultHashFunction
+
+
+class CountingCurrencyConverter(DefaultCurrencyConverter):
+    def __init__(self) -> None:
+        super().__init__(_exchange_rate=20_000)
+        self.rate_reads = 0
+
+    def _get_exchange_rate(self) -> float:
+        self.rate_reads += 1
+        return super()._get_exchange_rate()
+
+
+@pytest.fixture
+def currency_converter() -> CountingCurrencyConverter:
+    return CountingCurrencyConverter()
+
+
+@pytest.fixture
+def core(currency_converter: CountingCurrencyConverter) -> BitcoinWalletCore:
+    return BitcoinWalletCore.create(
+        users_repository=InMemoryUsersRepository(),
+        wallets_repository=InMemoryWalletsRepository(),
+        api_key_repository=InMemoryAPIKeyRepository(),
+        transactions_repository=InMemoryTransactionsRepository(),
+        hash_function=DefaultHashFunction(),
+        currency_converter=currency_converter,
+        fee_strategy=FeeRateStrategy(),
+        unique_value_generator=DefaultUniqueValueGenerators(),
+    )
+
+
+def _create_wallets(core: BitcoinWalletCore, api_key: str, count: int) -> List[str]:
+    return [
+        core.create_wallet(api_key=api_key).wallet_info["address"] for _ in range(count)
+    ]
+
+
+def test_wallets_of_user_share_one_rate_read(
+    core: BitcoinWalletCore, currency_converter: CountingCurrencyConverter
+) -> None:
+    api_key: str = core.register_user(username="user", password="password").api_key
+    addresses: List[str] = _create_wallets(core, api_key, 3)
+    currency_converter.rate_reads = 0
+
+    response: WalletsResponse = core.get_wallets_of_user(api_key)
+
+    assert response.status == 200
+    assert [wallet["address"] for wallet in response.wallets] == addresses
+    assert {wallet["balance_in_usd"] for wallet in response.wallets} == {20_000}
+    assert currency_converter.rate_reads == 1
+
+
+def test_user_without_wallets_needs_no_rate(
+    core: BitcoinWalletCore, currency_converter: CountingCurrencyConverter
+) -> None:
+    api_key: str = core.register_user(username="user", password="password").api_key
+
+    assert core.get_wallets_of_user(api_key) == WalletsResponse(status=200)
+    assert currency_converter.rate_reads == 0
+
+
+def test_wallets_are_looked_up_in_request_order(
+    core: BitcoinWalletCore, currency_converter: CountingCurrencyConverter
+) -> None:
+    api_key: str = core.register_user(username="user", password="password").api_key
+    first, second, third = _create_wallets(core, api_key, 3)
+    currency_converter.rate_reads = 0
+
+    response: WalletsResponse = core.get_wallets(api_key, [third, first, third])
+
+    assert response.status == 200
+    assert [wallet["address"] for wallet in response.wallets] == [third, first]
+    assert currency_converter.rate_reads == 1
+
+
+def test_lookup_of_foreign_or_unknown_wallets_fails(core: BitcoinWalletCore) -> None:
+    api_key: str = core.register_user(username="user", password="password").api_key
+    other_api_key: str = core.register_user("other", "password").api_key
+    (own,) = _create_wallets(core, api_key, 1)
+    (foreign,) = _create_wallets(core, other_api_key, 1)
+
+    assert core.get_wallets(api_key, [own, foreign]).status == 403
+    assert core.get_wallets(api_key, [own, "unknown"]).status == 404
+    assert core.get_wallets("invalid", [own]).status == 403
+    assert core.get_wallets_of_user("invalid").status == 403
+
+
+def test_lookup_size_is_bounded(core: BitcoinWalletCore) -> None:
+    api_key: str = core.register_user(username="user", password="password").api_key
+    addresses: List[str] = [str(i) for i in range(MAX_ADDRESSES_PER_LOOKUP + 1)]
+
+    assert core.get_wallets(api_key, []).status == 400
+    assert core.get_wallets(api_key, addresses).status == 400
@@ -0,0 +1,35 @@
+from pathlib import Path
+
+import pytest
+
+from app.core.facade import BitcoinWalletCore
+from app.infra.SQLlite.api_keys_repository import SQLAPIKeysRepository
+from app.infra.SQLlite.connection_pool import SQLiteConnectionPool
+from app.infra.SQLlite.transactions_repository import SQLTransactionsRepository
+from app.infra.SQLlite.unit_of_work import SQLiteUnitOfWork
+from app.infra.SQLlite.users_repository import SQLUsersRepository
+from app.infra.SQLlite.wallets_repository import SQLWalletsRepository
+from app.infra.utils.currency_converter import DefaultCurrencyConverter
+from app.infra.utils.fee_strategy import FeeRateStrategy
+from app.infra.utils.generator import DefaultUniqueValueGenerators
+from app.infra.utils.hasher import DefaultHashFunction
+
+
+@pytest.fixture
+def sql_pool(tmp_path: Path) -> SQLiteConnectionPool:
+    return SQLiteConnectionPool(database_name=str(tmp_path / "bitcoin.db"))
+
+
+@pytest.fixture
+def sql_core(sql_pool: SQLiteConnectionPool) -> BitcoinWalletCore:
+    return BitcoinWalletCore.create(
+        users_repository=SQLUsersRepository(sql_pool),
+        wallets_repository=SQLWalletsRepository(sql_pool),
+        transactions_repository=SQLTransactionsRepository(sql_pool),
+        api_key_repository=SQLAPIKeysRepository(sql_pool),
+        hash_function=DefaultHashFunction(),
+        currency_converter=DefaultCurrencyConverter(),
+        fee_strategy=FeeRateStrategy(),
+        unique_value_generator=DefaultUniqueValueGenerators(),
+        unit_of_work=SQLiteUnitOfWork(sql_pool),
+    )
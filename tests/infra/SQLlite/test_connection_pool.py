@@ -0,0 +1,204 @@
+import sqlite3
+import threading
+from pathlib import Path
+from typing import List
+
+import pytest
+from fastapi import FastAPI
+
+from app import runner
+from app.infra.SQLlite.api_keys_repository import SQLAPIKeysRepository
+from app.infra.SQLlite.connection_pool import (
+    MEMORY_DATABASE,
+    ConnectionPoolTimeoutError,
+    PoolStatistics,
+    SQLiteConnectionPool,
+)
+from app.infra.SQLlite.users_repository import SQLUsersRepository
+
+
+@pytest.fixture
+def pool(tmp_path: Path) -> SQLiteConnectionPool:
+    return SQLiteConnectionPool(
+        database_name=str(tmp_path / "test.db"), pool_size=2, checkout_timeout=0.1
+    )
+
+
+def test_connections_are_reused(pool: SQLiteConnectionPool) -> None:
+    repository: SQLAPIKeysRepository = SQLAPIKeysRepository(pool)
+    for user_id in range(10):
+        repository.add_api_key_id_pair(api_key=f"key_{user_id}", user_id=user_id)
+        assert repository.get_user_id_by_api_key(f"key_{user_id}") == user_id
+
+    statistics: PoolStatistics = pool.statistics()
+    assert statistics.connections_created == 1
+    assert statistics.connections_in_use == 0
+    assert statistics.checkouts == 21
+
+
+def test_nested_connection_on_same_thread_is_shared(
+    pool: SQLiteConnectionPool,
+) -> None:
+    with pool.connection() as outer:
+        with pool.connection() as inner:
+            assert outer is inner
+        assert pool.statistics().checkouts == 1
+
+
+def test_nested_connection_commits_once(pool: SQLiteConnectionPool) -> None:
+    repository: SQLAPIKeysRepository = SQLAPIKeysRepository(pool)
+    with pool.connection() as conn:
+        repository.add_api_key_id_pair(api_key="key", user_id=1)
+        assert conn.in_transaction
+
+    assert repository.get_user_id_by_api_key("key") == 1
+
+
+def test_exception_rolls_back(pool: SQLiteConnectionPool) -> None:
+    repository: SQLAPIKeysRepository = SQLAPIKeysRepository(pool)
+    with pytest.raises(RuntimeError):
+        with pool.connection():
+            repository.add_api_key_id_pair(api_key="key", user_id=1)
+            raise RuntimeError()
+
+    assert repository.get_user_id_by_api_key("key") == -1
+
+
+def test_checkout_timeout(pool: SQLiteConnectionPool) -> None:
+    pool.acquire()
+    pool.acquire()
+    with pytest.raises(ConnectionPoolTimeoutError):
+        pool.acquire()
+
+    assert pool.statistics().checkout_timeouts == 1
+    assert pool.statistics().checkout_waits == 1
+
+
+def test_pool_is_shared_between_threads(tmp_path: Path) -> None:
+    pool: SQLiteConnectionPool = SQLiteConnectionPool(
+        database_name=str(tmp_path / "test.db"), pool_size=2
+    )
+    repository: SQLAPIKeysRepository = SQLAPIKeysRepository(pool)
+    errors: List[Exception] = []
+
+    def register(offset: int) -> None:
+        try:
+            for user_id in range(offset, offset + 20):
+                repository.add_api_key_id_pair(f"key_{user_id}", user_id)
+        except Exception as error:  # pragma: no cover
+            errors.append(error)
+
+    threads: List[threading.Thread] = [
+        threading.Thread(target=register, args=(offset,)) for offset in (0, 20, 40)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert repository.get_user_id_by_api_key("key_59") == 59
+    assert pool.statistics().connections_created <= 2
+
+
+def test_memory_database_is_shared_by_the_pool_connections() -> None:
+    pool: SQLiteConnectionPool = SQLiteConnectionPool(
+        database_name=MEMORY_DATABASE, pool_size=3
+    )
+    repository: SQLAPIKeysRepository = SQLAPIKeysRepository(pool)
+    errors: List[Exception] = []
+
+    def register(offset: int) -> None:
+        try:
+            for user_id in range(offset, offset + 50):
+                repository.add_api_key_id_pair(f"key_{user_id}", user_id)
+        except Exception as error:  # pragma: no cover
+            errors.append(error)
+
+    threads: List[threading.Thread] = [
+        threading.Thread(target=register, args=(offset,)) for offset in (0, 50, 100)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    first, second = pool.acquire(), pool.acquire()
+    for conn in (first, second):
+        assert conn.execute("SELECT COUNT(*) FROM api_keys").fetchone()[0] == 150
+    pool.close()
+
+
+def test_memory_databases_of_different_pools_are_isolated() -> None:
+    first: SQLiteConnectionPool = SQLiteConnectionPool(database_name=MEMORY_DATABASE)
+    second: SQLiteConnectionPool = SQLiteConnectionPool(database_name=MEMORY_DATABASE)
+    SQLAPIKeysRepository(first).add_api_key_id_pair(api_key="key", user_id=1)
+
+    assert SQLAPIKeysRepository(first).get_user_id_by_api_key("key") == 1
+    assert SQLAPIKeysRepository(second).get_user_id_by_api_key("key") == -1
+
+
+def test_uri_options_are_honoured(tmp_path: Path) -> None:
+    path: Path = tmp_path / "test.db"
+    with pytest.raises(sqlite3.OperationalError):
+        SQLiteConnectionPool(database_name=f"file:{path}?mode=rw").acquire()
+
+    writable: SQLiteConnectionPool = SQLiteConnectionPool(
+        database_name=f"file:{path}?mode=rwc"
+    )
+    SQLAPIKeysRepository(writable).add_api_key_id_pair(api_key="key", user_id=1)
+    read_only: SQLiteConnectionPool = SQLiteConnectionPool(
+        database_name=f"file:{path}?mode=ro"
+    )
+    with read_only.connection() as conn:
+        assert conn.execute("SELECT COUNT(*) FROM api_keys").fetchone()[0] == 1
+        with pytest.raises(sqlite3.OperationalError):
+            conn.execute("DELETE FROM api_keys")
+
+
+def test_setup_opens_a_migrated_database_read_only(tmp_path: Path) -> None:
+    path: Path = tmp_path / "test.db"
+    writable: FastAPI = runner.setup(runner.Configuration(database_name=str(path)))
+    writable.state.core.register_user("user", "password")
+    writable.state.connection_pool.close()
+
+    read_only: FastAPI = runner.setup(
+        runner.Configuration(database_name=f"file:{path}?mode=ro")
+    )
+
+    assert read_only.state.core.get_user("user") is not None
+    with pytest.raises(sqlite3.OperationalError):
+        read_only.state.core.register_user("other", "password")
+
+
+def test_setup_accepts_a_memory_database() -> None:
+    app: FastAPI = runner.setup(runner.Configuration(database_name=MEMORY_DATABASE))
+    users: SQLUsersRepository = SQLUsersRepository(app.state.connection_pool)
+
+    app.state.core.register_user("user", "password")
+    assert users.get_user_by_username("user") is not None
+
+
+def test_transaction_callbacks_see_the_outcome(pool: SQLiteConnectionPool) -> None:
+    outcomes: List[str] = []
+    pool.on_transaction_end(lambda committed: outcomes.append(f"none {committed}"))
+
+    with pool.connection():
+        pool.on_transaction_end(lambda committed: outcomes.append(f"ok {committed}"))
+        with pytest.raises(RuntimeError):
+            with pool.savepoint("inner"):
+                pool.on_transaction_end(
+                    lambda committed: outcomes.append(f"inner {committed}")
+                )
+                raise RuntimeError()
+        assert outcomes == ["none True"]
+
+    with pytest.raises(RuntimeError):
+        with pool.connection():
+            pool.on_transaction_end(
+                lambda committed: outcomes.append(f"failed {committed}")
+            )
+            raise RuntimeError()
+
+    assert outcomes == ["none True", "inner False", "ok True", "failed False"]
@@ -0,0 +1,142 @@
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Callable, Iterator, List, Optional
+
+import pytest
+
+from app.core.facade import BitcoinWalletCore
+from app.core.transactions.interactor import Transaction
+from app.core.wallets.interactor import Wallet
+from app.infra.SQLlite.api_keys_repository import SQLAPIKeysRepository
+from app.infra.SQLlite.connection_pool import SQLiteConnectionPool
+from app.infra.SQLlite.group_commit import (
+    GroupCommitStatistics,
+    GroupCommitUnitOfWork,
+)
+from app.infra.SQLlite.transactions_repository import SQLTransactionsRepository
+from app.infra.SQLlite.users_repository import SQLUsersRepository
+from app.infra.SQLlite.wallets_repository import SQLWalletsRepository
+from app.infra.utils.currency_converter import DefaultCurrencyConverter
+from app.infra.utils.fee_strategy import FeeRateStrategy
+from app.infra.utils.generator import DefaultUniqueValueGenerators
+from app.infra.utils.hasher import DefaultHashFunction
+
+NUMBER_OF_THREADS: int = 16
+ATTEMPTS_PER_THREAD: int = 25
+
+
+@pytest.fixture
+def group_commit(sql_pool: SQLiteConnectionPool) -> Iterator[GroupCommitUnitOfWork]:
+    unit_of_work = GroupCommitUnitOfWork(sql_pool, max_batch_size=8, max_delay=0.01)
+    yield unit_of_work
+    unit_of_work.close()
+
+
+def _in_parallel(target: List[threading.Thread]) -> None:
+    for thread in target:
+        thread.start()
+    for thread in target:
+        thread.join()
+
+
+def test_concurrent_transfers_are_batched_and_never_overdraw(
+    sql_pool: SQLiteConnectionPool, group_commit: GroupCommitUnitOfWork
+) -> None:
+    core: BitcoinWalletCore = BitcoinWalletCore.create(
+        users_repository=SQLUsersRepository(sql_pool),
+        wallets_repository=SQLWalletsRepository(sql_pool),
+        transactions_repository=SQLTransactionsRepository(sql_pool),
+        api_key_repository=SQLAPIKeysRepository(sql_pool),
+        hash_function=DefaultHashFunction(),
+        currency_converter=DefaultCurrencyConverter(),
+        fee_strategy=FeeRateStrategy(),
+        unique_value_generator=DefaultUniqueValueGenerators(),
+        unit_of_work=group_commit,
+    )
+    api_key: str = core.register_user("sender", "password").api_key
+    sender: str = core.create_wallet(api_key).wallet_info["address"]
+    receiver: str = core.create_wallet(api_key).wallet_info["address"]
+    statuses: List[int] = []
+
+    def transfer_repeatedly() -> None:
+        for _ in range(ATTEMPTS_PER_THREAD):
+            statuses.append(
+                core.make_transaction(api_key, sender, receiver, 12_500_000).status
+            )
+
+    _in_parallel(
+        [threading.Thread(target=transfer_repeatedly) for _ in range(NUMBER_OF_THREADS)]
+    )
+
+    wallets: SQLWalletsRepository = SQLWalletsRepository(sql_pool)
+    sender_wallet: Optional[Wallet] = wallets.get_wallet(sender)
+    assert sender_wallet is not None
+    assert statuses.count(201) == 8
+    assert sender_wallet.get_balance_in_satoshis() == 0
+
+    statistics: GroupCommitStatistics = group_commit.statistics()
+    assert statistics.writes == NUMBER_OF_THREADS * ATTEMPTS_PER_THREAD + 3
+    assert statistics.batches < statistics.writes
+    assert 1 < statistics.largest_batch <= 8
+
+
+def test_failed_write_rolls_back_alone(
+    sql_pool: SQLiteConnectionPool, group_commit: GroupCommitUnitOfWork
+) -> None:
+    transactions: SQLTransactionsRepository = SQLTransactionsRepository(sql_pool)
+    barrier: threading.Barrier = threading.Barrier(3)
+    errors: List[Exception] = []
+
+    def add(amount: int) -> None:
+        transactions.add_transaction(Transaction("a", "b", amount, 0))
+
+    def add_then_fail() -> None:
+        add(2)
+        raise RuntimeError()
+
+    def submit(operation: Callable[[], None]) -> None:
+        barrier.wait()
+        try:
+            group_commit.run(operation)
+        except RuntimeError as e:
+            errors.append(e)
+
+    _in_parallel(
+        [
+            threading.Thread(target=submit, args=(lambda: add(1),)),
+            threading.Thread(target=submit, args=(add_then_fail,)),
+            threading.Thread(target=submit, args=(lambda: add(3),)),
+        ]
+    )
+
+    assert len(errors) == 1
+    assert sorted(t.amount for t in transactions.get_all_transactions()) == [1, 3]
+
+
+def test_write_is_durable_when_run_returns(
+    tmp_path: Path, sql_pool: SQLiteConnectionPool, group_commit: GroupCommitUnitOfWork
+) -> None:
+    transactions: SQLTransactionsRepository = SQLTransactionsRepository(sql_pool)
+
+    group_commit.run(lambda: transactions.add_transaction(Transaction("a", "b", 1, 0)))
+
+    with sqlite3.connect(tmp_path / "bitcoin.db") as conn:
+        assert conn.execute("SELECT COUNT(*) FROM transactions").fetchone()[0] == 1
+    conn.close()
+
+
+def test_nested_run_joins_the_batch(
+    sql_pool: SQLiteConnectionPool, group_commit: GroupCommitUnitOfWork
+) -> None:
+    transactions: SQLTransactionsRepository = SQLTransactionsRepository(sql_pool)
+
+    def add() -> int:
+        transactions.add_transaction(Transaction("a", "b", 1, 0))
+        return 7
+
+    def add_nested() -> int:
+        return group_commit.run(add)
+
+    assert group_commit.run(add_nested) == 7
+    assert group_commit.statistics().writes == 1
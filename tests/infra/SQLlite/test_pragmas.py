@@ -0,0 +1,69 @@
+import sqlite3 as database
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from app.infra.SQLlite.connection_pool import SQLiteConnectionPool
+from app.infra.SQLlite.pragmas import (
+    PRAGMA_PROFILES,
+    PragmaProfile,
+    get_pragma_profile,
+)
+
+SYNCHRONOUS_LEVELS = {"OFF": 0, "NORMAL": 1, "FULL": 2, "EXTRA": 3}
+TEMP_STORE_LEVELS = {"DEFAULT": 0, "FILE": 1, "MEMORY": 2}
+
+
+def _pragma(conn: database.Connection, name: str) -> Any:
+    return conn.execute(f"PRAGMA {name}").fetchone()[0]
+
+
+@pytest.mark.parametrize("name", sorted(PRAGMA_PROFILES))
+def test_pool_connections_use_the_profile(tmp_path: Path, name: str) -> None:
+    profile: PragmaProfile = get_pragma_profile(name)
+    pool: SQLiteConnectionPool = SQLiteConnectionPool(
+        database_name=str(tmp_path / "test.db"), pragma_profile=profile
+    )
+
+    with pool.connection() as conn:
+        assert _pragma(conn, "journal_mode") == profile.journal_mode.lower()
+        assert _pragma(conn, "synchronous") == SYNCHRONOUS_LEVELS[profile.synchronous]
+        assert _pragma(conn, "cache_size") == profile.cache_size
+        assert _pragma(conn, "temp_store") == TEMP_STORE_LEVELS[profile.temp_store]
+        assert _pragma(conn, "busy_timeout") == profile.busy_timeout
+    pool.close()
+
+
+def test_balanced_profile_is_wal_with_normal_sync() -> None:
+    profile: PragmaProfile = get_pragma_profile("balanced")
+    assert (profile.journal_mode, profile.synchronous) == ("WAL", "NORMAL")
+
+
+def test_reader_is_not_blocked_by_an_open_write_in_wal(tmp_path: Path) -> None:
+    pool: SQLiteConnectionPool = SQLiteConnectionPool(
+        database_name=str(tmp_path / "test.db"),
+        pragma_profile=get_pragma_profile("balanced"),
+    )
+    with pool.connection() as conn:
+        conn.execute("CREATE TABLE t (value INTEGER)")
+        conn.execute("INSERT INTO t VALUES (1)")
+
+    writer: database.Connection = pool.acquire()
+    writer.execute("BEGIN IMMEDIATE")
+    writer.execute("UPDATE t SET value = 2")
+
+    reader: database.Connection = pool.acquire()
+    reader.execute("PRAGMA busy_timeout = 0")  # fail instead of waiting
+    assert reader.execute("SELECT value FROM t").fetchone()[0] == 1
+
+    writer.commit()
+    assert reader.execute("SELECT value FROM t").fetchone()[0] == 2
+    pool.release(writer)
+    pool.release(reader)
+    pool.close()
+
+
+def test_unknown_profile_is_rejected() -> None:
+    with pytest.raises(ValueError):
+        get_pragma_profile("fastest")
@@ -0,0 +1,83 @@
+from typing import Any, Callable, Dict, List
+
+from app.core.transactions.interactor import Direction, Transaction
+from app.core.users.interactor import User
+from app.core.wallets.interactor import Wallet
+from app.infra.SQLlite.api_keys_repository import SQLAPIKeysRepository
+from app.infra.SQLlite.connection_pool import SQLiteConnectionPool
+from app.infra.SQLlite.query_plans import (
+    CapturedStatements,
+    QueryPlan,
+    capture_statements,
+    find_full_scans,
+)
+from app.infra.SQLlite.transactions_repository import SQLTransactionsRepository
+from app.infra.SQLlite.users_repository import SQLUsersRepository
+from app.infra.SQLlite.wallets_repository import SQLWalletsRepository
+
+# reads that return a whole table, a scan is what they are for
+INTENDED_FULL_SCANS: List[str] = [
+    "users.get_all_users",
+    "transactions.get_all_transactions",
+]
+
+
+def test_repository_queries_use_indexes(sql_pool: SQLiteConnectionPool) -> None:
+    users: SQLUsersRepository = SQLUsersRepository(sql_pool)
+    wallets: SQLWalletsRepository = SQLWalletsRepository(sql_pool)
+    transactions: SQLTransactionsRepository = SQLTransactionsRepository(sql_pool)
+    api_keys: SQLAPIKeysRepository = SQLAPIKeysRepository(sql_pool)
+
+    # every query each repository method issues
+    queries: Dict[str, Callable[[], Any]] = {
+        "users.add_user": lambda: users.add_user(User(0, "user", "password")),
+        "users.get_user_by_username": lambda: users.get_user_by_username("user"),
+        "users.get_user_by_id": lambda: users.get_user_by_id(1),
+        "users.get_all_users": users.get_all_users,
+        "users.get_max_user_id": users.get_max_user_id,
+        "wallets.add_wallet": lambda: wallets.add_wallet(Wallet(1, "a", 10)),
+        "wallets.get_wallet": lambda: wallets.get_wallet("a"),
+        "wallets.get_wallets": lambda: wallets.get_wallets(["a", "b"]),
+        "wallets.deposit": lambda: wallets.deposit("a", 1),
+        "wallets.withdraw": lambda: wallets.withdraw("a", 1),
+        "wallets.get_all_wallets_of_user": lambda: wallets.get_all_wallets_of_user(1),
+        "wallets.get_number_of_wallets_of_user": (
+            lambda: wallets.get_number_of_wallets_of_user(1)
+        ),
+        "transactions.add_transaction": lambda: transactions.add_transaction(
+            Transaction("a", "b", 1, 0)
+        ),
+        "transactions.get_all_transactions": transactions.get_all_transactions,
+        "transactions.iterate_all_transactions": (
+            lambda: list(transactions.iterate_all_transactions(10))
+        ),
+        "transactions.iterate_wallets_transactions": (
+            lambda: list(transactions.iterate_wallets_transactions(["a", "b"], 10))
+        ),
+        "transactions.get_wallet_transactions": (
+            lambda: transactions.get_wallet_transactions("a")
+        ),
+        "transactions.get_wallet_transactions_page": (
+            lambda: transactions.get_wallet_transactions_page("a", 10)
+        ),
+        "transactions.get_wallet_transactions_page_descending": (
+            lambda: transactions.get_wallet_transactions_page(
+                "a", 10, direction=Direction.DESCENDING
+            )
+        ),
+        "transactions.get_statistics": transactions.get_statistics,
+        "api_keys.add_api_key_id_pair": lambda: api_keys.add_api_key_id_pair("k", 1),
+        "api_keys.get_user_id_by_api_key": lambda: api_keys.get_user_id_by_api_key("k"),
+    }
+
+    full_scans: Dict[str, List[str]] = {}
+    for name, query in queries.items():
+        statements: CapturedStatements
+        with capture_statements() as statements:
+            query()
+        assert statements.parameters_by_sql, f"{name} issued no SQL"
+        plans: List[QueryPlan] = find_full_scans(sql_pool, statements)
+        if plans:
+            full_scans[name] = [plan.describe() for plan in plans]
+
+    assert sorted(full_scans) == sorted(INTENDED_FULL_SCANS), full_scans
@@ -0,0 +1,86 @@
+import logging
+from pathlib import Path
+
+import pytest
+
+from app.core.facade import BitcoinWalletCore
+from app.infra.SQLlite.connection_pool import SQLiteConnectionPool
+from app.infra.SQLlite.query_tracking import (
+    QueryBudgetExceededError,
+    assert_max_queries,
+    parameter_shape,
+    track_queries,
+)
+
+
+def test_statements_rows_and_connections_are_counted(
+    sql_pool: SQLiteConnectionPool,
+) -> None:
+    with sql_pool.connection() as conn:
+        conn.execute("CREATE TABLE numbers (n INTEGER)")
+        conn.executemany("INSERT INTO numbers VALUES (?)", [(1,), (2,), (3,)])
+
+    with track_queries() as outer:
+        with sql_pool.connection() as conn:
+            assert len(conn.execute("SELECT n FROM numbers").fetchall()) == 3
+        with track_queries() as inner:
+            with sql_pool.connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute("SELECT n FROM numbers WHERE n > ?", (1,))
+                assert [row[0] for row in cursor] == [2, 3]
+
+    assert (outer.statements, outer.rows, outer.connections) == (2, 5, 2)
+    assert (inner.statements, inner.rows, inner.connections) == (1, 2, 1)
+    assert outer.seconds >= inner.seconds > 0
+
+
+def test_exceeded_budget_lists_the_statements(
+    sql_core: BitcoinWalletCore,
+) -> None:
+    api_key: str = sql_core.register_user("user", "password").api_key
+    address: str = sql_core.create_wallet(api_key).wallet_info["address"]
+
+    with pytest.raises(QueryBudgetExceededError) as error:
+        with assert_max_queries(1):
+            for _ in range(3):
+                sql_core.get_wallet(api_key, address)
+
+    assert "3 x SELECT user_id FROM api_keys WHERE api_key=?" in str(error.value)
+
+
+def test_transfer_runs_on_one_connection(sql_core: BitcoinWalletCore) -> None:
+    api_key: str = sql_core.register_user("user", "password").api_key
+    first: str = sql_core.create_wallet(api_key).wallet_info["address"]
+    second: str = sql_core.create_wallet(api_key).wallet_info["address"]
+
+    with assert_max_queries(statements=7, connections=1) as statistics:
+        assert sql_core.make_transaction(api_key, first, second, 1_000).status == 201
+
+    assert statistics.repeated_statements() == []
+
+
+def test_slow_statements_are_logged_with_their_parameter_shapes(
+    tmp_path: Path, caplog: pytest.LogCaptureFixture
+) -> None:
+    pool: SQLiteConnectionPool = SQLiteConnectionPool(
+        database_name=str(tmp_path / "bitcoin.db"), slow_query_threshold=0.0
+    )
+    with pool.connection() as conn:
+        conn.execute("CREATE TABLE keys (user_id INTEGER, api_key TEXT)")
+        with caplog.at_level(
+            logging.WARNING, logger="app.infra.SQLlite.query_tracking"
+        ):
+            conn.execute("INSERT INTO keys VALUES (?, ?)", (1, "secret-key"))
+
+    record: logging.LogRecord = caplog.records[-1]
+    assert "INSERT INTO keys VALUES (?, ?) with parameters (int, str[10])" in (
+        record.getMessage()
+    )
+    assert "secret-key" not in record.getMessage()
+    assert record.__dict__["sql_seconds"] >= 0
+
+
+def test_parameter_shapes_collapse_runs_of_the_same_type() -> None:
+    assert parameter_shape(["a", "b", "c", 1]) == "(str[1] x 3, int)"
+    assert parameter_shape({"address": b"ab"}) == "{address: bytes[2]}"
+    assert parameter_shape([(1, None), (2, None)], many=True) == "2 x (int, NoneType)"
@@ -0,0 +1,51 @@
+from typing import Any, List, Tuple
+
+import pytest
+
+from app.core.facade import BitcoinWalletCore, Transfer, TransfersBatchResponse
+from app.infra.SQLlite.connection_pool import SQLiteConnectionPool
+
+
+def _accounts(core: BitcoinWalletCore) -> Tuple[str, str, str]:
+    api_key: str = core.register_user(username="payer", password="password").api_key
+    first: str = core.create_wallet(api_key=api_key).wallet_info["address"]
+    second: str = core.create_wallet(api_key=api_key).wallet_info["address"]
+    return api_key, first, second
+
+
+def test_batch_reads_wallets_once_and_commits_once(
+    sql_core: BitcoinWalletCore, sql_pool: SQLiteConnectionPool
+) -> None:
+    api_key, first, second = _accounts(sql_core)
+    statements: List[str] = []
+    with sql_pool.connection() as conn:
+        conn.set_trace_callback(statements.append)
+
+    response: TransfersBatchResponse = sql_core.make_transactions(
+        api_key,
+        [Transfer(first, second, 1_000), Transfer(second, first, 500)] * 50,
+    )
+
+    assert response.status == 201
+    assert sum("FROM wallets" in statement for statement in statements) == 1
+    assert sum(statement == "COMMIT" for statement in statements) == 1
+    assert sum("UPDATE wallets" in statement for statement in statements) == 2
+
+
+def test_failed_batch_is_rolled_back(
+    sql_core: BitcoinWalletCore, monkeypatch: Any
+) -> None:
+    api_key, first, second = _accounts(sql_core)
+
+    def fail(*args: Any) -> None:
+        raise RuntimeError()
+
+    monkeypatch.setattr(sql_core._transactions_interactor, "make_transaction", fail)
+    with pytest.raises(RuntimeError):
+        sql_core.make_transactions(api_key, [Transfer(first, second, 1_000)])
+    monkeypatch.undo()
+
+    assert [
+        sql_core.get_wallet(api_key, address).wallet_info["balance_in_satoshis"]
+        for address in (first, second)
+    ] == [100_000_000, 100_000_000]
@@ -0,0 +1,127 @@
+import sqlite3
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from app.core.transactions.interactor import Transaction, TransactionsStatistics
+from app.infra.SQLlite.connection_pool import SQLiteConnectionPool
+from app.infra.SQLlite.migrations import SchemaMigrator
+from app.infra.SQLlite.transactions_repository import (
+    TRANSACTIONS_MIGRATIONS,
+    SQLTransactionsRepository,
+)
+
+
+@pytest.fixture
+def repository(sql_pool: SQLiteConnectionPool) -> SQLTransactionsRepository:
+    return SQLTransactionsRepository(sql_pool)
+
+
+def _query_plan(pool: SQLiteConnectionPool, query: str) -> List[str]:
+    with pool.connection() as conn:
+        return [row[3] for row in conn.execute("EXPLAIN QUERY PLAN " + query)]
+
+
+def test_wallet_transactions_are_returned_in_insertion_order(
+    repository: SQLTransactionsRepository,
+) -> None:
+    transactions: List[Transaction] = [
+        Transaction("a", "b", 1, 0),
+        Transaction("c", "d", 2, 0),
+        Transaction("b", "a", 3, 0),
+        Transaction("DEPOSIT", "a", 4, 0),
+    ]
+    for transaction in transactions:
+        repository.add_transaction(transaction)
+
+    assert repository.get_wallet_transactions("a") == [
+        transactions[0],
+        transactions[2],
+        transactions[3],
+    ]
+
+
+def test_self_transfer_is_returned_once(
+    repository: SQLTransactionsRepository,
+) -> None:
+    repository.add_transaction(Transaction("a", "a", 1, 0))
+
+    assert repository.get_wallet_transactions("a") == [Transaction("a", "a", 1, 0)]
+
+
+def test_wallet_history_query_uses_indexes(
+    repository: SQLTransactionsRepository, sql_pool: SQLiteConnectionPool
+) -> None:
+    plan: List[str] = _query_plan(
+        sql_pool,
+        "SELECT id FROM transactions WHERE from_address = 'a' "
+        "UNION ALL "
+        "SELECT id FROM transactions WHERE to_address = 'a' AND from_address != 'a' "
+        "ORDER BY id",
+    )
+
+    assert any("idx_transactions_from_address" in step for step in plan)
+    assert any("idx_transactions_to_address" in step for step in plan)
+    assert not any(step.startswith("SCAN transactions") for step in plan)
+
+
+def test_legacy_table_is_migrated(tmp_path: Path) -> None:
+    database_name: str = str(tmp_path / "legacy.db")
+    with sqlite3.connect(database_name) as conn:
+        conn.execute(
+            "CREATE TABLE transactions "
+            "(from_address TEXT, to_address TEXT, amount REAL, fee REAL)"
+        )
+        conn.execute("INSERT INTO transactions VALUES ('a', 'b', 1.5, 0.5)")
+        conn.execute("INSERT INTO transactions VALUES ('b', 'a', 2.5, 0)")
+    conn.close()
+
+    pool: SQLiteConnectionPool = SQLiteConnectionPool(database_name=database_name)
+    repository: SQLTransactionsRepository = SQLTransactionsRepository(pool)
+
+    assert repository.get_all_transactions() == [
+        Transaction("a", "b", 150_000_000, 50_000_000),
+        Transaction("b", "a", 250_000_000, 0),
+    ]
+    with pool.connection() as conn:
+        rows = conn.execute("SELECT id, created_at FROM transactions").fetchall()
+    assert [row[0] for row in rows] == [1, 2]
+    assert all(row[1] is not None for row in rows)
+    assert repository.get_statistics() == TransactionsStatistics(
+        number_of_transactions=2, total_fee=50_000_000
+    )
+    assert SchemaMigrator(pool).get_version("transactions") == len(
+        TRANSACTIONS_MIGRATIONS
+    )
+
+
+def test_migrations_run_only_once(sql_pool: SQLiteConnectionPool) -> None:
+    repository: SQLTransactionsRepository = SQLTransactionsRepository(sql_pool)
+    repository.add_transaction(Transaction("a", "b", 1, 0))
+
+    SQLTransactionsRepository(sql_pool)
+
+    assert repository.get_all_transactions() == [Transaction("a", "b", 1, 0)]
+
+
+def test_statistics_follow_every_insert(
+    repository: SQLTransactionsRepository,
+) -> None:
+    repository.add_transaction(Transaction("a", "b", 1, 25))
+    repository.add_transaction(Transaction("b", "a", 2, 50))
+
+    assert repository.get_statistics() == TransactionsStatistics(
+        number_of_transactions=2, total_fee=75
+    )
+
+
+def test_statistics_roll_back_with_the_ledger(
+    repository: SQLTransactionsRepository, sql_pool: SQLiteConnectionPool
+) -> None:
+    with pytest.raises(RuntimeError):
+        with sql_pool.connection():
+            repository.add_transaction(Transaction("a", "b", 1, 25))
+            raise RuntimeError()
+
+    assert repository.get_statistics() == TransactionsStatistics()
@@ -0,0 +1,97 @@
+from typing import List
+
+import pytest
+
+from app.core.facade import BitcoinWalletCore
+from app.core.transactions.interactor import Transaction
+from app.core.wallets.interactor import Wallet
+from app.infra.SQLlite.connection_pool import SQLiteConnectionPool
+from app.infra.SQLlite.transactions_repository import SQLTransactionsRepository
+from app.infra.SQLlite.unit_of_work import SQLiteUnitOfWork
+from app.infra.SQLlite.wallets_repository import SQLWalletsRepository
+
+
+def _register_with_wallet(core: BitcoinWalletCore, username: str) -> List[str]:
+    api_key: str = core.register_user(username=username, password="password").api_key
+    address: str = core.create_wallet(api_key=api_key).wallet_info["address"]
+    return [api_key, address]
+
+
+def test_transfer_uses_one_connection_checkout(
+    sql_core: BitcoinWalletCore, sql_pool: SQLiteConnectionPool
+) -> None:
+    api_key, sender = _register_with_wallet(sql_core, "sender")
+    _, receiver = _register_with_wallet(sql_core, "receiver")
+
+    checkouts_before: int = sql_pool.statistics().checkouts
+    response = sql_core.make_transaction(
+        api_key=api_key,
+        from_address=sender,
+        to_address=receiver,
+        amount_in_satoshis=50_000_000,
+    )
+
+    assert response.status == 201
+    assert sql_pool.statistics().checkouts == checkouts_before + 1
+
+
+def test_transfer_is_persisted(
+    sql_core: BitcoinWalletCore, sql_pool: SQLiteConnectionPool
+) -> None:
+    api_key, sender = _register_with_wallet(sql_core, "sender")
+    _, receiver = _register_with_wallet(sql_core, "receiver")
+
+    sql_core.make_transaction(
+        api_key=api_key,
+        from_address=sender,
+        to_address=receiver,
+        amount_in_satoshis=50_000_000,
+    )
+
+    wallets: SQLWalletsRepository = SQLWalletsRepository(sql_pool)
+    sender_wallet = wallets.get_wallet(sender)
+    receiver_wallet = wallets.get_wallet(receiver)
+    assert sender_wallet is not None and receiver_wallet is not None
+    assert sender_wallet.get_balance_in_satoshis() == 49_250_000
+    assert receiver_wallet.get_balance_in_satoshis() == 150_000_000
+    assert len(SQLTransactionsRepository(sql_pool).get_all_transactions()) == 1
+
+
+def test_failed_operation_rolls_back_every_write(
+    sql_pool: SQLiteConnectionPool,
+) -> None:
+    wallets: SQLWalletsRepository = SQLWalletsRepository(sql_pool)
+    transactions: SQLTransactionsRepository = SQLTransactionsRepository(sql_pool)
+    wallets.add_wallet(Wallet(_user_id=1, _address="a", _balance_satoshis=100))
+
+    def transfer_then_fail() -> None:
+        transactions.add_transaction(Transaction("a", "b", 50, 0))
+        wallets.withdraw("a", 50)
+        raise RuntimeError()
+
+    with pytest.raises(RuntimeError):
+        SQLiteUnitOfWork(sql_pool).run(transfer_then_fail)
+
+    wallet = wallets.get_wallet("a")
+    assert wallet is not None
+    assert wallet.get_balance_in_satoshis() == 100
+    assert transactions.get_all_transactions() == []
+
+
+def test_nested_unit_of_work_joins_outer_transaction(
+    sql_pool: SQLiteConnectionPool,
+) -> None:
+    unit_of_work: SQLiteUnitOfWork = SQLiteUnitOfWork(sql_pool)
+    transactions: SQLTransactionsRepository = SQLTransactionsRepository(sql_pool)
+
+    def add() -> None:
+        transactions.add_transaction(Transaction("a", "b", 50, 0))
+
+    def add_nested_then_fail() -> None:
+        unit_of_work.run(add)
+        raise RuntimeError()
+
+    with pytest.raises(RuntimeError):
+        unit_of_work.run(add_nested_then_fail)
+
+    assert transactions.get_all_transactions() == []
@@ -0,0 +1,67 @@
+import threading
+from pathlib import Path
+from typing import Callable, List, Optional
+
+from app.core.facade import BitcoinWalletCore
+from app.core.wallets.interactor import Wallet
+from app.infra.SQLlite.connection_pool import SQLiteConnectionPool
+from app.infra.SQLlite.wallets_repository import SQLWalletsRepository
+
+NUMBER_OF_THREADS: int = 16
+ATTEMPTS_PER_THREAD: int = 25
+
+
+def _hammer(target: Callable[[], None]) -> None:
+    threads: List[threading.Thread] = [
+        threading.Thread(target=target) for _ in range(NUMBER_OF_THREADS)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+def test_concurrent_withdrawals_never_overdraw(tmp_path: Path) -> None:
+    pool: SQLiteConnectionPool = SQLiteConnectionPool(
+        database_name=str(tmp_path / "bitcoin.db"), pool_size=8
+    )
+    wallets: SQLWalletsRepository = SQLWalletsRepository(pool)
+    wallets.add_wallet(Wallet(_user_id=1, _address="hot", _balance_satoshis=1000))
+    successes: List[bool] = []
+
+    def withdraw_repeatedly() -> None:
+        for _ in range(ATTEMPTS_PER_THREAD):
+            successes.append(wallets.withdraw(address="hot", amount=25))
+
+    _hammer(withdraw_repeatedly)
+
+    wallet: Optional[Wallet] = wallets.get_wallet("hot")
+    assert wallet is not None
+    assert successes.count(True) == 40
+    assert wallet.get_balance_in_satoshis() == 0
+
+
+def test_concurrent_transfers_never_overdraw(
+    sql_core: BitcoinWalletCore, sql_pool: SQLiteConnectionPool
+) -> None:
+    api_key: str = sql_core.register_user("sender", "password").api_key
+    sender: str = sql_core.create_wallet(api_key).wallet_info["address"]
+    receiver: str = sql_core.create_wallet(api_key).wallet_info["address"]
+    statuses: List[int] = []
+
+    def transfer_repeatedly() -> None:
+        for _ in range(ATTEMPTS_PER_THREAD):
+            statuses.append(
+                sql_core.make_transaction(api_key, sender, receiver, 12_500_000).status
+            )
+
+    _hammer(transfer_repeatedly)
+
+    wallets: SQLWalletsRepository = SQLWalletsRepository(sql_pool)
+    sender_wallet: Optional[Wallet] = wallets.get_wallet(sender)
+    receiver_wallet: Optional[Wallet] = wallets.get_wallet(receiver)
+    assert sender_wallet is not None and receiver_wallet is not None
+    assert statuses.count(201) == 8
+    assert statuses.count(400) == NUMBER_OF_THREADS * ATTEMPTS_PER_THREAD - 8
+    assert sender_wallet.get_balance_in_satoshis() == 0
+    assert receiver_wallet.get_balance_in_satoshis() == 200_000_000
@@ -0,0 +1,20 @@
+from typing import List
+
+from app.core.facade import BitcoinWalletCore
+from app.infra.SQLlite.connection_pool import SQLiteConnectionPool
+
+
+def test_wallet_listings_take_one_wallets_query(
+    sql_core: BitcoinWalletCore, sql_pool: SQLiteConnectionPool
+) -> None:
+    api_key: str = sql_core.register_user(username="user", password="password").api_key
+    addresses: List[str] = [
+        sql_core.create_wallet(api_key=api_key).wallet_info["address"] for _ in range(3)
+    ]
+    statements: List[str] = []
+    with sql_pool.connection() as conn:
+        conn.set_trace_callback(statements.append)
+
+    assert len(sql_core.get_wallets_of_user(api_key).wallets) == 3
+    assert len(sql_core.get_wallets(api_key, addresses).wallets) == 3
+    assert sum("FROM wallets" in statement for statement in statements) == 2
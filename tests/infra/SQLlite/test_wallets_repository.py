@@ -0,0 +1,76 @@
+import sqlite3
+from pathlib import Path
+from typing import Any, List, Optional
+
+from app.core.wallets.interactor import Wallet
+from app.infra.SQLlite import wallets_repository
+from app.infra.SQLlite.connection_pool import SQLiteConnectionPool
+from app.infra.SQLlite.migrations import SchemaMigrator
+from app.infra.SQLlite.wallets_repository import (
+    WALLETS_MIGRATIONS,
+    SQLWalletsRepository,
+)
+
+
+def test_legacy_balances_are_migrated_to_satoshis(tmp_path: Path) -> None:
+    database_name: str = str(tmp_path / "legacy.db")
+    with sqlite3.connect(database_name) as conn:
+        conn.execute(
+            "CREATE TABLE wallets "
+            "(user_id INTEGER, address TEXT UNIQUE, balance_in_btc REAL)"
+        )
+        conn.execute("INSERT INTO wallets VALUES (1, 'a', 0.29)")
+        conn.execute("INSERT INTO wallets VALUES (1, 'b', 1.00000001)")
+    conn.close()
+
+    pool: SQLiteConnectionPool = SQLiteConnectionPool(database_name=database_name)
+    repository: SQLWalletsRepository = SQLWalletsRepository(pool)
+
+    assert repository.get_all_wallets_of_user(1) == [
+        Wallet(_user_id=1, _address="a", _balance_satoshis=29_000_000),
+        Wallet(_user_id=1, _address="b", _balance_satoshis=100_000_001),
+    ]
+    with pool.connection() as conn:
+        types = conn.execute("SELECT typeof(balance_in_satoshis) FROM wallets")
+        assert {row[0] for row in types} == {"integer"}
+    assert SchemaMigrator(pool).get_version("wallets") == len(WALLETS_MIGRATIONS)
+
+
+def test_withdraw_never_goes_below_zero(sql_pool: SQLiteConnectionPool) -> None:
+    repository: SQLWalletsRepository = SQLWalletsRepository(sql_pool)
+    repository.add_wallet(Wallet(_user_id=1, _address="a", _balance_satoshis=10))
+
+    assert repository.withdraw("a", 10)
+    assert not repository.withdraw("a", 1)
+
+    wallet: Optional[Wallet] = repository.get_wallet("a")
+    assert wallet is not None
+    assert wallet.get_balance_in_satoshis() == 0
+
+
+def test_balances_only_move_by_positive_amounts(
+    sql_pool: SQLiteConnectionPool,
+) -> None:
+    repository: SQLWalletsRepository = SQLWalletsRepository(sql_pool)
+    repository.add_wallet(Wallet(_user_id=1, _address="a", _balance_satoshis=10))
+
+    assert not repository.deposit("a", -5)
+    assert not repository.withdraw("a", -5)
+    assert not repository.deposit("a", 0)
+
+    wallet: Optional[Wallet] = repository.get_wallet("a")
+    assert wallet is not None
+    assert wallet.get_balance_in_satoshis() == 10
+
+
+def test_wallets_are_fetched_in_chunks(
+    sql_pool: SQLiteConnectionPool, monkeypatch: Any
+) -> None:
+    monkeypatch.setattr(wallets_repository, "MAX_ADDRESSES_PER_QUERY", 2)
+    repository: SQLWalletsRepository = SQLWalletsRepository(sql_pool)
+    for address in "abcde":
+        repository.add_wallet(Wallet(_user_id=1, _address=address, _balance_satoshis=1))
+
+    wallets: List[Wallet] = repository.get_wallets(["e", "a", "x", "c", "a", "b", "d"])
+
+    assert sorted(wallet.get_address() for wallet in wallets) == list("abcde")
@@ -0,0 +1,61 @@
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict
+
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from app import runner
+from app.infra.utils.currency_converter import IAsyncExchangeRateSource
+
+
+class FixedExchangeRateSource:
+    async def fetch_exchange_rate(self) -> float:
+        return 20000.0
+
+
+@pytest.fixture
+def anyio_backend() -> str:
+    return "asyncio"
+
+
+@pytest.fixture
+def configuration(
+    request: pytest.FixtureRequest, tmp_path: Path
+) -> runner.Configuration:
+    # tests change single settings with parametrize("configuration", ..., indirect)
+    overrides: Dict[str, Any] = getattr(request, "param", {})
+    return runner.Configuration(database_name=str(tmp_path / "bitcoin.db"), **overrides)
+
+
+@pytest.fixture
+def exchange_rate_source() -> IAsyncExchangeRateSource:
+    return FixedExchangeRateSource()
+
+
+@pytest.fixture
+def app(
+    configuration: runner.Configuration,
+    exchange_rate_source: IAsyncExchangeRateSource,
+) -> FastAPI:
+    return runner.setup(configuration, exchange_rate_source=exchange_rate_source)
+
+
+@pytest.fixture
+async def client(app: FastAPI) -> AsyncIterator[httpx.AsyncClient]:
+    # ASGITransport does not run lifespan events, so start the app here
+    await app.router.startup()
+    transport: httpx.ASGITransport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        yield client
+    await app.router.shutdown()
+
+
+@pytest.fixture
+async def api_key(client: httpx.AsyncClient) -> str:
+    registered: httpx.Response = await client.post(
+        "/users", params={"username": "user", "password": "password"}
+    )
+    assert registered.status_code == 201, registered.text
+    api_key: str = registered.json()["api_key"]
+    return api_key
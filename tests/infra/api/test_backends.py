@@ -0,0 +1,46 @@
+from typing import Any, Dict, List
+
+import httpx
+import pytest
+
+from app import runner
+from app.runner.configuration import IN_MEMORY_BACKEND, SQLITE_BACKEND
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize(
+    "configuration",
+    [{"backend": SQLITE_BACKEND}, {"backend": IN_MEMORY_BACKEND}],
+    indirect=True,
+)
+async def test_both_backends_serve_the_api(
+    client: httpx.AsyncClient, api_key: str
+) -> None:
+    addresses: List[str] = []
+    for _ in range(2):
+        created: httpx.Response = await client.post(
+            "/wallets", params={"api_key": api_key}
+        )
+        assert created.status_code == 201
+        addresses.append(created.json()["wallet_info"]["address"])
+
+    sent: httpx.Response = await client.post(
+        "/transactions",
+        params={
+            "api_key": api_key,
+            "from_address": addresses[0],
+            "to_address": addresses[1],
+            "amount": 0.5,
+        },
+    )
+    assert sent.status_code == 201
+    wallet: Dict[str, Any] = (
+        await client.get(f"/wallets/{addresses[1]}", params={"api_key": api_key})
+    ).json()["wallet_info"]
+    assert wallet["balance_in_btc"] == 1.5
+    assert wallet["balance_in_usd"] == 30000.0
+
+
+def test_unknown_backend_is_rejected() -> None:
+    with pytest.raises(ValueError):
+        runner.setup(runner.Configuration(backend="postgres"))
@@ -0,0 +1,29 @@
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from app.core.facade import ExchangeRateUnavailableError
+from app.infra.utils.currency_converter import IAsyncExchangeRateSource
+
+
+class UnavailableExchangeRateSource:
+    async def fetch_exchange_rate(self) -> float:
+        raise ExchangeRateUnavailableError("source is down")
+
+
+@pytest.fixture
+def exchange_rate_source() -> IAsyncExchangeRateSource:
+    return UnavailableExchangeRateSource()
+
+
+@pytest.mark.anyio
+async def test_wallet_creation_answers_503_without_exchange_rate(
+    app: FastAPI, client: httpx.AsyncClient, api_key: str
+) -> None:
+    response: httpx.Response = await client.post(
+        "/wallets", params={"api_key": api_key}
+    )
+    assert response.status_code == 503
+
+    with app.state.connection_pool.connection() as conn:
+        assert conn.execute("SELECT COUNT(*) FROM wallets").fetchone()[0] == 0
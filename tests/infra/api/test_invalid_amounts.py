@@ -0,0 +1,64 @@
+import json
+from typing import List
+
+import httpx
+import pytest
+
+INVALID_AMOUNTS: List[str] = ["inf", "-inf", "nan", "1e30"]
+
+
+@pytest.fixture
+async def addresses(client: httpx.AsyncClient, api_key: str) -> List[str]:
+    created: List[str] = []
+    for _ in range(2):
+        response: httpx.Response = await client.post(
+            "/wallets", params={"api_key": api_key}
+        )
+        created.append(response.json()["wallet_info"]["address"])
+    return created
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("amount", INVALID_AMOUNTS)
+async def test_invalid_amounts_are_rejected(
+    client: httpx.AsyncClient, api_key: str, addresses: List[str], amount: str
+) -> None:
+    transfer: httpx.Response = await client.post(
+        "/transactions",
+        params={
+            "api_key": api_key,
+            "from_address": addresses[0],
+            "to_address": addresses[1],
+            "amount": amount,
+        },
+    )
+    assert transfer.status_code == 400
+    batch: httpx.Response = await client.post(
+        "/transactions/batch",
+        params={"api_key": api_key},
+        # json.dumps writes Infinity and NaN, which httpx's json= refuses
+        content=json.dumps(
+            {
+                "transfers": [
+                    {
+                        "from_address": addresses[0],
+                        "to_address": addresses[1],
+                        "amount": float(amount),
+                    }
+                ]
+            }
+        ),
+        headers={"Content-Type": "application/json"},
+    )
+    assert batch.status_code == 400
+    for operation in ("deposit", "withdraw"):
+        response: httpx.Response = await client.post(
+            f"/wallets/{addresses[0]}/{operation}",
+            params={"api_key": api_key, "amount": amount},
+        )
+        assert response.status_code == 400, operation
+
+    wallet: httpx.Response = await client.get(
+        f"/wallets/{addresses[0]}", params={"api_key": api_key}
+    )
+    assert wallet.json()["wallet_info"]["balance_in_btc"] == 1.0
@@ -0,0 +1,37 @@
+import httpx
+import pytest
+
+
+@pytest.mark.anyio
+async def test_requests_are_measured(client: httpx.AsyncClient, api_key: str) -> None:
+    for _ in range(2):
+        listed: httpx.Response = await client.get(
+            "/wallets", params={"api_key": api_key}
+        )
+    server_timing: str = listed.headers["server-timing"]
+    assert server_timing.startswith("wallets;dur=")
+    assert "app;dur=" in server_timing
+
+    metrics: httpx.Response = await client.get("/metrics")
+    assert metrics.headers["content-type"].startswith("text/plain")
+    lines: str = metrics.text
+    assert (
+        "http_request_duration_seconds_count"
+        '{method="GET",route="/wallets",status="200"} 2'
+    ) in lines
+    assert (
+        "repository_call_duration_seconds_count"
+        '{repository="api_keys",method="get_user_id_by_api_key"} 1'
+    ) in lines
+    assert 'cache_hits_total{cache="api_keys"} 1' in lines
+    assert 'cache_hit_ratio{cache="api_keys"} 0.5' in lines
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("configuration", [{"metrics": False}], indirect=True)
+async def test_metrics_can_be_turned_off(client: httpx.AsyncClient) -> None:
+    registered: httpx.Response = await client.post(
+        "/users", params={"username": "user", "password": "password"}
+    )
+    assert "server-timing" not in registered.headers
+    assert (await client.get("/metrics")).status_code == 404
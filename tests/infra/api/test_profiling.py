@@ -0,0 +1,50 @@
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from app.core.facade import ADMIN_API_KEY
+
+ADMIN = {"admin_api_key": ADMIN_API_KEY}
+
+
+@pytest.mark.anyio
+async def test_admin_starts_sampling_and_flags_single_requests(
+    client: httpx.AsyncClient,
+) -> None:
+    forbidden: httpx.Response = await client.post(
+        "/profiling", params={"admin_api_key": "guess", "sample_rate": 1}
+    )
+    assert forbidden.status_code == 403
+
+    await client.get("/statistics", params=ADMIN, headers={"X-Profile": "no"})
+    await client.get("/statistics", params=ADMIN, headers={"X-Profile": ADMIN_API_KEY})
+    status: httpx.Response = await client.get("/profiling", params=ADMIN)
+    assert status.json()["profiled_requests"] == 1
+
+    started: httpx.Response = await client.post(
+        "/profiling", params={**ADMIN, "sample_rate": 1}
+    )
+    assert started.json() == {
+        "sample_rate": 1.0,
+        "profiled_requests": 0,
+        "samples": 0,
+    }
+    for _ in range(3):
+        await client.get("/statistics", params=ADMIN)
+    stopped: httpx.Response = await client.delete("/profiling", params=ADMIN)
+    assert stopped.json()["sample_rate"] == 0.0
+    assert stopped.json()["profiled_requests"] == 4  # with the DELETE itself
+
+    stacks: httpx.Response = await client.get("/profiling/stacks", params=ADMIN)
+    assert stacks.status_code == 200
+    assert "attachment" in stacks.headers["content-disposition"]
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("configuration", [{"profiling": False}], indirect=True)
+async def test_profiling_can_be_turned_off(
+    app: FastAPI, client: httpx.AsyncClient
+) -> None:
+    response: httpx.Response = await client.get("/profiling", params=ADMIN)
+    assert response.status_code == 404
+    assert app.state.profiler is None
@@ -0,0 +1,58 @@
+import logging
+from typing import Any, Dict
+
+import httpx
+import pytest
+
+from app.core.facade import ADMIN_API_KEY
+from app.infra.SQLlite.query_tracking import assert_max_queries
+
+
+@pytest.mark.anyio
+async def test_endpoints_stay_within_their_query_budget(
+    client: httpx.AsyncClient,
+) -> None:
+    async def call(
+        method: str, url: str, statements: int, **params: Any
+    ) -> Dict[str, Any]:
+        with assert_max_queries(statements, connections=2):
+            response: httpx.Response = await client.request(method, url, params=params)
+        assert response.status_code < 300, response.text
+        result: Dict[str, Any] = response.json()
+        return result
+
+    api_key: str = (
+        await call("POST", "/users", 4, username="user", password="password")
+    )["api_key"]
+    first: str = (await call("POST", "/wallets", 4, api_key=api_key))["wallet_info"][
+        "address"
+    ]
+    second: str = (await call("POST", "/wallets", 4, api_key=api_key))["wallet_info"][
+        "address"
+    ]
+    await call(
+        "POST",
+        "/transactions",
+        4,
+        api_key=api_key,
+        from_address=first,
+        to_address=second,
+        amount=0.1,
+    )
+    await call("POST", f"/wallets/{first}/deposit", 3, api_key=api_key, amount=1)
+    await call("GET", f"/wallets/{first}", 1, api_key=api_key)
+    await call("GET", "/wallets", 1, api_key=api_key)
+    await call("GET", f"/wallets/{first}/transactions", 1, api_key=api_key)
+    await call("GET", "/statistics", 1, admin_api_key=ADMIN_API_KEY)
+
+
+@pytest.mark.anyio
+async def test_requests_log_their_queries(
+    client: httpx.AsyncClient, caplog: pytest.LogCaptureFixture
+) -> None:
+    with caplog.at_level(logging.INFO, logger="app.infra.metrics.query_logging"):
+        await client.post("/users", params={"username": "user", "password": "password"})
+
+    record: logging.LogRecord = caplog.records[-1]
+    assert record.getMessage().startswith("POST /users ran 4 SQL statements")
+    assert record.__dict__["sql_connections"] == 1
@@ -0,0 +1,60 @@
+from typing import Any, Dict, List
+
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from app.core.wallets.interactor import Wallet
+
+
+@pytest.mark.anyio
+async def test_transfers_are_posted_as_a_batch(
+    app: FastAPI, client: httpx.AsyncClient, api_key: str
+) -> None:
+    user_id: int = app.state.api_keys_repository.get_user_id_by_api_key(api_key)
+    addresses: List[str] = ["first", "second"]
+    for address in addresses:  # fixed balances, independent of the exchange rate
+        app.state.wallets_repository.add_wallet(
+            Wallet(_user_id=user_id, _address=address, _balance_satoshis=10**8)
+        )
+    transfers: List[Dict[str, Any]] = [
+        {
+            "from_address": addresses[0],
+            "to_address": addresses[1],
+            "amount": 0.6,
+        }
+    ] * 2
+
+    rejected: httpx.Response = await client.post(
+        "/transactions/batch",
+        params={"api_key": api_key},
+        json={"transfers": transfers},
+    )
+    assert rejected.status_code == 409
+    assert rejected.json() == {"status": 409, "statuses": [424, 400]}
+
+    partial: httpx.Response = await client.post(
+        "/transactions/batch",
+        params={"api_key": api_key},
+        json={"transfers": transfers, "mode": "best_effort"},
+    )
+    assert partial.status_code == 207
+    assert partial.json()["statuses"] == [201, 400]
+
+    forbidden: httpx.Response = await client.post(
+        "/transactions/batch",
+        params={"api_key": "invalid"},
+        json={"transfers": transfers},
+    )
+    assert forbidden.status_code == 403
+
+    empty: httpx.Response = await client.post(
+        "/transactions/batch",
+        params={"api_key": api_key},
+        json={"transfers": []},
+    )
+    assert empty.status_code == 400
+
+    assert app.state.wallets_repository.get_wallet("second") == Wallet(
+        1, "second", 160_000_000
+    )
@@ -0,0 +1,52 @@
+import json
+from typing import Any, Dict, List
+
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from app.core import facade
+from app.core.transactions.interactor import Transaction
+from app.infra.SQLlite.transactions_repository import SQLTransactionsRepository
+
+
+@pytest.mark.anyio
+async def test_transactions_are_streamed_as_ndjson(
+    app: FastAPI, client: httpx.AsyncClient, api_key: str, monkeypatch: Any
+) -> None:
+    monkeypatch.setattr(facade, "STREAM_BATCH_SIZE", 2)
+    repository: SQLTransactionsRepository = SQLTransactionsRepository(
+        app.state.connection_pool
+    )
+    for i in range(5):
+        repository.add_transaction(Transaction("a", "b", i * 100_000_000, 50_000_000))
+
+    forbidden: httpx.Response = await client.get(
+        "/transactions", params={"api_key": "invalid"}
+    )
+    assert forbidden.status_code == 403
+
+    # none of the rows belong to the user's wallets
+    foreign: httpx.Response = await client.get(
+        "/transactions", params={"api_key": api_key}
+    )
+    assert foreign.status_code == 200
+    assert foreign.text == ""
+
+    response: httpx.Response = await client.get(
+        "/transactions", params={"api_key": facade.ADMIN_API_KEY}
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    lines: List[Dict[str, Any]] = [
+        json.loads(line) for line in response.text.splitlines()
+    ]
+    assert [line["amount"] for line in lines] == [0, 1, 2, 3, 4]
+    assert lines[0] == {
+        "from_address": "a",
+        "to_address": "b",
+        "amount": 0,
+        "fee": 0.5,
+        "amount_in_satoshis": 0,
+        "fee_in_satoshis": 50_000_000,
+    }
@@ -0,0 +1,31 @@
+import httpx
+import pytest
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("after_id", [-1, 2**63, 2**70])
+async def test_out_of_range_cursor_is_rejected(
+    client: httpx.AsyncClient, api_key: str, after_id: int
+) -> None:
+    created: httpx.Response = await client.post("/wallets", params={"api_key": api_key})
+    address: str = created.json()["wallet_info"]["address"]
+
+    response: httpx.Response = await client.get(
+        f"/wallets/{address}/transactions",
+        params={"api_key": api_key, "after_id": after_id},
+    )
+    assert response.status_code == 422
+
+
+@pytest.mark.anyio
+async def test_largest_cursor_is_accepted(
+    client: httpx.AsyncClient, api_key: str
+) -> None:
+    created: httpx.Response = await client.post("/wallets", params={"api_key": api_key})
+    address: str = created.json()["wallet_info"]["address"]
+
+    response: httpx.Response = await client.get(
+        f"/wallets/{address}/transactions",
+        params={"api_key": api_key, "after_id": 2**63 - 1, "direction": "desc"},
+    )
+    assert response.status_code == 200
@@ -0,0 +1,27 @@
+import httpx
+import pytest
+
+
+@pytest.mark.anyio
+async def test_wallets_of_the_caller_are_listed(
+    client: httpx.AsyncClient, api_key: str
+) -> None:
+    listed: httpx.Response = await client.get("/wallets", params={"api_key": api_key})
+    assert listed.status_code == 200
+    assert listed.json() == {"status": 200, "wallets": []}
+
+    unknown: httpx.Response = await client.get(
+        "/wallets", params={"api_key": api_key, "address": ["a", "b"]}
+    )
+    assert unknown.status_code == 404
+
+    too_many: httpx.Response = await client.get(
+        "/wallets",
+        params={"api_key": api_key, "address": [str(i) for i in range(101)]},
+    )
+    assert too_many.status_code == 400
+
+    forbidden: httpx.Response = await client.get(
+        "/wallets", params={"api_key": "invalid"}
+    )
+    assert forbidden.status_code == 403
@@ -0,0 +1,88 @@
+import pytest
+
+from app.infra.cache.api_keys_repository import CachingAPIKeysRepository
+from app.infra.in_memory.in_memory_api_key_repository import InMemoryAPIKeyRepository
+
+
+class CountingAPIKeysRepository(InMemoryAPIKeyRepository):
+    def __init__(self) -> None:
+        super().__init__()
+        self.lookups = 0
+
+    def get_user_id_by_api_key(self, api_key: str) -> int:
+        self.lookups += 1
+        return super().get_user_id_by_api_key(api_key)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def repository() -> CountingAPIKeysRepository:
+    return CountingAPIKeysRepository()
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+@pytest.fixture
+def cache(
+    repository: CountingAPIKeysRepository, clock: FakeClock
+) -> CachingAPIKeysRepository:
+    return CachingAPIKeysRepository(
+        repository, capacity=2, negative_time_to_live=5, clock=clock
+    )
+
+
+def test_known_key_is_resolved_once(
+    cache: CachingAPIKeysRepository, repository: CountingAPIKeysRepository
+) -> None:
+    cache.add_api_key_id_pair(api_key="key", user_id=7)
+
+    assert [cache.get_user_id_by_api_key("key") for _ in range(3)] == [7, 7, 7]
+    assert repository.lookups == 1
+    assert cache.statistics().hits == 2
+
+
+def test_unknown_key_is_cached_for_time_to_live(
+    cache: CachingAPIKeysRepository,
+    repository: CountingAPIKeysRepository,
+    clock: FakeClock,
+) -> None:
+    assert cache.get_user_id_by_api_key("missing") == -1
+    assert cache.get_user_id_by_api_key("missing") == -1
+    assert repository.lookups == 1
+
+    clock.now = 5
+    assert cache.get_user_id_by_api_key("missing") == -1
+    assert repository.lookups == 2
+
+
+def test_new_key_is_not_shadowed_by_negative_entry(
+    cache: CachingAPIKeysRepository,
+) -> None:
+    assert cache.get_user_id_by_api_key("key") == -1
+
+    cache.add_api_key_id_pair(api_key="key", user_id=3)
+
+    assert cache.get_user_id_by_api_key("key") == 3
+
+
+def test_cache_is_bounded(
+    cache: CachingAPIKeysRepository, repository: CountingAPIKeysRepository
+) -> None:
+    for user_id in range(3):
+        cache.add_api_key_id_pair(api_key=f"key_{user_id}", user_id=user_id)
+        cache.get_user_id_by_api_key(f"key_{user_id}")
+
+    assert cache.statistics().size == 2
+    assert cache.statistics().evictions == 1
+    assert cache.get_user_id_by_api_key("key_0") == 0
+    assert repository.lookups == 4
@@ -0,0 +1,46 @@
+from app.infra.cache.lru_cache import CacheStatistics, LRUCache
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_least_recently_used_entry_is_evicted() -> None:
+    cache: LRUCache[str, int] = LRUCache(capacity=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.get("a")
+    cache.put("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.statistics().evictions == 1
+
+
+def test_entries_expire_after_time_to_live() -> None:
+    clock: FakeClock = FakeClock()
+    cache: LRUCache[str, int] = LRUCache(capacity=2, clock=clock)
+    cache.put("a", 1, time_to_live=5)
+
+    clock.now = 4.9
+    assert cache.get("a") == 1
+    clock.now = 5
+    assert cache.get("a") is None
+    assert cache.statistics().size == 0
+
+
+def test_statistics_count_hits_and_misses() -> None:
+    cache: LRUCache[str, int] = LRUCache(capacity=2)
+    cache.put("a", 1)
+    cache.get("a")
+    cache.get("a")
+    cache.get("b")
+
+    statistics: CacheStatistics = cache.statistics()
+    assert (statistics.hits, statistics.misses) == (2, 1)
+    assert statistics.get_hit_ratio() == 2 / 3
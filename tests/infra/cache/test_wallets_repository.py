@@ -0,0 +1,241 @@
+import random
+import threading
+from pathlib import Path
+from typing import Callable, List, Optional, Tuple
+
+import pytest
+
+from app.core.facade import BitcoinWalletCore
+from app.core.wallets.interactor import Wallet
+from app.infra.cache.wallets_repository import CachingWalletsRepository
+from app.infra.SQLlite.api_keys_repository import SQLAPIKeysRepository
+from app.infra.SQLlite.connection_pool import SQLiteConnectionPool
+from app.infra.SQLlite.group_commit import GroupCommitUnitOfWork
+from app.infra.SQLlite.transactions_repository import SQLTransactionsRepository
+from app.infra.SQLlite.unit_of_work import SQLiteUnitOfWork
+from app.infra.SQLlite.users_repository import SQLUsersRepository
+from app.infra.SQLlite.wallets_repository import SQLWalletsRepository
+from app.infra.utils.currency_converter import DefaultCurrencyConverter
+from app.infra.utils.fee_strategy import FeeRateStrategy
+from app.infra.utils.generator import DefaultUniqueValueGenerators
+from app.infra.utils.hasher import DefaultHashFunction
+
+
+class CountingWalletsRepository(SQLWalletsRepository):
+    def __init__(self, pool: SQLiteConnectionPool) -> None:
+        super().__init__(pool)
+        self.lookups = 0
+
+    def get_wallet(self, address: str) -> Optional[Wallet]:
+        self.lookups += 1
+        return super().get_wallet(address)
+
+
+@pytest.fixture
+def pool(tmp_path: Path) -> SQLiteConnectionPool:
+    return SQLiteConnectionPool(database_name=str(tmp_path / "test.db"))
+
+
+@pytest.fixture
+def repository(pool: SQLiteConnectionPool) -> CountingWalletsRepository:
+    return CountingWalletsRepository(pool)
+
+
+@pytest.fixture
+def cache(
+    repository: CountingWalletsRepository, pool: SQLiteConnectionPool
+) -> CachingWalletsRepository:
+    cache: CachingWalletsRepository = CachingWalletsRepository(
+        repository, transaction_events=pool, capacity=2
+    )
+    cache.add_wallet(Wallet(_user_id=1, _address="a", _balance_satoshis=1_000))
+    return cache
+
+
+def _balance(cache: CachingWalletsRepository, address: str) -> int:
+    wallet: Optional[Wallet] = cache.get_wallet(address)
+    assert wallet is not None
+    return wallet.get_balance_in_satoshis()
+
+
+def test_new_wallet_is_served_from_memory(
+    cache: CachingWalletsRepository, repository: CountingWalletsRepository
+) -> None:
+    assert [_balance(cache, "a") for _ in range(3)] == [1_000, 1_000, 1_000]
+    assert repository.lookups == 0
+    assert cache.statistics().hits == 3
+
+
+def test_committed_writes_update_the_cached_wallet(
+    cache: CachingWalletsRepository, repository: CountingWalletsRepository
+) -> None:
+    assert cache.deposit("a", 500)
+    assert cache.withdraw("a", 200)
+    assert not cache.withdraw("a", 10_000)
+
+    assert _balance(cache, "a") == 1_300
+    assert repository.get_wallet("a") == Wallet(1, "a", 1_300)
+    assert repository.lookups == 1
+
+
+def test_returned_wallets_are_copies(cache: CachingWalletsRepository) -> None:
+    wallet: Optional[Wallet] = cache.get_wallet("a")
+    assert wallet is not None
+    wallet.deposit(5)
+
+    assert _balance(cache, "a") == 1_000
+
+
+def test_rolled_back_write_keeps_the_committed_balance(
+    cache: CachingWalletsRepository, pool: SQLiteConnectionPool
+) -> None:
+    with pytest.raises(RuntimeError):
+        with pool.connection():
+            cache.deposit("a", 500)
+            assert _balance(cache, "a") == 1_500  # the transaction sees its write
+            raise RuntimeError()
+
+    assert _balance(cache, "a") == 1_000
+
+
+def test_open_write_is_not_cached_by_other_readers(
+    cache: CachingWalletsRepository, pool: SQLiteConnectionPool
+) -> None:
+    balances: List[int] = []
+
+    def read() -> None:
+        balances.append(_balance(cache, "a"))
+
+    with pool.connection() as conn:
+        conn.execute("BEGIN IMMEDIATE")
+        cache.deposit("a", 500)
+        reader: threading.Thread = threading.Thread(target=read)
+        reader.start()
+        reader.join()
+
+    assert balances == [1_000]  # the committed balance, read through
+    assert _balance(cache, "a") == 1_500
+
+
+def test_versions_are_not_kept_for_addresses_without_open_writes(
+    cache: CachingWalletsRepository,
+) -> None:
+    addresses: List[str] = [f"wallet-{number}" for number in range(10)]
+    for address in addresses:
+        cache.add_wallet(Wallet(_user_id=1, _address=address, _balance_satoshis=0))
+        cache.deposit(address, 1)
+
+    # every address shares one version instead of keeping an entry of its own
+    assert {cache.get_version(address) for address in ["a"] + addresses} == {
+        cache.get_version("never-written")
+    }
+
+
+def test_read_that_raced_a_finished_write_is_not_cached(
+    pool: SQLiteConnectionPool,
+) -> None:
+    class RacingWalletsRepository(SQLWalletsRepository):
+        race: Optional[Callable[[], object]] = None
+
+        def get_wallet(self, address: str) -> Optional[Wallet]:
+            wallet: Optional[Wallet] = super().get_wallet(address)
+            race, self.race = self.race, None
+            if race is not None:
+                race()  # a whole write lands after the read and before caching
+            return wallet
+
+    repository: RacingWalletsRepository = RacingWalletsRepository(pool)
+    cache: CachingWalletsRepository = CachingWalletsRepository(
+        repository, transaction_events=pool
+    )
+    repository.add_wallet(Wallet(_user_id=1, _address="a", _balance_satoshis=1_000))
+    repository.race = lambda: cache.deposit("a", 500)
+
+    assert _balance(cache, "a") == 1_000
+    assert _balance(cache, "a") == 1_500
+
+
+def test_failed_insert_is_not_cached(cache: CachingWalletsRepository) -> None:
+    with pytest.raises(Exception):
+        cache.add_wallet(Wallet(_user_id=2, _address="a", _balance_satoshis=7))
+
+    assert cache.get_wallet("a") == Wallet(1, "a", 1_000)
+
+
+def test_rolled_back_group_commit_write_is_not_applied(
+    cache: CachingWalletsRepository, pool: SQLiteConnectionPool
+) -> None:
+    unit_of_work: GroupCommitUnitOfWork = GroupCommitUnitOfWork(pool)
+
+    def failing_deposit() -> None:
+        cache.deposit("a", 500)
+        raise RuntimeError()
+
+    with pytest.raises(RuntimeError):
+        unit_of_work.run(failing_deposit)
+    assert unit_of_work.run(lambda: cache.deposit("a", 100))
+    unit_of_work.close()
+
+    assert _balance(cache, "a") == 1_100
+
+
+def test_wallets_are_fetched_together_and_cached(
+    cache: CachingWalletsRepository, repository: CountingWalletsRepository
+) -> None:
+    repository.add_wallet(Wallet(_user_id=1, _address="b", _balance_satoshis=5))
+
+    wallets: List[Wallet] = cache.get_wallets(["a", "b", "unknown"])
+
+    assert sorted(wallets, key=Wallet.get_address) == [
+        Wallet(1, "a", 1_000),
+        Wallet(1, "b", 5),
+    ]
+    assert _balance(cache, "b") == 5
+    assert repository.lookups == 0
+
+
+def test_least_recently_used_wallet_is_evicted(
+    cache: CachingWalletsRepository, repository: CountingWalletsRepository
+) -> None:
+    cache.add_wallet(Wallet(_user_id=1, _address="b", _balance_satoshis=0))
+    cache.add_wallet(Wallet(_user_id=1, _address="c", _balance_satoshis=0))
+
+    assert _balance(cache, "a") == 1_000
+    assert repository.lookups == 1
+    assert cache.statistics().evictions == 2
+
+
+def test_cached_balances_match_the_database_after_transfers(
+    pool: SQLiteConnectionPool,
+) -> None:
+    cache: CachingWalletsRepository = CachingWalletsRepository(
+        SQLWalletsRepository(pool), transaction_events=pool
+    )
+    core: BitcoinWalletCore = BitcoinWalletCore.create(
+        users_repository=SQLUsersRepository(pool),
+        wallets_repository=cache,
+        transactions_repository=SQLTransactionsRepository(pool),
+        api_key_repository=SQLAPIKeysRepository(pool),
+        hash_function=DefaultHashFunction(),
+        currency_converter=DefaultCurrencyConverter(),
+        fee_strategy=FeeRateStrategy(),
+        unique_value_generator=DefaultUniqueValueGenerators(),
+        unit_of_work=SQLiteUnitOfWork(pool),
+    )
+    accounts: List[Tuple[str, str]] = []
+    for user in range(3):
+        api_key: str = core.register_user(f"user{user}", "password").api_key
+        for _ in range(2):
+            accounts.append(
+                (api_key, core.create_wallet(api_key).wallet_info["address"])
+            )
+
+    generator: random.Random = random.Random(7)
+    for _ in range(300):
+        (api_key, sender), (_, receiver) = generator.sample(accounts, 2)
+        core.make_transaction(api_key, sender, receiver, generator.randrange(10**8))
+
+    database: SQLWalletsRepository = SQLWalletsRepository(pool)
+    for _, address in accounts:
+        assert cache.get_wallet(address) == database.get_wallet(address)
+    assert cache.statistics().hits > cache.statistics().misses
@@ -0,0 +1,61 @@
+from app.core.transactions.interactor import Transaction
+from app.core.users.interactor import User
+from app.core.wallets.interactor import Wallet
+from app.infra.in_memory.in_memory_transactions_repository import (
+    InMemoryTransactionsRepository,
+)
+from app.infra.in_memory.in_memory_users_repository import InMemoryUsersRepository
+from app.infra.in_memory.in_memory_wallets_repository import InMemoryWalletsRepository
+
+
+def test_users_are_found_by_username() -> None:
+    repository: InMemoryUsersRepository = InMemoryUsersRepository()
+    first: User = User(_user_id=0, _username="a", _password="x")
+    repository.add_user(first)
+    repository.add_user(User(_user_id=1, _username="b", _password="x"))
+
+    assert repository.get_user_by_username("a") is first
+    assert repository.get_user_by_username("c") is None
+
+
+def test_identical_user_is_rejected() -> None:
+    repository: InMemoryUsersRepository = InMemoryUsersRepository()
+    repository.add_user(User(_user_id=0, _username="a", _password="x"))
+
+    assert not repository.add_user(User(_user_id=1, _username="a", _password="x"))
+    assert repository.get_max_user_id() == 1
+
+
+def test_wallets_are_listed_per_owner_in_creation_order() -> None:
+    repository: InMemoryWalletsRepository = InMemoryWalletsRepository()
+    wallets = [
+        Wallet(_user_id=1, _address="a", _balance_satoshis=1),
+        Wallet(_user_id=2, _address="b", _balance_satoshis=1),
+        Wallet(_user_id=1, _address="c", _balance_satoshis=1),
+    ]
+    for wallet in wallets:
+        repository.add_wallet(wallet)
+
+    assert repository.get_all_wallets_of_user(1) == [wallets[0], wallets[2]]
+    assert repository.get_number_of_wallets_of_user(1) == 2
+    assert repository.get_number_of_wallets_of_user(3) == 0
+
+
+def test_transactions_are_indexed_by_both_addresses() -> None:
+    repository: InMemoryTransactionsRepository = InMemoryTransactionsRepository()
+    transactions = [
+        Transaction("a", "b", 1, 0),
+        Transaction("c", "d", 1, 0),
+        Transaction("b", "a", 2, 0),
+        Transaction("a", "a", 3, 0),
+    ]
+    for transaction in transactions:
+        repository.add_transaction(transaction)
+
+    assert repository.get_wallet_transactions("a") == [
+        transactions[0],
+        transactions[2],
+        transactions[3],
+    ]
+    assert repository.get_wallet_transactions("d") == [transactions[1]]
+    assert repository.get_wallet_transactions("e") == []
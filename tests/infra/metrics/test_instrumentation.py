@@ -0,0 +1,62 @@
+from typing import Dict
+
+import anyio
+import pytest
+
+from app.infra.metrics.instrumentation import request_timings, timed
+from app.infra.metrics.registry import HistogramFamily
+
+
+class Repository:
+    name: str = "repository"
+
+    def get(self, value: int) -> int:
+        return value * 2
+
+    def fail(self) -> None:
+        raise KeyError()
+
+    async def fetch(self) -> float:
+        return 1.5
+
+
+@pytest.fixture
+def histogram() -> HistogramFamily:
+    return HistogramFamily("calls", "Calls", ("component", "method"))
+
+
+def test_calls_are_timed_and_passed_through(histogram: HistogramFamily) -> None:
+    repository: Repository = timed(Repository(), histogram, "things")
+
+    assert repository.get(2) == 4
+    assert repository.get(3) == 6
+    with pytest.raises(KeyError):
+        repository.fail()
+    assert repository.name == "repository"
+
+    assert histogram.get_count(("things", "get")) == 2
+    assert histogram.get_count(("things", "fail")) == 1
+
+
+def test_coroutines_are_timed(histogram: HistogramFamily) -> None:
+    repository: Repository = timed(Repository(), histogram, "things")
+
+    assert anyio.run(repository.fetch) == 1.5
+    assert histogram.get_count(("things", "fetch")) == 1
+
+
+def test_durations_are_added_to_the_current_request(
+    histogram: HistogramFamily,
+) -> None:
+    repository: Repository = timed(Repository(), histogram, "things")
+    timings: Dict[str, float] = {}
+    token = request_timings.set(timings)
+    try:
+        repository.get(1)
+        repository.get(1)
+    finally:
+        request_timings.reset(token)
+    repository.get(1)  # outside of a request
+
+    assert list(timings) == ["things"]
+    assert timings["things"] > 0
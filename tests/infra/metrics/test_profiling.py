@@ -0,0 +1,23 @@
+import time
+
+from app.infra.metrics.profiling import StackSampler
+
+
+def busy(seconds: float) -> None:
+    deadline: float = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        pass
+
+
+def test_use_case_stacks_are_collapsed_under_their_route() -> None:
+    sampler: StackSampler = StackSampler(interval=0.001)
+    sampler.start(sample_rate=1.0)
+    scope = {"method": "POST", "path": "/transactions"}
+
+    sampler.run_use_case(scope, busy, 0.05)
+
+    stacks: str = sampler.collapsed_stacks()
+    stack, _, count = stacks.splitlines()[0].rpartition(" ")
+    assert stack == f"POST /transactions;{__name__}.busy"
+    assert int(count) > 1
+    assert sampler.status().samples == int(count)
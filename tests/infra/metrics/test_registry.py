@@ -0,0 +1,44 @@
+from typing import List
+
+from app.infra.metrics.registry import CallbackMetric, HistogramFamily, MetricsRegistry
+
+
+def test_histogram_buckets_are_cumulative() -> None:
+    histogram: HistogramFamily = HistogramFamily(
+        "latency_seconds", "Latency", ("route",), buckets=(0.1, 1.0)
+    )
+    for value in (0.05, 0.5, 0.5, 5.0):
+        histogram.observe(("/wallets",), value)
+
+    assert list(histogram.render()) == [
+        "# HELP latency_seconds Latency",
+        "# TYPE latency_seconds histogram",
+        'latency_seconds_bucket{route="/wallets",le="0.1"} 1',
+        'latency_seconds_bucket{route="/wallets",le="1.0"} 3',
+        'latency_seconds_bucket{route="/wallets",le="+Inf"} 4',
+        'latency_seconds_sum{route="/wallets"} 6.05',
+        'latency_seconds_count{route="/wallets"} 4',
+    ]
+    assert histogram.get_count(("/wallets",)) == 4
+    assert histogram.get_count(("/users",)) == 0
+
+
+def test_label_values_are_escaped() -> None:
+    histogram: HistogramFamily = HistogramFamily("x", "X", ("path",), buckets=())
+    histogram.observe(('a"b\\c\n',), 1.0)
+
+    assert 'x_count{path="a\\"b\\\\c\\n"} 1' in list(histogram.render())
+
+
+def test_registry_renders_every_metric() -> None:
+    registry: MetricsRegistry = MetricsRegistry()
+    values: List[float] = [0.25]
+    registry.histogram("latency_seconds", "Latency", ()).observe((), 0.001)
+    registry.register(
+        CallbackMetric("ratio", "Ratio", "gauge", (), lambda: [((), values[0])])
+    )
+
+    assert registry.histogram("latency_seconds", "Latency", ()).get_count(()) == 1
+    rendered: str = registry.render()
+    assert "latency_seconds_count 1\n" in rendered
+    assert rendered.endswith("# TYPE ratio gauge\nratio 0.25\n")
@@ -0,0 +1,140 @@
+from pathlib import Path
+from typing import List, Optional
+
+import pytest
+
+from app.core.transactions.interactor import (
+    Direction,
+    ITransactionsRepository,
+    Transaction,
+    TransactionsPage,
+)
+from app.infra.in_memory.in_memory_transactions_repository import (
+    InMemoryTransactionsRepository,
+)
+from app.infra.SQLlite.connection_pool import SQLiteConnectionPool
+from app.infra.SQLlite.transactions_repository import SQLTransactionsRepository
+
+
+@pytest.fixture(params=["in_memory", "sqlite"])
+def repository(
+    request: pytest.FixtureRequest, tmp_path: Path
+) -> ITransactionsRepository:
+    if request.param == "sqlite":
+        return SQLTransactionsRepository(
+            SQLiteConnectionPool(database_name=str(tmp_path / "bitcoin.db"))
+        )
+    return InMemoryTransactionsRepository()
+
+
+@pytest.fixture
+def history(repository: ITransactionsRepository) -> List[Transaction]:
+    transactions: List[Transaction] = []
+    for amount in range(1, 8):
+        transaction: Transaction = (
+            Transaction("a", "b", amount, 0)
+            if amount % 2
+            else Transaction("b", "a", amount, 0)
+        )
+        repository.add_transaction(transaction)
+        repository.add_transaction(Transaction("c", "d", amount, 0))
+        transactions.append(transaction)
+    return transactions
+
+
+def _read_all(
+    repository: ITransactionsRepository, limit: int, direction: Direction
+) -> List[List[Transaction]]:
+    pages: List[List[Transaction]] = []
+    cursor: Optional[int] = None
+    while True:
+        page: TransactionsPage = repository.get_wallet_transactions_page(
+            "a", limit=limit, after_id=cursor, direction=direction
+        )
+        pages.append(page.transactions)
+        if page.next_cursor is None:
+            return pages
+        cursor = page.next_cursor
+
+
+def test_ascending_pages_cover_history_in_order(
+    repository: ITransactionsRepository, history: List[Transaction]
+) -> None:
+    pages = _read_all(repository, limit=3, direction=Direction.ASCENDING)
+
+    assert [len(page) for page in pages] == [3, 3, 1]
+    assert [t for page in pages for t in page] == history
+
+
+def test_descending_pages_cover_history_in_reverse(
+    repository: ITransactionsRepository, history: List[Transaction]
+) -> None:
+    pages = _read_all(repository, limit=3, direction=Direction.DESCENDING)
+
+    assert [t for page in pages for t in page] == history[::-1]
+
+
+def test_exact_page_has_no_cursor(
+    repository: ITransactionsRepository, history: List[Transaction]
+) -> None:
+    page: TransactionsPage = repository.get_wallet_transactions_page("a", limit=7)
+
+    assert page.transactions == history
+    assert page.next_cursor is None
+
+
+def test_cursors_mean_the_same_on_every_backend(
+    repository: ITransactionsRepository, history: List[Transaction]
+) -> None:
+    from_start: TransactionsPage = repository.get_wallet_transactions_page(
+        "a", limit=1, after_id=0
+    )
+
+    assert from_start.transactions == history[:1]
+    assert from_start.next_cursor == 1  # ids start at 1
+    assert (
+        repository.get_wallet_transactions_page(
+            "a", limit=1, after_id=from_start.next_cursor
+        ).transactions
+        == history[1:2]
+    )
+
+
+def test_unknown_wallet_has_empty_page(
+    repository: ITransactionsRepository, history: List[Transaction]
+) -> None:
+    page: TransactionsPage = repository.get_wallet_transactions_page("z", limit=3)
+
+    assert page == TransactionsPage()
+
+
+@pytest.mark.parametrize("batch_size", [1, 2, 3, 1000])
+def test_iterate_all_transactions_in_batches(
+    repository: ITransactionsRepository, batch_size: int
+) -> None:
+    transactions: List[Transaction] = [
+        Transaction(f"a{i}", f"b{i}", i, 0) for i in range(6)
+    ]
+    for transaction in transactions:
+        repository.add_transaction(transaction)
+
+    assert list(repository.iterate_all_transactions(batch_size)) == transactions
+
+
+def test_iterate_all_transactions_of_empty_ledger(
+    repository: ITransactionsRepository,
+) -> None:
+    assert list(repository.iterate_all_transactions(10)) == []
+
+
+@pytest.mark.parametrize("batch_size", [1, 2, 1000])
+def test_iterate_wallets_transactions_in_batches(
+    repository: ITransactionsRepository, history: List[Transaction], batch_size: int
+) -> None:
+    assert list(repository.iterate_wallets_transactions(["a"], batch_size)) == history
+    # transfers between the given wallets come once
+    assert (
+        list(repository.iterate_wallets_transactions(["a", "b"], batch_size)) == history
+    )
+    assert list(repository.iterate_wallets_transactions([], batch_size)) == []
+    assert list(repository.iterate_wallets_transactions(["z"], batch_size)) == []
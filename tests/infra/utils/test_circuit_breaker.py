@@ -0,0 +1,54 @@
+from app.infra.utils.circuit_breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_breaker_opens_after_threshold() -> None:
+    breaker: CircuitBreaker = CircuitBreaker(failure_threshold=3, _clock=FakeClock())
+    breaker.record_failure()
+    breaker.record_failure()
+    assert breaker.get_state() == CLOSED
+
+    breaker.record_failure()
+    assert breaker.get_state() == OPEN
+    assert not breaker.allow_request()
+
+
+def test_success_resets_failures() -> None:
+    breaker: CircuitBreaker = CircuitBreaker(failure_threshold=2, _clock=FakeClock())
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+
+    assert breaker.get_state() == CLOSED
+
+
+def test_breaker_half_opens_after_reset_timeout() -> None:
+    clock: FakeClock = FakeClock()
+    breaker: CircuitBreaker = CircuitBreaker(
+        failure_threshold=1, reset_timeout=30, _clock=clock
+    )
+    breaker.record_failure()
+    clock.now = 30
+
+    assert breaker.get_state() == HALF_OPEN
+    assert breaker.allow_request()
+
+
+def test_failure_while_half_open_reopens() -> None:
+    clock: FakeClock = FakeClock()
+    breaker: CircuitBreaker = CircuitBreaker(
+        failure_threshold=5, reset_timeout=30, _clock=clock
+    )
+    for _ in range(5):
+        breaker.record_failure()
+    clock.now = 30
+    breaker.record_failure()
+
+    assert breaker.get_state() == OPEN
@@ -0,0 +1,209 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from typing import Iterator
+
+import anyio
+import pytest
+
+from app.core.facade import ExchangeRateUnavailableError
+from app.infra.utils.circuit_breaker import OPEN, CircuitBreaker
+from app.infra.utils.currency_converter import (
+    AsyncCoindeskExchangeRateSource,
+    AsyncRefreshingCurrencyConverter,
+    ExchangeRateConverter,
+)
+
+
+class AsyncCountingExchangeRateSource:
+    def __init__(self, rate: float = 20000) -> None:
+        self.rate = rate
+        self.fetches = 0
+        self.failing = False
+
+    async def fetch_exchange_rate(self) -> float:
+        self.fetches += 1
+        if self.failing:
+            raise ExchangeRateUnavailableError()
+        return self.rate
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class StubCoindeskHandler(BaseHTTPRequestHandler):
+    def do_GET(self) -> None:
+        rate: object = 30000.5 if self.path == "/rate.json" else "n/a"
+        body: bytes = json.dumps({"bpi": {"USD": {"rate_float": rate}}}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args: object) -> None:
+        pass
+
+
+@pytest.fixture
+def stub_server() -> Iterator[str]:
+    server: HTTPServer = HTTPServer(("127.0.0.1", 0), StubCoindeskHandler)
+    thread: threading.Thread = threading.Thread(target=server.serve_forever)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_async_coindesk_source_reads_from_configured_endpoint(
+    stub_server: str,
+) -> None:
+    async def fetch(path: str) -> float:
+        source = AsyncCoindeskExchangeRateSource(source=stub_server + path)
+        try:
+            return await source.fetch_exchange_rate()
+        finally:
+            await source.close()
+
+    assert anyio.run(fetch, "/rate.json") == 30000.5
+    with pytest.raises(ExchangeRateUnavailableError):
+        anyio.run(fetch, "/broken.json")
+
+
+def test_async_coindesk_source_reports_unreachable_endpoint() -> None:
+    source = AsyncCoindeskExchangeRateSource(
+        source="http://127.0.0.1:9/rate.json", timeout=0.5
+    )
+
+    with pytest.raises(ExchangeRateUnavailableError):
+        anyio.run(source.fetch_exchange_rate)
+
+
+def test_async_converter_serves_last_rate_and_opens_circuit() -> None:
+    source: AsyncCountingExchangeRateSource = AsyncCountingExchangeRateSource()
+    clock: FakeClock = FakeClock()
+    converter = AsyncRefreshingCurrencyConverter(
+        _source=source,
+        _circuit_breaker=CircuitBreaker(
+            failure_threshold=2, reset_timeout=30, _clock=clock
+        ),
+        _clock=clock,
+    )
+    with pytest.raises(ExchangeRateUnavailableError):
+        converter.convert_to_usd(100_000_000)
+
+    assert anyio.run(converter.refresh)
+    source.failing = True
+    for _ in range(5):
+        assert not anyio.run(converter.refresh)
+
+    assert source.fetches == 3
+    assert converter.get_circuit_breaker().get_state() == OPEN
+    assert converter.convert_to_usd(100_000_000) == 20000
+
+
+def test_async_converter_converts_without_fetching() -> None:
+    source: AsyncCountingExchangeRateSource = AsyncCountingExchangeRateSource()
+    converter = AsyncRefreshingCurrencyConverter(_source=source)
+    assert anyio.run(converter.refresh)
+
+    for _ in range(1000):  # requests only read the published rate
+        assert converter.convert_to_usd(100_000_000) == 20000
+        assert converter.convert_to_satoshis(20000) == 100_000_000
+
+    assert source.fetches == 1
+
+
+def test_converter_needs_an_exchange_rate() -> None:
+    with pytest.raises(TypeError):
+        ExchangeRateConverter()  # type: ignore[abstract]
+
+
+def test_async_converter_refuses_a_stale_rate() -> None:
+    clock: FakeClock = FakeClock()
+    converter = AsyncRefreshingCurrencyConverter(
+        _source=AsyncCountingExchangeRateSource(), _max_staleness=300, _clock=clock
+    )
+    assert anyio.run(converter.refresh)
+    assert converter.convert_all_to_usd([100_000_000, 50_000_000]) == [20000, 10000]
+
+    clock.now = 301
+
+    with pytest.raises(ExchangeRateUnavailableError):
+        converter.convert_to_satoshis(1)
+
+
+def test_async_refresher_task_publishes_rate() -> None:
+    converter = AsyncRefreshingCurrencyConverter(
+        _source=AsyncCountingExchangeRateSource(), _refresh_interval=0.01
+    )
+
+    async def scenario() -> float:
+        await converter.start()
+        try:
+            with anyio.fail_after(2):
+                while True:
+                    try:
+                        return converter.convert_to_usd(100_000_000)
+                    except ExchangeRateUnavailableError:
+                        await anyio.sleep(0.01)
+        finally:
+            await converter.stop()
+
+    assert anyio.run(scenario) == 20000
+
+
+def test_async_converter_has_a_rate_once_started() -> None:
+    source: AsyncCountingExchangeRateSource = AsyncCountingExchangeRateSource()
+    converter = AsyncRefreshingCurrencyConverter(_source=source, _refresh_interval=60)
+
+    async def scenario() -> float:
+        await converter.start()
+        try:
+            return converter.convert_to_usd(100_000_000)
+        finally:
+            await converter.stop()
+
+    assert anyio.run(scenario) == 20000
+    assert source.fetches == 1
+
+
+class SlowFirstExchangeRateSource(AsyncCountingExchangeRateSource):
+    async def fetch_exchange_rate(self) -> float:
+        if self.fetches == 0:
+            self.fetches += 1
+            await anyio.sleep(60)
+        return await super().fetch_exchange_rate()
+
+
+def test_async_converter_start_falls_back_to_the_refresher(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    converter = AsyncRefreshingCurrencyConverter(
+        _source=SlowFirstExchangeRateSource(),
+        _refresh_interval=0.01,
+        _initial_refresh_timeout=0.05,
+    )
+
+    async def scenario() -> float:
+        with anyio.fail_after(2):
+            await converter.start()
+        try:
+            with pytest.raises(ExchangeRateUnavailableError):
+                converter.convert_to_usd(100_000_000)
+            with anyio.fail_after(2):
+                while True:
+                    try:
+                        return converter.convert_to_usd(100_000_000)
+                    except ExchangeRateUnavailableError:
+                        await anyio.sleep(0.01)
+        finally:
+            await converter.stop()
+
+    assert anyio.run(scenario) == 20000
+    assert "timed out" in caplog.text